@@ -0,0 +1,127 @@
+"""
+Rows/sec of CSV → graph ingestion: the old iterrows loop vs the vectorized
+path in scripts/ingest.py (as driven by graph_builder via build_and_visualize.build_graph).
+
+    python benchmarks/bench_ingest.py --students 200000
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import networkx as nx
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from build_and_visualize import build_graph
+from graph_builder import load_csv
+
+
+# -----------------------------------------------------------
+# ✅ Synthetic inputs
+# -----------------------------------------------------------
+def make_inputs(folder, n_courses, n_trainers, n_students, seed=0):
+    rng = random.Random(seed)
+    words = ["Python", "Data", "Cloud", "Web", "Security", "Testing", "ML", "SQL", "React", "DevOps"]
+    courses = [f"Course {i} {rng.choice(words)}" for i in range(n_courses)]
+
+    cm = pd.DataFrame({
+        "course_name": courses,
+        "modules": [
+            ", ".join(f"{rng.choice(words)} Module {i}-{j}" for j in range(12))
+            for i in range(n_courses)
+        ],
+    })
+    tr = pd.DataFrame({
+        "trainer_name": [f"Trainer {i}" for i in range(n_trainers)],
+        "teaches": [", ".join(rng.sample(courses, min(3, n_courses))) for _ in range(n_trainers)],
+    })
+    ts = pd.DataFrame({
+        "trainer_name": tr["trainer_name"],
+        "skills": [", ".join(rng.sample(words, 3)) for _ in range(n_trainers)],
+    })
+    st = pd.DataFrame({
+        "student_name": [f"Student {i}" for i in range(n_students)],
+        "enrolled": [rng.choice(courses) for _ in range(n_students)],
+    })
+
+    paths = {}
+    for name, df in [("courses", cm), ("trainers", tr), ("students", st), ("skills", ts)]:
+        paths[name] = Path(folder) / f"{name}.csv"
+        df.to_csv(paths[name], index=False)
+    return paths, len(cm) + len(tr) + len(st) + len(ts)
+
+
+# -----------------------------------------------------------
+# ✅ Baseline: the previous row-at-a-time ingestion
+# -----------------------------------------------------------
+def build_graph_iterrows(courses_csv, trainers_csv, students_csv, trainer_skills_csv):
+    cm = load_csv(courses_csv, ["course_name", "modules"])
+    tr = load_csv(trainers_csv, ["trainer_name", "teaches"])
+    st = load_csv(students_csv, ["student_name", "enrolled"])
+    ts = load_csv(trainer_skills_csv, ["trainer_name", "skills"])
+    G = nx.DiGraph()
+
+    for _, row in cm.iterrows():
+        course = str(row["course_name"]).strip()
+        G.add_node(course, type="Course")
+        for mod in [m.strip() for m in str(row["modules"]).split(",") if m.strip()]:
+            G.add_node(mod, type="Module")
+            G.add_edge(course, mod, relation="has_module")
+
+    for _, row in tr.iterrows():
+        trainer = str(row["trainer_name"]).strip()
+        G.add_node(trainer, type="Trainer")
+        for course in [c.strip() for c in str(row["teaches"]).split(",") if c.strip()]:
+            if course not in G:
+                G.add_node(course, type="Course")
+            G.add_edge(trainer, course, relation="teaches")
+
+    for _, row in st.iterrows():
+        student, course = str(row["student_name"]).strip(), str(row["enrolled"]).strip()
+        if course not in G:
+            G.add_node(course, type="Course")
+        G.add_node(student, type="Student")
+        G.add_edge(student, course, relation="enrolled_in")
+
+    for _, row in ts.iterrows():
+        trainer = str(row["trainer_name"]).strip()
+        for skill in [s.strip() for s in str(row["skills"]).split(",") if s.strip()]:
+            G.add_node(skill, type="Skill")
+            G.add_edge(trainer, skill, relation="skilled_in")
+    return G
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    G = fn(*args)
+    return G, time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--courses", type=int, default=200)
+    ap.add_argument("--trainers", type=int, default=2000)
+    ap.add_argument("--students", type=int, default=100000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths, rows = make_inputs(tmp, args.courses, args.trainers, args.students)
+        csvs = (paths["courses"], paths["trainers"], paths["students"], paths["skills"])
+
+        G_old, t_old = timed(build_graph_iterrows, *csvs)
+        G_new, t_new = timed(build_graph, *csvs)
+
+    # build_graph also links skills → modules; compare only the shared part
+    new_edges = sum(1 for *_, d in G_new.edges(data=True) if d["relation"] != "relevant_to")
+    print(f"Rows: {rows:,}  nodes: {G_new.number_of_nodes():,}  edges: {new_edges:,} (+ relevant_to)")
+    print(f"iterrows:   {t_old:8.2f}s  {rows / t_old:12,.0f} rows/s")
+    print(f"vectorized: {t_new:8.2f}s  {rows / t_new:12,.0f} rows/s  ({t_old / t_new:.1f}x)")
+    assert G_old.number_of_edges() == new_edges
+
+
+if __name__ == "__main__":
+    main()
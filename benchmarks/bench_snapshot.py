@@ -0,0 +1,67 @@
+"""
+Save/load time and file size: pickle of the networkx DiGraph vs the binary
+snapshot format in scripts/graph_snapshot.py.
+
+    python benchmarks/bench_snapshot.py --students 200000
+"""
+import argparse
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from bench_ingest import make_inputs
+from build_and_visualize import build_graph
+from csr_graph import CSRGraph
+from graph_snapshot import load_snapshot, save_snapshot
+
+
+def timed(fn, *args, repeat=3):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def pickle_save(G, path):
+    with open(path, "wb") as f:
+        pickle.dump(G, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def pickle_load(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--courses", type=int, default=200)
+    ap.add_argument("--trainers", type=int, default=2000)
+    ap.add_argument("--students", type=int, default=100000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths, _ = make_inputs(tmp, args.courses, args.trainers, args.students)
+        G = build_graph(paths["courses"], paths["trainers"], paths["students"], paths["skills"])
+        C = CSRGraph.from_networkx(G)
+
+        pkl, kgs = Path(tmp) / "g.pkl", Path(tmp) / "g.kgs"
+        _, t_pkl_save = timed(pickle_save, G, pkl)
+        _, t_pkl_load = timed(pickle_load, pkl)
+        _, t_kgs_save = timed(save_snapshot, C, kgs)
+        loaded, t_kgs_load = timed(load_snapshot, kgs)
+        assert loaded.number_of_edges() == G.number_of_edges()
+
+        print(f"Graph: {G.number_of_nodes():,} nodes, {G.number_of_edges():,} edges")
+        print(f"{'':10}{'save':>10}{'load':>10}{'size':>12}")
+        print(f"{'pickle':10}{t_pkl_save:9.3f}s{t_pkl_load:9.3f}s{pkl.stat().st_size / 1e6:10.1f}MB")
+        print(f"{'snapshot':10}{t_kgs_save:9.3f}s{t_kgs_load:9.3f}s{kgs.stat().st_size / 1e6:10.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
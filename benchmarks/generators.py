@@ -0,0 +1,152 @@
+"""
+Synthetic, ICTAK-shaped inputs at any scale:
+
+    data/output/courses_and_modules.csv   course_name, modules
+    data/trainers.csv                     trainer_name, teaches
+    data/students.csv                     student_name, enrolled
+    data/output/trainer_skills.csv        trainer_name, skills
+
+Module text mixes the delimiters and numbering the brochure extractor
+produces ("Module 3 - ...", "1) ...", bullets, stray long lines) and
+mentions skills from the taxonomy, aliases included, so cleaning and
+skill linking do real work.
+
+    python benchmarks/generators.py --rows 100000 --out data/synthetic
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from skill_taxonomy import DEFAULT_TAXONOMY
+
+PROGRAMS = [
+    "Certified Specialist in", "Certified Professional in", "Essential Skill Program in",
+    "Industry Readiness Program in", "Certified Analyst in",
+]
+TRACKS = [
+    "Data Science", "Full Stack Development", "Cyber Security", "Cloud Computing",
+    "Software Testing", "Machine Learning", "DevOps", "Mobile App Development",
+]
+TOPICS = [
+    "Introduction to {}", "Fundamentals of {}", "Advanced {}", "{} Project Work",
+    "Hands-on {} Lab", "{} Best Practices", "Building Applications with {}", "{} for Beginners",
+]
+FIRST = ["Anu", "Arjun", "Devika", "Fathima", "Gokul", "Hari", "Jisha", "Manu", "Nimmy", "Rahul",
+         "Sneha", "Vishnu", "Aswathy", "Bibin", "Sreelakshmi", "Akhil", "Anjali", "Kiran"]
+LAST = ["K", "S", "Nair", "Menon", "Thomas", "Joseph", "P R", "V S", "Pillai", "George"]
+FILLER = ("This module covers the key concepts with practical sessions, assignments and a "
+          "capstone review delivered by industry experts over several weeks")
+
+SKILLS = [skill for skill, _ in DEFAULT_TAXONOMY]
+SPELLINGS = {skill: [skill] + aliases for skill, aliases in DEFAULT_TAXONOMY}
+
+# Default split of a row budget across the four files
+SHARES = {"courses": 0.002, "trainers": 0.02, "trainer_skills": 0.02, "students": 0.958}
+
+
+def _spell(rng, skill):
+    form = rng.choice(SPELLINGS[skill])
+    return rng.choice([form, form.title(), form.upper() if len(form) <= 4 else form])
+
+
+def _module_text(rng, n_modules):
+    parts = []
+    style = rng.randrange(4)
+    for j in range(1, n_modules + 1):
+        title = rng.choice(TOPICS).format(_spell(rng, rng.choice(SKILLS)))
+        if style == 0:
+            parts.append(f"Module {j} - {title}")
+        elif style == 1:
+            parts.append(f"{j}) {title}")
+        elif style == 2:
+            parts.append(f"• {title}")
+        else:
+            parts.append(title)
+    if rng.random() < 0.2:
+        parts.insert(rng.randrange(len(parts) + 1), FILLER)  # PDF artifact
+    sep = rng.choice([", ", "; ", "\n", ", "])
+    return sep.join(parts)
+
+
+def _person(rng, i):
+    return f"{rng.choice(FIRST)} {rng.choice(LAST)} {i}"
+
+
+def generate(n_courses, n_trainers, n_students, seed=0):
+    """Returns {name: DataFrame} for courses, trainers, trainer_skills, students."""
+    rng = random.Random(seed)
+
+    courses = [f"{rng.choice(PROGRAMS)} {rng.choice(TRACKS)} {i}" for i in range(n_courses)]
+    cm = pd.DataFrame({
+        "course_name": courses,
+        "modules": [_module_text(rng, rng.randint(6, 16)) for _ in courses],
+    })
+
+    trainers = [_person(rng, i) for i in range(n_trainers)]
+    tr = pd.DataFrame({
+        "trainer_name": trainers,
+        "teaches": [", ".join(rng.sample(courses, min(rng.randint(1, 3), n_courses))) for _ in trainers],
+    })
+    ts = pd.DataFrame({
+        "trainer_name": trainers,
+        "skills": [", ".join(_spell(rng, s) for s in rng.sample(SKILLS, rng.randint(2, 6)))
+                   for _ in trainers],
+    })
+
+    # Skewed enrolment: a few popular courses take most students
+    weights = [1 / (rank + 1) for rank in range(n_courses)]
+    st = pd.DataFrame({
+        "student_name": [_person(rng, i) for i in range(n_students)],
+        "enrolled": rng.choices(courses, weights=weights, k=n_students),
+    })
+    return {"courses": cm, "trainers": tr, "trainer_skills": ts, "students": st}
+
+
+def counts_for(rows):
+    """Splits a total row budget across the four files (at least a few of each)."""
+    return {
+        "n_courses": max(int(rows * SHARES["courses"]), 5),
+        "n_trainers": max(int(rows * SHARES["trainers"]), 5),
+        "n_students": max(int(rows * SHARES["students"]), 10),
+    }
+
+
+def write_dataset(folder, rows=None, seed=0, **counts):
+    """
+    Writes the four CSVs under `folder` using the repo's own layout and
+    returns {"courses", "trainers", "students", "trainer_skills"} → path.
+    Give either a total `rows` budget or explicit n_courses/n_trainers/n_students.
+    """
+    folder = Path(folder)
+    frames = generate(**(counts or counts_for(rows)), seed=seed)
+    paths = {
+        "courses": folder / "output" / "courses_and_modules.csv",
+        "trainers": folder / "trainers.csv",
+        "students": folder / "students.csv",
+        "trainer_skills": folder / "output" / "trainer_skills.csv",
+    }
+    for name, path in paths.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        frames[name].to_csv(path, index=False)
+    return paths
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=10_000, help="Total rows across all files")
+    ap.add_argument("--out", default="data/synthetic")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    paths = write_dataset(args.out, args.rows, args.seed)
+    for name, path in paths.items():
+        print(f"✅ {name:>14} → {path}")
+
+
+if __name__ == "__main__":
+    main()
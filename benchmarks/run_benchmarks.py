@@ -0,0 +1,272 @@
+"""
+Timed benchmarks of the main pipeline stages on synthetic data, written
+to a JSON report for regression tracking.
+
+    python benchmarks/run_benchmarks.py --rows 1000 10000 100000
+    python benchmarks/run_benchmarks.py --rows 1000000 --only build_graph filter_graph
+
+Each stage runs `--repeat` times per scale; the report keeps best / median
+seconds, rows per second and the size of what was produced. Rendering is
+timed on a keyword subgraph capped at --render-nodes, as in the app.
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from build_and_visualize import build_graph as build_pipeline_graph, keyword_subgraph, to_pyvis_html
+from clean_modules import clean_frame
+from csr_graph import CSRGraph
+from dashboard import build_graph, filter_graph, render_graph_html
+from generate_trainer_from_skills import generate_trainers_csv
+from generators import counts_for, write_dataset
+from graph_store import GraphStore
+from node_index import NodeIndex
+from path_index import PathIndex
+from recommend import Recommender
+
+KEYWORD = "python"
+ALL_TYPES = ["Course", "Module", "Trainer", "Student", "Skill"]
+
+
+# -----------------------------------------------------------
+# ✅ Timing
+# -----------------------------------------------------------
+def measure(fn, repeat):
+    times, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return result, {"best": min(times), "median": statistics.median(times), "runs": len(times)}
+
+
+def size_of(result):
+    if hasattr(result, "nnz"):
+        return {"shape": list(result.shape), "nnz": int(result.nnz)}
+    if hasattr(result, "number_of_nodes"):
+        return {"nodes": result.number_of_nodes(), "edges": result.number_of_edges()}
+    if isinstance(result, pd.DataFrame):
+        return {"rows": len(result)}
+    if isinstance(result, np.ndarray):
+        return {"shape": list(result.shape), "bytes": int(result.nbytes)}
+    if isinstance(result, (str, bytes)):
+        return {"bytes": len(result)}
+    return {}
+
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+# -----------------------------------------------------------
+# ✅ Stages
+# -----------------------------------------------------------
+def stages(paths, tmp, render_nodes):
+    """name → zero-arg callable; later stages reuse graphs built earlier."""
+    state = {}
+
+    def build_dashboard():
+        state["G"] = build_graph(paths["courses"], paths["students"], paths["trainer_skills"])
+        return state["G"]
+
+    def build_pipeline():
+        state["P"] = build_pipeline_graph(paths["courses"], paths["trainers"], paths["students"],
+                                          paths["trainer_skills"])
+        return state["P"]
+
+    def node_index():
+        state["index"] = NodeIndex(state["G"])
+        return state["index"]
+
+    def pipeline_index():
+        state["pindex"] = NodeIndex(state["P"])
+        return state["pindex"]
+
+    def to_csr():
+        state["C"] = CSRGraph.from_networkx(state["G"])
+        return state["C"]
+
+    def filter_nx():
+        return filter_graph(state["G"], KEYWORD, ALL_TYPES, 2, state["index"])[0]
+
+    def filter_csr():
+        return filter_graph(state["C"], KEYWORD, ALL_TYPES, 2, state["index"])[0]
+
+    def store_write():
+        state["S"] = GraphStore(Path(tmp) / "graph.sqlite").write(state["G"], "bench")
+        return state["S"]
+
+    def filter_store():
+        return state["S"].filter(KEYWORD, ALL_TYPES, 2)[0]
+
+    def keyword_sub():
+        return keyword_subgraph(state["P"], KEYWORD, state["pindex"], hops=2)
+
+    def filter_capped():
+        state["sub"], _ = filter_graph(state["G"], KEYWORD, ALL_TYPES, 2, state["index"],
+                                       max_nodes=render_nodes)
+        return state["sub"]
+
+    def render_html():
+        return render_graph_html(state["sub"], "Force-Directed", True, True)
+
+    def render_pyvis_file():
+        to_pyvis_html(state["sub"], str(Path(tmp) / "bench.html"))
+        return (Path(tmp) / "bench.html").read_bytes()
+
+    def clean_modules():
+        wide, long = clean_frame(pd.read_csv(paths["courses"]))
+        return long
+
+    def trainers_csv():
+        return generate_trainers_csv(paths["courses"], paths["trainer_skills"], Path(tmp) / "trainers_out.csv")
+
+    def recommend_build():
+        state["R"] = Recommender.from_csv(paths["courses"], paths["trainer_skills"])
+        return state["R"].scores
+
+    def recommend_score():
+        R = state["R"]
+        return Recommender(R.trainers, R.courses, R.skills, R.trainer_skills, R.course_skills).scores
+
+    def recommend_table():
+        return state["R"].table(top=5)
+
+    def path_index():
+        C = state["C"]
+        state["PI"] = PathIndex(C)
+        state["students"] = [n for n, d in C.nodes(data=True) if d["type"] == "Student"]
+        return state["PI"].levels
+
+    def cohort_distances():
+        PI = state["PI"]
+        return PI.distances(state["students"])
+
+    def cohort_paths():
+        PI = state["PI"]
+        course = PI.graph.names[next(iter(PI.rows))]
+        return pd.DataFrame({"path": list(PI.paths(state["students"], course).values())})
+
+    return {
+        "build_graph": build_dashboard,
+        "build_graph_pipeline": build_pipeline,
+        "node_index": node_index,
+        "node_index_pipeline": pipeline_index,
+        "csr_graph": to_csr,
+        "filter_graph": filter_nx,
+        "filter_graph_csr": filter_csr,
+        "graph_store_write": store_write,
+        "filter_graph_store": filter_store,
+        "keyword_subgraph": keyword_sub,
+        "filter_graph_capped": filter_capped,
+        "render_graph_html": render_html,
+        "to_pyvis_html": render_pyvis_file,
+        "clean_and_split_modules": clean_modules,
+        "generate_trainers_csv": trainers_csv,
+        "recommend_build": recommend_build,
+        "recommend_score": recommend_score,
+        "recommend_table": recommend_table,
+        "path_index": path_index,
+        "cohort_distances": cohort_distances,
+        "cohort_paths": cohort_paths,
+    }
+
+
+# stages whose inputs come from earlier stages
+DEPENDS = {
+    "node_index": ["build_graph"], "node_index_pipeline": ["build_graph_pipeline"],
+    "csr_graph": ["build_graph"],
+    "filter_graph": ["node_index"], "filter_graph_csr": ["csr_graph", "node_index"],
+    "filter_graph_capped": ["node_index"], "render_graph_html": ["filter_graph_capped"],
+    "to_pyvis_html": ["filter_graph_capped"], "keyword_subgraph": ["node_index_pipeline"],
+    "graph_store_write": ["build_graph"], "filter_graph_store": ["graph_store_write"],
+    "recommend_score": ["recommend_build"], "recommend_table": ["recommend_build"],
+    "path_index": ["csr_graph"], "cohort_distances": ["path_index"], "cohort_paths": ["path_index"],
+}
+
+
+def run_scale(rows, repeat, render_nodes, only, seed):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        counts = counts_for(rows)
+        paths = write_dataset(tmp, seed=seed, **counts)
+        input_rows = sum(len(pd.read_csv(p)) for p in paths.values())
+        todo = stages(paths, tmp, render_nodes)
+
+        wanted = set()
+        pending = list(only or todo)
+        while pending:
+            name = pending.pop()
+            if name not in wanted:
+                wanted.add(name)
+                pending.extend(DEPENDS.get(name, []))
+
+        for name, fn in todo.items():
+            if name not in wanted:
+                continue
+            with open(Path(tmp) / "stage.log", "w") as log:
+                out = sys.stdout
+                sys.stdout = log  # the scripts print progress lines
+                try:
+                    result, timing = measure(fn, repeat)
+                finally:
+                    sys.stdout = out
+            timing["rows_per_sec"] = input_rows / timing["best"] if timing["best"] else None
+            timing.update(size_of(result))
+            results[name] = timing
+            print(f"  {name:<24} {timing['best']:9.3f}s  (median {timing['median']:.3f}s)")
+    return {"rows": input_rows, **counts, "stages": results}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                    help="Total synthetic rows per run (10^3 - 10^6)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--render-nodes", type=int, default=2000,
+                    help="Node cap for the rendered subgraph")
+    ap.add_argument("--only", nargs="*", default=None, help="Run only these stages")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", default="benchmarks/results/report.json")
+    args = ap.parse_args()
+
+    report = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "render_nodes": args.render_nodes,
+        "runs": [],
+    }
+    for rows in args.rows:
+        print(f"▶ {rows:,} rows")
+        report["runs"].append(run_scale(rows, args.repeat, args.render_nodes, args.only, args.seed))
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"✅ Report → {out}")
+
+
+if __name__ == "__main__":
+    main()
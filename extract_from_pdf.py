@@ -6,6 +6,12 @@ import pandas as pd
 from pathlib import Path
 import warnings
 import logging
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+
+from extraction_cache import cached_pdf_text
+from ocr_triage import OCR_FAILED, TRIAGE_VERSION, read_page
 
 # --- Setup ---
 warnings.filterwarnings("ignore")
@@ -16,17 +22,21 @@ pytesseract.pytesseract.tesseract_cmd = r"C:\Program Files\Tesseract-OCR\tessera
 
 
 # ---------------- TEXT EXTRACTION ----------------
-def extract_text_from_pdf(pdf_path):
-    """Extracts text from both text-based and image-based PDFs"""
-    text_content = ""
+def _extract_text_uncached(pdf_path):
+    """(text, complete); incomplete (so not cached) when any page's OCR failed."""
+    text_content, complete = "", True
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
-            text = page.extract_text()
-            if not text:
-                img = page.to_image(resolution=200).original
-                text = pytesseract.image_to_string(img)
-            text_content += "\n" + (text or "")
-    return text_content
+            # text layer, else OCR of the inked regions only (blank/logo pages skipped)
+            text, info = read_page(page)
+            text_content += "\n" + text
+            complete = complete and info["decision"] != OCR_FAILED
+    return text_content, complete
+
+
+def extract_text_from_pdf(pdf_path):
+    """Extracts text from both text-based and image-based PDFs (cached by file content)"""
+    return cached_pdf_text(pdf_path, _extract_text_uncached, f"extract_from_pdf-triage{TRIAGE_VERSION}")
 
 
 # ---------------- COURSE EXTRACTION ----------------
@@ -1,299 +1,435 @@
 import streamlit as st
-import networkx as nx
-import pandas as pd
 from pathlib import Path
-from pyvis.network import Network
-import pickle
+import json
+import os
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+
+from csr_graph import CSRGraph
+from dashboard import build_graph as build_dashboard_graph, filter_graph, render_graph_html
+from graph_analytics import ANALYTICS_VERSION, TABLES as ANALYTICS_TABLES, GraphAnalytics
+from graph_builder import BUILDER_VERSION
+from graph_cache import GraphCache
+from graph_export import EXPORT_FORMATS, TABLE_FORMATS, ExportCache, available_formats
+from graph_snapshot import dump_snapshot
+from graph_layout import LAYOUT_VERSION, LAYOUTS, LayoutCache, layout_tables, stored_positions
+from graph_store import GraphStore
+from level_of_detail import level_of_detail
+from node_index import NodeIndex
+from profiling import Profiler, activate
+from recommend import Recommender
+from render_cache import RenderCache, graph_digest
+from skill_taxonomy import default_taxonomy
 
 
-# ---------------------------
-# SAFE CSV LOADER
-# ---------------------------
-def load_csv(path, expected_cols):
-    p = Path(path)
-    if not p.exists():
-        st.warning(f"Missing CSV: {p}")
-        return pd.DataFrame(columns=expected_cols)
+# -----------------------------------------------------------
+# ✅ BUILD / FILTER / RENDER live in scripts/dashboard.py (importable without
+#    Streamlit); missing CSVs are reported on the page
+# -----------------------------------------------------------
+def build_graph(courses_csv, students_csv, trainer_skills_csv):
+    return build_dashboard_graph(courses_csv, students_csv, trainer_skills_csv, warn=st.warning)
+
 
-    df = pd.read_csv(p)
-    for col in expected_cols:
-        if col not in df.columns:
-            df[col] = ""
-    return df.fillna("")
+def show_graph(html):
+    st.components.v1.html(html, height=760, scrolling=False)
 
 
 # -----------------------------------------------------------
-# ✅ BUILD KNOWLEDGE GRAPH (NO TRAINERS.CSV)
+# ✅ STREAMLIT APP
 # -----------------------------------------------------------
-def build_graph(courses_csv, students_csv, trainer_skills_csv):
-    cm = load_csv(courses_csv, ["course_name", "modules"])
-    st_df = load_csv(students_csv, ["student_name", "enrolled"])
-    ts = load_csv(trainer_skills_csv, ["trainer_name", "skills"])
+st.set_page_config(page_title="ICTAK Knowledge Graph", layout="wide")
+st.title("🌐 ICTAK Knowledge Graph")
 
-    G = nx.DiGraph()
 
-    # -------------------------
-    # COURSES + MODULES
-    # -------------------------
-    for _, r in cm.iterrows():
-        course = r["course_name"].strip()
-        modules = [m.strip() for m in str(r["modules"]).split(",") if m.strip()]
+# ✅ SIDEBAR WITH UNIQUE KEYS (IMPORTANT)
+with st.sidebar:
+    st.header("🔍 Search & Filters")
 
-        G.add_node(course, type="Course")
-        for m in modules:
-            G.add_node(m, type="Module")
-            G.add_edge(course, m, relation="has_module")
+    keyword = st.text_input("Search keyword:", "", key="search_keyword_input")
 
-    # -------------------------
-    # TRAINERS (+ SKILLS) + AUTO COURSE MAPPING
-    # -------------------------
-    for _, r in ts.iterrows():
-        trainer = r["trainer_name"].strip()
-        skills = [s.strip().lower() for s in str(r["skills"]).split(",") if s.strip()]
+    allowed_types = st.multiselect(
+        "Node Types to Display:",
+        ["Course", "Module", "Trainer", "Student", "Skill"],
+        default=["Course", "Module", "Trainer", "Skill"],
+        key="allowed_types_selector"
+    )
 
-        G.add_node(trainer, type="Trainer")
+    hops = st.slider("Expand Relationships (Hops)", 0, 3, 1, key="hops_slider")
 
-        # Add skill nodes
-        for sk in skills:
-            G.add_node(sk, type="Skill")
-            G.add_edge(trainer, sk, relation="skilled_in")
+    follow_relations = st.multiselect(
+        "Relations to Follow:",
+        ["has_module", "teaches", "skilled_in", "enrolled_in", "relevant_to"],
+        default=["has_module", "teaches", "skilled_in", "enrolled_in", "relevant_to"],
+        key="relations_selector"
+    )
 
-        # Auto map trainer → course if skill appears in modules
-        for _, c in cm.iterrows():
-            course_name = c["course_name"]
-            module_text = str(c["modules"]).lower()
+    max_nodes = st.number_input(
+        "Max Nodes", min_value=10, max_value=50000, value=2000, step=100,
+        key="max_nodes_input"
+    )
 
-            if any(sk in module_text for sk in skills):
-                G.add_edge(trainer, course_name, relation="teaches")
+    layout = st.selectbox(
+        "Layout:",
+        LAYOUTS,
+        key="layout_selector"
+    )
+    fixed_layout = st.checkbox(
+        "Precomputed Positions", True, key="fixed_layout_checkbox",
+        help="Lay the graph out on the server; untick for live browser physics. The full "
+             "graph is laid out once per version, so nodes keep their place as filters change."
+    )
 
-    # -------------------------
-    # STUDENTS + ENROLLMENT
-    # -------------------------
-    for _, r in st_df.iterrows():
-        student = r["student_name"].strip()
-        course = r["enrolled"].strip()
+    show_labels = st.checkbox("Show Labels", True, key="labels_checkbox")
+    glow = st.checkbox("Glow Effects", True, key="glow_checkbox")
 
-        if not student:
-            continue
+    with st.expander("🧩 Render Budget"):
+        node_budget = st.number_input(
+            "Max rendered nodes", min_value=50, max_value=5000, value=400, step=50,
+            key="node_budget_input"
+        )
+        edge_budget = st.number_input(
+            "Max rendered edges", min_value=50, max_value=20000, value=1500, step=100,
+            key="edge_budget_input"
+        )
 
-        G.add_node(student, type="Student")
 
-        if course:
-            G.add_node(course, type="Course")
-            G.add_edge(student, course, relation="enrolled_in")
+# ✅ Stage timings for this rerun (shown in the 🩺 Debug panel); downloads run
+#    after the page is drawn, so they are timed into a per-session profiler
+profiler = activate(Profiler(cprofile=st.session_state.get("cprofile_checkbox", False)))
+download_profiler = st.session_state.setdefault("download_profiler", Profiler())
 
-    return G
 
+# ✅ Build graph (uses ONLY courses, students, trainer_skills)
+#    Shared across reruns and sessions; rebuilt only when a CSV changes.
+#    By default the graph lives in an SQLite store and each rerun loads only
+#    the filtered slice, so a restart with unchanged inputs starts at once
+#    and the graph may exceed memory. KG_GRAPH_BACKEND=csr keeps the whole
+#    graph in the compact array form, KG_GRAPH_BACKEND=networkx as a DiGraph.
+GRAPH_BACKEND = os.environ.get("KG_GRAPH_BACKEND", "sqlite")
 
-# -----------------------------------------------------------
-# ✅ ADVANCED FILTERING
-# -----------------------------------------------------------
-def filter_graph(G, keyword, allowed_types, hops):
-    kw = keyword.lower().strip()
 
-    # Filter by node type
-    nodes = [n for n, d in G.nodes(data=True) if d.get("type") in allowed_types]
+def build_csr_graph(courses_csv, students_csv, trainer_skills_csv):
+    return CSRGraph.from_networkx(build_graph(courses_csv, students_csv, trainer_skills_csv))
 
-    # Further filter by keyword
-    if kw:
-        nodes = [n for n in nodes if kw in n.lower()]
 
-    if not nodes:
-        return nx.DiGraph()
+GRAPH_SNAPSHOT = "data/cache/kg_app_graph.kgs"
+GRAPH_STORE = "data/cache/kg_app_graph.sqlite"
 
-    keep = set(nodes)
 
-    # Expand by hop distance
-    for _ in range(hops):
-        expanded = set()
-        for n in keep:
-            expanded.update(G.successors(n))
-            expanded.update(G.predecessors(n))
-        keep.update(expanded)
+def build_store_tables(G):
+    return {**GraphAnalytics.compute(G).tables(), **layout_tables(G)}
 
-    return G.subgraph(keep).copy()
 
+@st.cache_resource
+def get_graph_cache():
+    # skill links depend on the taxonomy (KG_SKILL_TAXONOMY), so a changed
+    # vocabulary gives a new graph version like a changed CSV does
+    salt = (BUILDER_VERSION, default_taxonomy().digest())
+    if GRAPH_BACKEND == "sqlite":
+        # the analytics tables and full-graph positions are built and stored
+        # along with the graph
+        store = GraphStore(GRAPH_STORE, derived=build_store_tables)
+        return GraphCache(build_graph, salt=salt + (ANALYTICS_VERSION, LAYOUT_VERSION), store=store)
+    if GRAPH_BACKEND == "csr":
+        return GraphCache(build_csr_graph, snapshot_path=GRAPH_SNAPSHOT, salt=salt)
+    return GraphCache(build_graph, salt=salt)
 
-# -----------------------------------------------------------
-# ✅ CLEAN VISUALIZATION
-# -----------------------------------------------------------
-def show_graph(G, layout, show_labels, glow):
-
-    net = Network(
-        height="750px",
-        width="100%",
-        bgcolor="#0d1117",
-        font_color="white",
-        directed=True,
+
+graph_cache = get_graph_cache()
+hits_before = graph_cache.hits
+with profiler.span("load_graph") as facts:
+    G = graph_cache.get(
+        "data/output/courses_and_modules.csv",
+        "data/students.csv",
+        "data/output/trainer_skills.csv",
     )
+    facts["cached"] = graph_cache.hits > hits_before
+profiler.count("graph_cache_hits" if graph_cache.hits > hits_before else "graph_cache_misses")
 
-    colors = {
-        "Course": "#FFA726",
-        "Module": "#42A5F5",
-        "Trainer": "#66BB6A",
-        "Student": "#FF7043",
-        "Skill": "#AB47BC",
-        "Unknown": "#BDBDBD",
-    }
-
-    # ✅ Add nodes
-    for n, attrs in G.nodes(data=True):
-        t = attrs.get("type", "Unknown")
-
-        net.add_node(
-            n,
-            label=n if show_labels else "",
-            color=colors.get(t, "#CCCCCC"),
-            shape="dot",
-            size=18,
-            borderWidth=3 if glow else 1,
-            shadow=glow,
-            title=f"{n} ({t})"
-        )
+# ✅ Keyword index, built once per graph version (the store has its own);
+#    only the current version and the one before it are kept
+@st.cache_resource(max_entries=2)
+def get_node_index(version, _G):
+    return None if isinstance(_G, GraphStore) else NodeIndex(_G)
 
-    # ✅ Add edges
-    for u, v, attrs in G.edges(data=True):
-        rel = attrs.get("relation", "")
-        net.add_edge(u, v, arrows="to", label=rel if show_labels else "")
-
-    # ✅ Layout settings (JSON safe)
-    if layout == "Hierarchical":
-        options = r"""
-        {
-          "layout": {
-            "hierarchical": {
-              "enabled": true,
-              "direction": "LR",
-              "levelSeparation": 200,
-              "nodeSpacing": 200
-            }
-          },
-          "physics": { "enabled": false }
-        }
-        """
-    else:
-        options = r"""
-        {
-          "physics": {
-            "enabled": true,
-            "barnesHut": {
-              "gravitationalConstant": -20000,
-              "centralGravity": 0.15,
-              "springLength": 150,
-              "springConstant": 0.05,
-              "damping": 0.08,
-              "avoidOverlap": 1
-            }
-          }
-        }
-        """
-
-    net.set_options(options)
-
-    net.write_html("kg_final_ui.html")
-    with open("kg_final_ui.html", "r", encoding="utf-8") as f:
-        st.components.v1.html(f.read(), height=760, scrolling=False)
 
+with profiler.span("node_index"):
+    node_index = get_node_index(graph_cache.version, G)
 
-# -----------------------------------------------------------
-# ✅ STREAMLIT APP
-# -----------------------------------------------------------
-st.set_page_config(page_title="ICTAK Knowledge Graph", layout="wide")
-st.title("🌐 ICTAK Knowledge Graph")
+# ✅ Node positions, computed once per graph version and layout; filtered
+#    views reuse them, so nodes stay put as the filters change (the store
+#    holds them in its layout tables, looked up per slice in render_page)
+@st.cache_resource
+def get_layout_cache():
+    return LayoutCache("data/cache/layouts")
 
 
-# ✅ SIDEBAR WITH UNIQUE KEYS (IMPORTANT)
-with st.sidebar:
-    st.header("🔍 Search & Filters")
+positions = None
+if fixed_layout and not isinstance(G, GraphStore):
+    with st.spinner("Computing layout..."), profiler.span("layout"):
+        positions = get_layout_cache().get(G, graph_cache.version, layout)
 
-    keyword = st.text_input("Search keyword:", "", key="search_keyword_input")
+with st.sidebar:
+    with st.expander("⚙️ Graph Cache"):
+        cache_stats = graph_cache.stats()
+        st.caption(
+            f"Version: {cache_stats['version']} · "
+            f"Hits: {cache_stats['hits']} · Misses: {cache_stats['misses']}"
+        )
 
-    allowed_types = st.multiselect(
-        "Node Types to Display:",
-        ["Course", "Module", "Trainer", "Student", "Skill"],
-        default=["Course", "Module", "Trainer", "Skill"],
-        key="allowed_types_selector"
+# ✅ Filter graph
+with profiler.span("filter_graph") as facts:
+    subG, filter_truncated = filter_graph(G, keyword, allowed_types, hops, node_index,
+                                          relations=follow_relations, max_nodes=int(max_nodes))
+    facts.update(nodes=subG.number_of_nodes(), edges=subG.number_of_edges(), truncated=filter_truncated)
+if filter_truncated:
+    st.caption(
+        f"Showing {subG.number_of_nodes()} of more matching nodes "
+        f"(Max Nodes reached; raise it or narrow the filters to see the rest)."
     )
 
-    hops = st.slider("Expand Relationships (Hops)", 0, 3, 1, key="hops_slider")
+# ✅ Level of detail: fold students/modules into per-course groups over budget
+with profiler.span("level_of_detail"):
+    lod = level_of_detail(
+        subG, int(node_budget), int(edge_budget),
+        expanded=st.session_state.get("expand_groups_selector", []),
+    )
 
-    layout = st.selectbox(
-        "Layout:",
-        ["Force-Directed", "Hierarchical"],
-        key="layout_selector"
+if lod.groups or st.session_state.get("expand_groups_selector"):
+    with st.sidebar:
+        st.multiselect(
+            "Expand Groups:",
+            sorted(set(lod.groups) | set(st.session_state.get("expand_groups_selector", []))),
+            key="expand_groups_selector"
+        )
+if lod.truncated:
+    st.caption(
+        f"Showing {lod.graph.number_of_nodes()} of {subG.number_of_nodes()} nodes "
+        f"(render budget reached; narrow the filters to see more)."
     )
 
-    show_labels = st.checkbox("Show Labels", True, key="labels_checkbox")
-    glow = st.checkbox("Glow Effects", True, key="glow_checkbox")
+# ✅ Display (rendered pages are shared across sessions, keyed by content)
+@st.cache_resource
+def get_html_cache():
+    return RenderCache(maxsize=32)
 
 
-# ✅ Build graph (uses ONLY courses, students, trainer_skills)
-G = build_graph(
-    "data/output/courses_and_modules.csv",
-    "data/students.csv",
-    "data/output/trainer_skills.csv",
+rendered = []
+
+
+def render_page():
+    rendered.append(True)
+    pos = positions
+    if fixed_layout and isinstance(G, GraphStore):
+        # grouped nodes are placed next to their owner
+        names = set(lod.graph) | {o for _, o in lod.graph.nodes(data="owner") if o}
+        pos = stored_positions(G, layout, names)
+    return render_graph_html(lod.graph, layout, show_labels, glow, pos)
+
+
+with profiler.span("show_graph") as facts:
+    html_key = (graph_digest(lod.graph), layout, show_labels, glow,
+                graph_cache.version if fixed_layout else None)
+    graph_html = get_html_cache().get(html_key, render_page)
+    facts["cached"] = not rendered
+    show_graph(graph_html)
+profiler.count("render_cache_misses" if rendered else "render_cache_hits")
+
+
+# -----------------------------------------------------------
+# ✅ ANALYTICS (materialized once per graph version; the panel only looks up)
+# -----------------------------------------------------------
+@st.cache_resource(max_entries=2)
+def get_analytics(version, _G):
+    if isinstance(_G, GraphStore):
+        tables = {}
+        for name in ANALYTICS_TABLES:
+            table = _G.read_table(name)
+            if table is not None:
+                tables[name] = table
+        return GraphAnalytics.from_tables(tables)
+    return GraphAnalytics.compute(_G)
+
+
+with profiler.span("analytics"):
+    analytics = get_analytics(graph_cache.version, G)
+    analytics_tables = analytics.tables()
+
+st.subheader("📊 Course & Trainer Analytics")
+coverage_tab, load_tab, gaps_tab, recommend_tab = st.tabs(
+    ["Course Coverage", "Trainer Load", "Skill Gaps", "Recommendations"]
 )
 
-# ✅ Filter graph
-subG = filter_graph(G, keyword, allowed_types, hops)
+with coverage_tab:
+    course = st.selectbox("Course:", sorted(analytics.courses), key="analytics_course_selector")
+    row = analytics.course(course) if course else None
+    if row:
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric("Modules", row["modules"])
+        c2.metric("Trainers", row["trainers"])
+        c3.metric("Students", row["students"])
+        c4.metric("Covered Modules", f"{row['covered_modules']} / {row['modules']}")
+
+        st.caption("Trainers who teach this course or are skilled for its modules")
+        st.dataframe(analytics.trainers_for(course), hide_index=True)
+
+        gaps = analytics.gaps(course)
+        if gaps:
+            st.caption(f"⚠️ {len(gaps)} module(s) without a skilled trainer")
+            st.dataframe({"module": gaps}, hide_index=True)
+
+with load_tab:
+    st.dataframe(
+        analytics_tables["trainer_load"].sort_values(["students", "courses"], ascending=False),
+        hide_index=True,
+    )
+
+with gaps_tab:
+    module_gaps = analytics_tables["module_coverage"]
+    st.caption("Modules no trainer is skilled for")
+    st.dataframe(module_gaps[module_gaps["trainers"] == 0], hide_index=True)
+    st.caption("Skill supply (trainers) against demand (modules, courses)")
+    st.dataframe(
+        analytics_tables["skill_supply"].sort_values(["modules", "trainers"], ascending=[False, True]),
+        hide_index=True,
+    )
 
-# ✅ Display
-show_graph(subG, layout, show_labels, glow)
 
 
+# ✅ Ranked trainer ↔ course matches, scored once per graph version
+@st.cache_resource(max_entries=2)
+def get_recommender(version):
+    return Recommender.from_csv("data/output/courses_and_modules.csv", "data/output/trainer_skills.csv")
+
+
+with recommend_tab:
+    with profiler.span("recommend"):
+        recommender = get_recommender(graph_cache.version)
+    mode = st.radio("Rank:", ["Trainers for a course", "Courses for a trainer"],
+                    horizontal=True, key="recommend_mode")
+    top = st.slider("Show top:", 1, 50, 10, key="recommend_top")
+    if mode == "Trainers for a course":
+        course = st.selectbox("Course:", recommender.courses, key="recommend_course_selector")
+        ranked = recommender.trainers_for(course, top) if course else None
+    else:
+        trainer = st.selectbox("Trainer:", sorted(set(recommender.trainers)), key="recommend_trainer_selector")
+        ranked = recommender.courses_for(trainer, top) if trainer else None
+    if ranked is not None and not ranked.empty:
+        st.caption("Score: tf-idf cosine of trainer skills against the skills the course modules mention")
+        st.dataframe(ranked, hide_index=True)
+    elif ranked is not None:
+        st.info("No shared skills found.")
+
 # -----------------------------------------------------------
 # ✅ DOWNLOAD SECTION
 # -----------------------------------------------------------
 
 st.subheader("📥 Download Filtered Graph Data")
 
-# Prepare CSVs
-nodes_df = pd.DataFrame([
-    {"node": n, "type": d.get("type", "Unknown")}
-    for n, d in subG.nodes(data=True)
-])
+# Nothing below is serialized until a button is clicked: each button gets a
+# callable, and the file is written once per (subgraph content, format).
+# The callables are timed into the session's download profiler.
+@st.cache_resource
+def get_export_cache():
+    return ExportCache("data/cache/exports")
 
-edges_df = pd.DataFrame([
-    {"source": u, "target": v, "relation": d.get("relation", "")}
-    for u, v, d in subG.edges(data=True)
-])
 
-# Download nodes
-st.download_button(
-    "📄 Download Nodes (CSV)",
-    nodes_df.to_csv(index=False),
-    "nodes.csv",
-    "text/csv",
-    key="download_nodes"
-)
+export_format = st.selectbox("Export format:", available_formats(), key="export_format_selector")
+ext, mime = EXPORT_FORMATS[export_format]
+
+
+def export_data(part=None):
+    # keyed on the subgraph's content, not the filters: under a Max Nodes cut
+    # the same filters keep different nodes on another backend or process
+    return download_profiler.wrap(
+        f"export/{part or 'graph'}",
+        lambda: get_export_cache().get(subG, graph_digest(subG)[:16], export_format, part),
+    )
+
+
+if export_format in TABLE_FORMATS:
+    # Download nodes
+    st.download_button(
+        f"📄 Download Nodes ({export_format})",
+        export_data("nodes"),
+        f"nodes.{ext}",
+        mime,
+        key="download_nodes"
+    )
+
+    # Download edges
+    st.download_button(
+        f"🔗 Download Edges ({export_format})",
+        export_data("edges"),
+        f"edges.{ext}",
+        mime,
+        key="download_edges"
+    )
+else:
+    st.download_button(
+        f"🕸️ Download Graph ({export_format})",
+        export_data(),
+        f"graph.{ext}",
+        mime,
+        key="download_graph_export"
+    )
+
+# Download full graph as a binary snapshot (serialized once per graph version);
+# with the SQLite backend, a copy of the database itself
+@st.cache_resource(max_entries=2)
+def get_snapshot_bytes(version, _G):
+    return _G.dump_bytes() if isinstance(_G, GraphStore) else dump_snapshot(_G)
 
-# Download edges
-st.download_button(
-    "🔗 Download Edges (CSV)",
-    edges_df.to_csv(index=False),
-    "edges.csv",
-    "text/csv",
-    key="download_edges"
-)
 
-# Download full graph as pickle
-pickle_bytes = pickle.dumps(G)
 st.download_button(
-    "🧠 Download Full Graph (Pickle)",
-    pickle_bytes,
-    "full_graph.pkl",
+    "🧠 Download Full Graph (Snapshot)",
+    download_profiler.wrap("export/snapshot", lambda: get_snapshot_bytes(graph_cache.version, G)),
+    "full_graph.sqlite" if isinstance(G, GraphStore) else "full_graph.kgs",
     "application/octet-stream",
-    key="download_pickle"
+    key="download_snapshot"
 )
 
-# Download interactive HTML
-with open("kg_final_ui.html", "rb") as f:
-    html_data = f.read()
-
+# Download interactive HTML (the page already rendered above, self-contained)
 st.download_button(
     "🌐 Download Interactive Graph (HTML)",
-    html_data,
+    graph_html,
     "interactive_graph.html",
     "text/html",
     key="download_html"
 )
+
+
+# -----------------------------------------------------------
+# ✅ DEBUG PANEL (stage timings, counters, cProfile)
+# -----------------------------------------------------------
+with st.sidebar:
+    with st.expander("🩺 Debug: Stage Timings"):
+        st.checkbox("cProfile each stage", False, key="cprofile_checkbox",
+                    help="Applies from the next rerun; slows the page down noticeably.")
+
+        report = profiler.report()
+        report["downloads"] = download_profiler.report()
+        rows = [
+            {"stage": name, "calls": t["calls"], "ms": round(t["seconds"] * 1000, 1),
+             "max ms": round(t["max"] * 1000, 1)}
+            for part in (report, report["downloads"])
+            for name, t in part["stages"].items()
+        ]
+        st.dataframe(rows, hide_index=True)
+
+        counters = {**report["downloads"]["counters"], **report["counters"]}
+        if counters:
+            st.caption(" · ".join(f"{k}: {v}" for k, v in sorted(counters.items())))
+
+        for name, text in report["profiles"].items():
+            st.caption(f"cProfile: {name}")
+            st.code(text, language=None)
+
+        st.download_button(
+            "⏱️ Download Profile (JSON)",
+            json.dumps(report, indent=2, default=str),
+            "profile.json",
+            "application/json",
+            key="download_profile"
+        )
@@ -1,148 +1,42 @@
 import argparse
-import pandas as pd
-import networkx as nx
 from pathlib import Path
 from pyvis.network import Network
 import pickle
 
-
-# -----------------------------------------------------------
-# ✅ Load CSV safely (handles missing columns / missing files)
-# -----------------------------------------------------------
-def load_csv(path, expected_cols):
-    p = Path(path)
-    if not p.exists():
-        print(f"⚠️ Missing file: {p}")
-        return pd.DataFrame(columns=expected_cols)
-
-    df = pd.read_csv(p)
-
-    # Add any missing columns
-    for col in expected_cols:
-        if col not in df.columns:
-            df[col] = ""
-
-    return df[expected_cols].fillna("")
+from expansion import expand_neighborhood
+from graph_builder import PIPELINE, build_graph_from_csv
+from graph_snapshot import save_snapshot
+from node_index import NodeIndex, load_summaries
+from profiling import add_profile_args, cli_profiler, span
 
 
 # -----------------------------------------------------------
-# ✅ Build the Knowledge Graph
+# ✅ Build the Knowledge Graph (shared builder, batch pipeline spec)
 # -----------------------------------------------------------
 def build_graph(courses_csv, trainers_csv, students_csv, trainer_skills_csv=None):
-    cm = load_csv(courses_csv, ["course_name", "modules"])
-    tr = load_csv(trainers_csv, ["trainer_name", "teaches"])
-    st = load_csv(students_csv, ["student_name", "enrolled"])
-
+    paths = {"courses": courses_csv, "trainers": trainers_csv, "students": students_csv}
     if trainer_skills_csv:
-        ts = load_csv(trainer_skills_csv, ["trainer_name", "skills"])
-    else:
-        ts = pd.DataFrame(columns=["trainer_name", "skills"])
-
-    G = nx.DiGraph()
-
-    # -------------------------------------------------------
-    # ✅ Add Courses & Modules
-    # -------------------------------------------------------
-    for _, row in cm.iterrows():
-        course = str(row["course_name"]).strip()
-        if not course:
-            continue
-
-        G.add_node(course, type="Course")
-
-        modules = [m.strip() for m in str(row["modules"]).split(",") if m.strip()]
-
-        for mod in modules:
-            G.add_node(mod, type="Module")
-            G.add_edge(course, mod, relation="has_module")
-
-    # -------------------------------------------------------
-    # ✅ Add Trainers & "teaches"
-    # -------------------------------------------------------
-    for _, row in tr.iterrows():
-        trainer = str(row["trainer_name"]).strip()
-        if not trainer:
-            continue
-
-        G.add_node(trainer, type="Trainer")
-
-        teaches_list = [c.strip() for c in str(row["teaches"]).split(",") if c.strip()]
-
-        for course in teaches_list:
-            if course not in G:
-                G.add_node(course, type="Course")
-            G.add_edge(trainer, course, relation="teaches")
-
-    # -------------------------------------------------------
-    # ✅ Add Students & "enrolled_in"
-    # -------------------------------------------------------
-    for _, row in st.iterrows():
-        student = str(row["student_name"]).strip()
-        course = str(row["enrolled"]).strip()
-
-        if not student or not course:
-            continue
-
-        if course not in G:
-            G.add_node(course, type="Course")
-
-        G.add_node(student, type="Student")
-        G.add_edge(student, course, relation="enrolled_in")
-
-    # -------------------------------------------------------
-    # ✅ Add Trainer Skills (Optional)
-    # -------------------------------------------------------
-    if not ts.empty:
-
-        for _, row in ts.iterrows():
-            trainer = str(row["trainer_name"]).strip()
-            skills = [s.strip() for s in str(row["skills"]).split(",") if s.strip()]
-
-            if trainer and trainer not in G:
-                G.add_node(trainer, type="Trainer")
-
-            for skill in skills:
-                G.add_node(skill, type="Skill")
-                G.add_edge(trainer, skill, relation="skilled_in")
-
-        # ✅ Auto-link Skills ↔ Modules
-        skill_nodes = [n for n, d in G.nodes(data=True) if d.get("type") == "Skill"]
-
-        for module, attrs in G.nodes(data=True):
-            if attrs.get("type") != "Module":
-                continue
-
-            mod_text = module.lower()
-
-            for skill in skill_nodes:
-                if skill.lower() in mod_text:
-                    G.add_edge(skill, module, relation="relevant_to")
-
-    return G
+        paths["trainer_skills"] = trainer_skills_csv
+    return build_graph_from_csv(paths, PIPELINE)
 
 
 # -----------------------------------------------------------
 # ✅ Keyword-Based Subgraph Filtering
 # -----------------------------------------------------------
-def keyword_subgraph(G, keyword):
+def keyword_subgraph(G, keyword, index=None, hops=2, max_nodes=None):
     kw = keyword.lower().strip()
     if not kw:
-        return G.copy()
-
-    # Seed nodes that match keyword
-    seeds = [n for n in G.nodes if kw in n.lower()]
-    keep = set(seeds)
-
-    # Expand neighborhood
-    for n in seeds:
-        neighbors = list(G.successors(n)) + list(G.predecessors(n))
-        keep.update(neighbors)
+        return G
 
-        for nb in neighbors:
-            keep.update(list(G.successors(nb)))
-            keep.update(list(G.predecessors(nb)))
+    # Seed nodes that match keyword (inverted index when one is given)
+    if index is not None:
+        seeds = list(index.search(kw))
+    else:
+        seeds = [n for n in G.nodes if kw in n.lower()]
 
-    return G.subgraph(keep).copy()
+    # Expand neighborhood (bounded BFS; read-only subgraph view)
+    exp = expand_neighborhood(G, seeds, hops, max_nodes=max_nodes)
+    return G.subgraph(exp.nodes)
 
 
 # -----------------------------------------------------------
@@ -190,23 +84,46 @@ def main():
     ap.add_argument("--students", default="data/students.csv")
     ap.add_argument("--skills", default="data/output/trainer_skills.csv")
     ap.add_argument("--keyword", default="")
+    ap.add_argument("--hops", type=int, default=2)
+    ap.add_argument("--max-nodes", type=int, default=None,
+                    help="Stop expanding the keyword subgraph at this many nodes")
+    ap.add_argument("--metadata", default="data/output/kg_metadata.json",
+                    help="Course summaries also searched by --keyword")
     ap.add_argument("--html", default="data/output/kg_result.html")
-    ap.add_argument("--pickle", default="data/output/ictak_graph.pkl")
+    ap.add_argument("--snapshot", default="data/output/ictak_graph.kgs")
+    ap.add_argument("--pickle", default="", help="Also write a networkx pickle here")
+    add_profile_args(ap)
     args = ap.parse_args()
 
+    with cli_profiler(args):
+        run(args)
+
+
+def run(args):
     # ✅ Build the KG
     G = build_graph(args.courses, args.trainers, args.students, args.skills)
 
-    # ✅ Save pickle safely (NetworkX 3.x compatible)
-    with open(args.pickle, "wb") as f:
-        pickle.dump(G, f)
-    print(f"✅ Full graph saved → {args.pickle}")
+    # ✅ Save binary snapshot (load with graph_snapshot.load_snapshot)
+    with span("save_snapshot"):
+        save_snapshot(G, args.snapshot)
+    print(f"✅ Full graph saved → {args.snapshot}")
+
+    # ✅ Legacy pickle, only when asked for
+    if args.pickle:
+        with open(args.pickle, "wb") as f:
+            pickle.dump(G, f)
+        print(f"✅ Full graph pickled → {args.pickle}")
 
     # ✅ Filter subgraph by keyword
-    sub = keyword_subgraph(G, args.keyword)
+    with span("node_index"):
+        index = NodeIndex(G, summaries=load_summaries(args.metadata)) if args.keyword else None
+    with span("keyword_subgraph") as facts:
+        sub = keyword_subgraph(G, args.keyword, index, args.hops, args.max_nodes)
+        facts.update(nodes=sub.number_of_nodes(), edges=sub.number_of_edges())
 
     # ✅ Save HTML visualization
-    html = to_pyvis_html(sub, args.html)
+    with span("to_pyvis_html"):
+        html = to_pyvis_html(sub, args.html)
     print(f"✅ Visualization saved → {html}")
     print(f"✅ Subgraph nodes: {len(sub.nodes())}, edges: {len(sub.edges())}")
 
@@ -1,70 +1,182 @@
-import pandas as pd
+import argparse
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-INPUT_FILE = "data/output/courses_and_modules.csv"
-OUTPUT_FILE = "data/output/courses_and_modules_cleaned.csv"
-
-
-def clean_and_split_modules(mod_text):
-    if not isinstance(mod_text, str):
-        return []
-
-    text = mod_text.strip()
-
-    # Replace long paragraphs with line breaks
-    text = re.sub(r"[;•\-\n]+", "\n", text)
-
-    # Split by common delimiters
-    parts = re.split(r"[,\n]+", text)
-
-    cleaned = []
-
-    for p in parts:
-        p = p.strip()
-
-        # Skip empty or useless lines
-        if not p:
-            continue
+import numpy as np
+import pandas as pd
 
-        # Skip extremely long paragraphs (PDF artifacts)
-        if len(p) > 80:
-            continue
+try:
+    import pyarrow as pa
+except ImportError:  # pandas falls back to Python string ops
+    pa = None
 
-        # Remove numbering
-        p = re.sub(r"^\d+[\)\.\- ]+", "", p)
-        p = re.sub(r"^Module\s*\d+[:\- ]*", "", p, flags=re.I)
+from ingest import clean_column
+from profiling import add_profile_args, cli_profiler, count, span
 
-        # Remove leftover symbols
-        p = p.replace("•", "").strip()
+INPUT_FILE = "data/output/courses_and_modules.csv"
+OUTPUT_FILE = "data/output/courses_and_modules_cleaned.csv"
+LONG_FILE = "data/output/course_modules_long.csv"
+
+MAX_MODULE_LEN = 80     # longer fragments are PDF artifacts (paragraphs), not titles
+
+# Compiled once; applied to whole columns with pandas string ops. With
+# pyarrow the column is Arrow-backed and the same patterns run in C (RE2),
+# so flags are inline and only the pattern text is passed there.
+BREAKS = re.compile(r"[;•\-\n]+")             # paragraph / bullet / dash runs → line break
+SPLIT = re.compile(r"[,\n]+")                 # module delimiters
+NUMBERING = re.compile(r"^\d+[\)\.\- ]+")     # "1) ", "2. ", "3 - "
+MODULE_PREFIX = re.compile(r"(?i)^Module\s*\d+[:\- ]*")
+
+# RE2 reads \s and \d as ASCII only; these are the sets Python's re uses
+# ("Module\xa01", "１. Python"), spelled out for it. Used outside [...] only.
+RE2_CLASSES = {r"\s": r"[\t-\r\x1c-\x20\x85\p{Z}]", r"\d": r"\p{Nd}"}
+
+
+def _re2(pattern):
+    text = pattern.pattern
+    for short, full in RE2_CLASSES.items():
+        text = text.replace(short, full)
+    return text
+
+
+# -----------------------------------------------------------
+# ✅ Vectorized cleaning
+# -----------------------------------------------------------
+def _strings(values):
+    """Text column with non-strings as missing, Arrow-backed when pyarrow is installed."""
+    s = pd.Series(values, dtype=object)
+    s = s.where(s.map(type) == str)
+    return s.astype(pd.ArrowDtype(pa.string())) if pa is not None else s
+
+
+def split_modules(modules):
+    """
+    Module text column → one cleaned module per row, indexed by the row it
+    came from (rows without modules are absent), in the original order.
+    """
+    s = _strings(modules)
+    pat = _re2 if pa is not None else (lambda p: p)
+
+    parts = (
+        s.str.strip()
+        .str.replace(pat(BREAKS), "\n", regex=True)
+        .str.split(pat(SPLIT), regex=True)
+        .explode()
+        .str.strip()
+    )
+    # skip empty fragments and long paragraphs before stripping numbering
+    parts = parts[parts.notna() & (parts != "") & (parts.str.len() <= MAX_MODULE_LEN)]
+    parts = (
+        parts.str.replace(pat(NUMBERING), "", regex=True)
+        .str.replace(pat(MODULE_PREFIX), "", regex=True)
+        .str.replace("•", "", regex=False)
+        .str.strip()
+    )
+    return parts[parts.str.len() > 1]
 
-        if len(p) > 1:
-            cleaned.append(p)
 
-    return cleaned
+def clean_and_split_modules(mod_text):
+    """Cleaned module list of one course's module text."""
+    return split_modules([mod_text]).tolist()
+
+
+def clean_frame(df):
+    """
+    courses_and_modules frame → (wide, long):
+      wide: course_name, modules (cleaned, ", "-joined), one row per input row
+      long: course_name, module, one row per cleaned module (bulk graph load)
+    """
+    parts = split_modules(df["modules"].to_numpy())
+
+    # parts are grouped by row in order, so each row's modules are one slice
+    rows = parts.index.to_numpy()
+    bounds = np.zeros(len(df) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=len(df)), out=bounds[1:])
+    modules = parts.to_numpy(dtype=object)
+
+    wide = pd.DataFrame({
+        "course_name": df["course_name"].to_numpy(),
+        "modules": [", ".join(modules[a:b]) for a, b in zip(bounds[:-1], bounds[1:])],
+    })
+    long = pd.DataFrame({
+        "course_name": clean_column(df["course_name"]).to_numpy()[rows],
+        "module": modules,
+    })
+    long = long[long["course_name"] != ""]
+    return wide, long
+
+
+# -----------------------------------------------------------
+# ✅ Streaming over large CSVs (optionally in a process pool)
+# -----------------------------------------------------------
+def _chunks(input_csv, chunksize):
+    if chunksize:
+        yield from pd.read_csv(input_csv, chunksize=chunksize, dtype=str)
+    else:
+        yield pd.read_csv(input_csv, dtype=str)
+
+
+def _cleaned(input_csv, chunksize, workers):
+    chunks = _chunks(input_csv, chunksize)
+    if workers == 1:
+        yield from map(clean_frame, chunks)
+        return
+    # at most 2 chunks per worker in flight, results in input order
+    with ProcessPoolExecutor(max_workers=workers or None) as ex:
+        window = 2 * (workers or os.cpu_count() or 1)
+        pending = []
+        for chunk in chunks:
+            pending.append(ex.submit(clean_frame, chunk))
+            if len(pending) >= window:
+                yield pending.pop(0).result()
+        for fut in pending:
+            yield fut.result()
+
+
+def clean_modules_csv(input_csv=INPUT_FILE, output_csv=OUTPUT_FILE, long_csv=LONG_FILE,
+                      chunksize=None, workers=1):
+    """
+    Cleans a courses_and_modules CSV. With `chunksize` it is read and written
+    chunk by chunk, so memory stays flat; workers=1 cleans serially, any
+    other value uses a process pool of that size (0 → one per CPU). Writes
+    the wide file to `output_csv` and, unless None, the long file to
+    `long_csv`. Returns (courses, modules) written.
+    """
+    outputs = [(output_csv, 0)] + ([(long_csv, 1)] if long_csv else [])
+    for path, _ in outputs:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    courses = modules = 0
+    with span("clean_modules", chunksize=chunksize, workers=workers) as facts:
+        for i, frames in enumerate(_cleaned(input_csv, chunksize, workers)):
+            for path, k in outputs:
+                frames[k].to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+            courses += len(frames[0])
+            modules += len(frames[1])
+        facts.update(courses=courses, modules=modules)
+    count("modules_cleaned", modules)
+    return courses, modules
 
 
 def main():
-    df = pd.read_csv(INPUT_FILE)
-
-    cleaned_courses = []
-
-    for _, row in df.iterrows():
-        course = row["course_name"]
-        modules_raw = row["modules"]
-
-        modules_cleaned = clean_and_split_modules(modules_raw)
-
-        cleaned_courses.append({
-            "course_name": course,
-            "modules": ", ".join(modules_cleaned)
-        })
-
-    out_df = pd.DataFrame(cleaned_courses)
-    Path(OUTPUT_FILE).parent.mkdir(parents=True, exist_ok=True)
-    out_df.to_csv(OUTPUT_FILE, index=False)
-
-    print("Cleaned modules saved to:", OUTPUT_FILE)
+    ap = argparse.ArgumentParser(description="Clean and split course module lists")
+    ap.add_argument("--input", default=INPUT_FILE)
+    ap.add_argument("--out", default=OUTPUT_FILE, help="course_name, modules (cleaned, comma-joined)")
+    ap.add_argument("--long", default=LONG_FILE, help="course_name, module rows ('' to skip)")
+    ap.add_argument("--chunksize", type=int, default=None, help="Stream the input this many rows at a time")
+    ap.add_argument("--workers", type=int, default=1,
+                    help="Cleaning processes (1 = serial, 0 = all cores)")
+    add_profile_args(ap)
+    args = ap.parse_args()
+
+    with cli_profiler(args):
+        courses, modules = clean_modules_csv(args.input, args.out, args.long or None,
+                                             args.chunksize, args.workers)
+    print(f"✅ Cleaned {courses} courses → {args.out}")
+    if args.long:
+        print(f"✅ {modules} course/module rows → {args.long}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,274 @@
+import networkx as nx
+import numpy as np
+import pandas as pd
+
+from expansion import Expansion
+
+NODE_TYPES = ["Course", "Module", "Trainer", "Student", "Skill", "Unknown"]
+RELATIONS = ["has_module", "teaches", "skilled_in", "enrolled_in", "relevant_to", ""]
+
+
+def _code(values, vocab):
+    """Maps labels to int codes, appending unseen labels to `vocab`."""
+    lookup = {v: i for i, v in enumerate(vocab)}
+    codes = np.empty(len(values), dtype=np.int8)
+    for i, v in enumerate(values):
+        c = lookup.get(v)
+        if c is None:
+            c = lookup[v] = len(vocab)
+            vocab.append(v)
+        codes[i] = c
+    return codes
+
+
+def _csr(keys, values, rel, n):
+    order = np.argsort(keys, kind="stable")
+    ptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n), out=ptr[1:])
+    return ptr, values[order], rel[order]
+
+
+def _gather(ptr, idx, frontier):
+    """Concatenates the CSR rows of every node in `frontier`."""
+    starts, ends = ptr[frontier], ptr[frontier + 1]
+    lengths = ends - starts
+    if not lengths.sum():
+        return np.empty(0, dtype=idx.dtype)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return idx[np.arange(lengths.sum()) + offsets]
+
+
+# -----------------------------------------------------------
+# ✅ Immutable array-backed graph (read-only dashboard path)
+# -----------------------------------------------------------
+class CSRGraph:
+    """
+    Compact, read-only stand-in for the networkx DiGraph.
+
+    Node names are interned to integer ids; types and relations are int8
+    codes, and adjacency is stored twice in CSR form (successors and
+    predecessors) as flat numpy arrays. nodes()/edges() mirror the
+    networkx (data=True) iterators so rendering and export code can take
+    either backend.
+    """
+
+    def __init__(self, names, node_type, src, dst, rel, type_names=None, relation_names=None, csr=None):
+        self.names = np.asarray(names, dtype=object)
+        self.node_type = np.asarray(node_type, dtype=np.int8)
+        self.type_names = list(type_names or NODE_TYPES)
+        self.relation_names = list(relation_names or RELATIONS)
+        self._ids = None
+        self.meta = {}
+
+        n = len(self.names)
+        self.src = np.asarray(src, dtype=np.int32)
+        self.dst = np.asarray(dst, dtype=np.int32)
+        self.rel = np.asarray(rel, dtype=np.int8)
+        if csr is None:
+            csr = _csr(self.src, self.dst, self.rel, n) + _csr(self.dst, self.src, self.rel, n)
+        (self.succ_ptr, self.succ_idx, self.succ_rel,
+         self.pred_ptr, self.pred_idx, self.pred_rel) = csr
+
+    @property
+    def ids(self):
+        """name -> id, built on first use (snapshots load without it)."""
+        if self._ids is None:
+            self._ids = {name: i for i, name in enumerate(self.names)}
+        return self._ids
+
+    @classmethod
+    def from_networkx(cls, G):
+        names = list(G.nodes)
+        ids = {n: i for i, n in enumerate(names)}
+        type_names = list(NODE_TYPES)
+        relation_names = list(RELATIONS)
+
+        node_type = _code([d.get("type", "Unknown") for _, d in G.nodes(data=True)], type_names)
+        edges = list(G.edges(data=True))
+        src = np.fromiter((ids[u] for u, _, _ in edges), dtype=np.int32, count=len(edges))
+        dst = np.fromiter((ids[v] for _, v, _ in edges), dtype=np.int32, count=len(edges))
+        rel = _code([d.get("relation", "") for _, _, d in edges], relation_names)
+        return cls(names, node_type, src, dst, rel, type_names, relation_names)
+
+    @classmethod
+    def from_frames(cls, nodes_df, edges_df):
+        """Inverse of to_frames: node/type and source/target/relation tables."""
+        names = nodes_df["node"].tolist()
+        ids = {n: i for i, n in enumerate(names)}
+        type_names = list(NODE_TYPES)
+        relation_names = list(RELATIONS)
+
+        node_type = _code(nodes_df["type"].fillna("Unknown").tolist(), type_names)
+        src = edges_df["source"].map(ids).to_numpy(dtype=np.int32)
+        dst = edges_df["target"].map(ids).to_numpy(dtype=np.int32)
+        rel = _code(edges_df["relation"].fillna("").tolist(), relation_names)
+        return cls(names, node_type, src, dst, rel, type_names, relation_names)
+
+    def to_networkx(self):
+        G = nx.DiGraph()
+        G.add_nodes_from(self.nodes(data=True))
+        G.add_edges_from(self.edges(data=True))
+        return G
+
+    # -------------------------------------------------------
+    # networkx-style read API
+    # -------------------------------------------------------
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, name):
+        return name in self.ids
+
+    def number_of_nodes(self):
+        return len(self.names)
+
+    def number_of_edges(self):
+        return len(self.src)
+
+    def node_type_of(self, name):
+        return self.type_names[self.node_type[self.ids[name]]]
+
+    def nodes(self, data=False):
+        if not data:
+            return list(self.names)
+        types = self.type_names
+        return [(n, {"type": types[t]}) for n, t in zip(self.names, self.node_type)]
+
+    def edges(self, data=False):
+        names = self.names
+        if not data:
+            return list(zip(names[self.src], names[self.dst]))
+        rels = self.relation_names
+        return [
+            (u, v, {"relation": rels[r]})
+            for u, v, r in zip(names[self.src], names[self.dst], self.rel)
+        ]
+
+    def successors(self, name):
+        i = self.ids[name]
+        return list(self.names[self.succ_idx[self.succ_ptr[i]:self.succ_ptr[i + 1]]])
+
+    def predecessors(self, name):
+        i = self.ids[name]
+        return list(self.names[self.pred_idx[self.pred_ptr[i]:self.pred_ptr[i + 1]]])
+
+    # -------------------------------------------------------
+    # Filtering / hop expansion / subgraphs
+    # -------------------------------------------------------
+    def type_codes(self, types):
+        return [self.type_names.index(t) for t in types if t in self.type_names]
+
+    def ids_of(self, names):
+        return np.fromiter((self.ids[n] for n in names if n in self.ids), dtype=np.int64)
+
+    def expand(self, seeds, hops, relations=None, node_types=None, max_nodes=None):
+        """
+        Frontier-based BFS over both directions, vectorized per hop.
+
+        Returns an Expansion whose `nodes` is a boolean mask over node ids
+        and whose `frontiers` are the id arrays added at each hop.
+        `relations` / `node_types` restrict traversal; `max_nodes` caps
+        the number of kept nodes, taking each hop's new nodes in id order.
+        """
+        keep = np.zeros(len(self.names), dtype=bool)
+        frontier = np.unique(np.asarray(seeds, dtype=np.int64))
+        truncated = max_nodes is not None and len(frontier) > max_nodes
+        if truncated:
+            frontier = frontier[:max_nodes]
+        keep[frontier] = True
+        frontiers = [frontier]
+
+        rel_ok = None
+        if relations is not None:
+            rel_ok = np.isin(np.arange(len(self.relation_names)),
+                             [i for i, r in enumerate(self.relation_names) if r in relations])
+        type_ok = None
+        if node_types is not None:
+            type_ok = np.isin(np.arange(len(self.type_names)), self.type_codes(node_types))
+
+        for _ in range(hops):
+            if truncated or not len(frontier):
+                break
+            nbrs = np.concatenate([
+                _gather(self.succ_ptr, self.succ_idx, frontier),
+                _gather(self.pred_ptr, self.pred_idx, frontier),
+            ])
+            if rel_ok is not None:
+                rels = np.concatenate([
+                    _gather(self.succ_ptr, self.succ_rel, frontier),
+                    _gather(self.pred_ptr, self.pred_rel, frontier),
+                ])
+                nbrs = nbrs[rel_ok[rels]]
+
+            nbrs = np.unique(nbrs)
+            nbrs = nbrs[~keep[nbrs]]
+            if type_ok is not None:
+                nbrs = nbrs[type_ok[self.node_type[nbrs]]]
+
+            if max_nodes is not None:
+                room = max_nodes - int(keep.sum())
+                if len(nbrs) > room:
+                    truncated = True
+                    nbrs = nbrs[:room]
+
+            if not len(nbrs):
+                break
+            keep[nbrs] = True
+            frontiers.append(nbrs)
+            frontier = nbrs
+
+        return Expansion(keep, frontiers, bool(truncated))
+
+    def subgraph(self, mask):
+        """Induced subgraph on a boolean node mask, as a new CSRGraph."""
+        mask = np.asarray(mask, dtype=bool)
+        remap = np.full(len(self.names), -1, dtype=np.int64)
+        remap[mask] = np.arange(mask.sum())
+        emask = mask[self.src] & mask[self.dst]
+        return CSRGraph(
+            self.names[mask], self.node_type[mask],
+            remap[self.src[emask]], remap[self.dst[emask]], self.rel[emask],
+            self.type_names, self.relation_names,
+        )
+
+    def filter(self, keyword, allowed_types, hops, index=None,
+               relations=None, expand_types=None, max_nodes=None):
+        """Same semantics as dashboard.filter_graph, on arrays: (subgraph, truncated)."""
+        kw = keyword.lower().strip()
+        type_ok = np.isin(self.node_type, self.type_codes(allowed_types))
+
+        if kw and index is not None:
+            seeds = self.ids_of(index.search(kw))
+            seeds = seeds[type_ok[seeds]]
+        else:
+            seeds = np.flatnonzero(type_ok)
+            if kw:
+                seeds = np.array([i for i in seeds if kw in self.names[i].lower()], dtype=np.int64)
+
+        if not len(seeds):
+            return self.subgraph(np.zeros(len(self.names), dtype=bool)), False
+        exp = self.expand(seeds, hops, relations, expand_types, max_nodes)
+        return self.subgraph(exp.nodes), exp.truncated
+
+    # -------------------------------------------------------
+    # Export
+    # -------------------------------------------------------
+    def to_frames(self):
+        types = np.array(self.type_names, dtype=object)
+        rels = np.array(self.relation_names, dtype=object)
+        nodes_df = pd.DataFrame({"node": self.names, "type": types[self.node_type]})
+        edges_df = pd.DataFrame({
+            "source": self.names[self.src],
+            "target": self.names[self.dst],
+            "relation": rels[self.rel],
+        })
+        return nodes_df, edges_df
+
+    def nbytes(self):
+        arrays = [self.node_type, self.src, self.dst, self.rel,
+                  self.succ_ptr, self.succ_idx, self.succ_rel,
+                  self.pred_ptr, self.pred_idx, self.pred_rel]
+        return sum(a.nbytes for a in arrays) + self.names.nbytes
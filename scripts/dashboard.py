@@ -0,0 +1,171 @@
+"""
+Graph building, filtering and rendering behind the dashboard (kg_app.py),
+importable without starting Streamlit (benchmarks, tests, other scripts).
+"""
+import networkx as nx
+from pyvis.network import Network
+
+from csr_graph import CSRGraph
+from expansion import expand_neighborhood
+from graph_builder import DASHBOARD, build_graph_from_csv
+from graph_store import GraphStore
+
+
+# -----------------------------------------------------------
+# ✅ BUILD KNOWLEDGE GRAPH (NO TRAINERS.CSV)
+#    Shared builder (scripts/graph_builder.py), dashboard relation spec:
+#    courses → modules, trainers → skills (lower-cased), trainer → course
+#    when one of their skills is mentioned in the modules, students → course.
+# -----------------------------------------------------------
+def build_graph(courses_csv, students_csv, trainer_skills_csv, warn=print):
+    return build_graph_from_csv(
+        {"courses": courses_csv, "students": students_csv, "trainer_skills": trainer_skills_csv},
+        DASHBOARD,
+        warn=warn,
+    )
+
+
+# -----------------------------------------------------------
+# ✅ ADVANCED FILTERING
+# -----------------------------------------------------------
+def filter_graph(G, keyword, allowed_types, hops, index=None,
+                 relations=None, expand_types=None, max_nodes=None):
+    """(subgraph, truncated); truncated when max_nodes cut the expansion short."""
+    if isinstance(G, CSRGraph):
+        return G.filter(keyword, allowed_types, hops, index,
+                        relations, expand_types, max_nodes)
+    if isinstance(G, GraphStore):
+        # answered by SQL; only the matching slice is loaded
+        return G.filter(keyword, allowed_types, hops, relations, expand_types, max_nodes)
+
+    kw = keyword.lower().strip()
+
+    if kw and index is not None:
+        # Keyword seeds from the inverted index, then filter by node type
+        hits = index.search(kw)
+        if max_nodes is not None:
+            # the index returns a set; take seeds in graph (id) order, as the
+            # CSR / SQLite backends do, so a Max Nodes cut is reproducible
+            hits = [n for n in G if n in hits]
+        nodes = [n for n in hits if G.nodes[n].get("type") in allowed_types]
+    else:
+        # Filter by node type
+        nodes = [n for n, d in G.nodes(data=True) if d.get("type") in allowed_types]
+
+        # Further filter by keyword
+        if kw:
+            nodes = [n for n in nodes if kw in n.lower()]
+
+    if not nodes:
+        return nx.DiGraph(), False
+
+    # Expand by hop distance (bounded BFS; read-only subgraph view)
+    exp = expand_neighborhood(G, nodes, hops, relations, expand_types, max_nodes)
+    return G.subgraph(exp.nodes), exp.truncated
+
+
+# -----------------------------------------------------------
+# ✅ CLEAN VISUALIZATION
+# -----------------------------------------------------------
+def render_graph_html(G, layout, show_labels, glow, positions=None):
+    """Builds the pyvis page in memory, with the vis-network assets inlined."""
+
+    net = Network(
+        height="750px",
+        width="100%",
+        bgcolor="#0d1117",
+        font_color="white",
+        directed=True,
+        cdn_resources="in_line",
+    )
+
+    colors = {
+        "Course": "#FFA726",
+        "Module": "#42A5F5",
+        "Trainer": "#66BB6A",
+        "Student": "#FF7043",
+        "Skill": "#AB47BC",
+        "Student Group": "#FFAB91",
+        "Module Group": "#90CAF9",
+        "Unknown": "#BDBDBD",
+    }
+
+    # Group nodes sit next to the course they were folded into
+    group_offset = {"Student Group": (-90, 0), "Module Group": (90, 0)}
+
+    # ✅ Add nodes (aggregate nodes carry their own label/size/count)
+    for n, attrs in G.nodes(data=True):
+        t = attrs.get("type", "Unknown")
+        count = attrs.get("count")
+
+        fixed = {}
+        if positions is not None:
+            xy = positions.get(n)
+            if xy is None and attrs.get("owner") in positions:
+                ox, oy = positions[attrs["owner"]]
+                dx, dy = group_offset.get(t, (0, 0))
+                xy = (ox + dx, oy + dy)
+            if xy is not None:
+                fixed = {"x": xy[0], "y": xy[1], "physics": False}
+
+        net.add_node(
+            n,
+            label=attrs.get("label", n) if show_labels or count else "",
+            color=colors.get(t, "#CCCCCC"),
+            shape="dot",
+            size=attrs.get("size", 18),
+            borderWidth=3 if glow else 1,
+            shadow=glow,
+            title=f"{n} ({count} nodes, expand from the sidebar)" if count else f"{n} ({t})",
+            **fixed
+        )
+
+    # ✅ Add edges
+    for u, v, attrs in G.edges(data=True):
+        rel = attrs.get("relation", "")
+        if attrs.get("count", 1) > 1:
+            rel = f"{rel} ×{attrs['count']}"
+        net.add_edge(u, v, arrows="to", label=rel if show_labels else "")
+
+    # ✅ Layout settings (JSON safe)
+    if positions is not None:
+        # positions were computed server-side; the browser only draws
+        options = r"""
+        {
+          "physics": { "enabled": false },
+          "edges": { "smooth": false }
+        }
+        """
+    elif layout == "Hierarchical":
+        options = r"""
+        {
+          "layout": {
+            "hierarchical": {
+              "enabled": true,
+              "direction": "LR",
+              "levelSeparation": 200,
+              "nodeSpacing": 200
+            }
+          },
+          "physics": { "enabled": false }
+        }
+        """
+    else:
+        options = r"""
+        {
+          "physics": {
+            "enabled": true,
+            "barnesHut": {
+              "gravitationalConstant": -20000,
+              "centralGravity": 0.15,
+              "springLength": 150,
+              "springConstant": 0.05,
+              "damping": 0.08,
+              "avoidOverlap": 1
+            }
+          }
+        }
+        """
+
+    net.set_options(options)
+    return net.generate_html()
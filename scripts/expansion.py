@@ -0,0 +1,61 @@
+from collections import namedtuple
+
+# nodes:     kept nodes, seeds first, in discovery order
+# frontiers: one list per hop (frontiers[0] are the seeds)
+# truncated: True when max_nodes stopped the expansion early
+Expansion = namedtuple("Expansion", ["nodes", "frontiers", "truncated"])
+
+
+# -----------------------------------------------------------
+# ✅ Frontier-based, bounded neighbourhood expansion
+# -----------------------------------------------------------
+def _neighbors(G, n):
+    for v, d in G.succ[n].items():
+        yield v, d.get("relation")
+    for u, d in G.pred[n].items():
+        yield u, d.get("relation")
+
+
+def expand_neighborhood(G, seeds, hops, relations=None, node_types=None, max_nodes=None):
+    """
+    Breadth-first expansion over both edge directions, one frontier per hop.
+
+    Only the newest frontier is expanded each round, so already-visited
+    nodes are never rescanned. `relations` / `node_types` restrict which
+    edges are followed and which nodes may be added (seeds are kept as
+    given), and `max_nodes` caps the result, stopping as soon as it is hit.
+    """
+    relations = set(relations) if relations is not None else None
+    node_types = set(node_types) if node_types is not None else None
+
+    keep = dict.fromkeys(seeds)
+    if max_nodes is not None and len(keep) > max_nodes:
+        keep = dict.fromkeys(list(keep)[:max_nodes])
+        return Expansion(list(keep), [list(keep)], True)
+
+    frontier = list(keep)
+    frontiers = [frontier]
+    for _ in range(hops):
+        nxt = []
+        for n in frontier:
+            for nb, rel in _neighbors(G, n):
+                if nb in keep:
+                    continue
+                if relations is not None and rel not in relations:
+                    continue
+                if node_types is not None and G.nodes[nb].get("type") not in node_types:
+                    continue
+
+                if max_nodes is not None and len(keep) >= max_nodes:
+                    if nxt:
+                        frontiers.append(nxt)
+                    return Expansion(list(keep), frontiers, True)
+                keep[nb] = None
+                nxt.append(nb)
+
+        if not nxt:
+            break
+        frontiers.append(nxt)
+        frontier = nxt
+
+    return Expansion(list(keep), frontiers, False)
@@ -8,6 +8,12 @@ from pathlib import Path
 import warnings
 import logging
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from extraction_cache import cached_pdf_text, default_cache, pdf_key
+from ocr_triage import OCR_FAILED, TRIAGE_VERSION, OcrReport, read_page
+from profiling import add_profile_args, cli_profiler, count, span, timed
 
 # Silence noisy logs
 warnings.filterwarnings("ignore")
@@ -17,21 +23,103 @@ logging.getLogger("pdfminer").setLevel(logging.ERROR)
 TES_PATH = os.environ.get("TESSERACT_PATH", r"C:\Program Files\Tesseract-OCR\tesseract.exe")
 pytesseract.pytesseract.tesseract_cmd = TES_PATH
 
-def extract_text_from_pdf(pdf_path: Path) -> str:
-    text_content = ""
+# OCR resolution is now picked per page by ocr_triage (150-300 dpi)
+CACHE_TAG = f"brochure-triage{TRIAGE_VERSION}"
+
+def _page_text(page, report=None, source="") -> tuple:
+    # Text layer first; OCR (cached per rendered region) only where triage finds ink
+    text, info = read_page(page)
+    count(f"pages_{info['decision']}")
+    if report is not None:
+        report.add(source, **info)
+    return text, info["decision"] != OCR_FAILED
+
+def _extract_text_uncached(pdf_path: Path, report=None) -> tuple:
+    """(text, complete); incomplete when any page's OCR failed."""
+    text_content, complete = "", True
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
-            text = page.extract_text()
-            if not text:
-                # OCR fallback
-                try:
-                    image = page.to_image(resolution=220).original
-                    text = pytesseract.image_to_string(image)
-                except Exception:
-                    text = ""
-            text_content += "\n" + (text or "")
-    return text_content
+            text, ok = _page_text(page, report, pdf_path.name)
+            text_content += "\n" + text
+            complete = complete and ok
+    return text_content, complete
+
+def extract_text_from_pdf(pdf_path: Path, report=None) -> str:
+    """Whole-PDF text (cached by file content); `report` collects per-page OCR decisions."""
+    hit = [True]
+
+    def extract(p):
+        hit[0] = False
+        return _extract_text_uncached(p, report)
+
+    with span("extract_text_from_pdf", file=pdf_path.name) as facts:
+        text = cached_pdf_text(pdf_path, extract, CACHE_TAG)
+        facts["cached"] = hit[0]
+    count("pdf_cache_hits" if hit[0] else "pdf_cache_misses")
+    if report is not None and hit[0]:
+        report.add(pdf_path.name, decision="cached", seconds=0.0, chars=len(text))
+    return text
+
+# ---------------- PARALLEL (PAGE-LEVEL) EXTRACTION ----------------
+def count_pages(pdf_path: Path) -> int:
+    # an unreadable PDF raises here, as it does in serial mode
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
 
+def extract_page(pdf_path: Path, page_no: int) -> tuple:
+    """Worker task: text of one page, the seconds it took and its report row."""
+    start = time.perf_counter()
+    with pdfplumber.open(pdf_path) as pdf:
+        text, info = read_page(pdf.pages[page_no])
+    return text, time.perf_counter() - start, info
+
+def extract_texts_parallel(pdf_files: list, workers: int | None = None, report=None) -> list:
+    """
+    Fans every page of every PDF out to a process pool and reassembles the
+    pages in their original order.
+
+    Returns one (text, seconds) tuple per input file, in input order;
+    seconds is the summed worker time spent on that file's pages (0 for
+    files served from the extraction cache).
+    """
+    cache = default_cache()
+    keys = [pdf_key(pdf_file, CACHE_TAG) for pdf_file in pdf_files]
+    cached = [cache.get(key) for key in keys]
+    todo = [pdf_file for pdf_file, text in zip(pdf_files, cached) if text is None]
+    count("pdf_cache_hits", len(pdf_files) - len(todo))
+    count("pdf_cache_misses", len(todo))
+
+    with span("extract_texts_parallel", files=len(pdf_files)), ProcessPoolExecutor(max_workers=workers) as ex:
+        page_counts = list(ex.map(count_pages, todo))
+        futures = {
+            pdf_file: [ex.submit(extract_page, pdf_file, i) for i in range(n)]
+            for pdf_file, n in zip(todo, page_counts)
+        }
+
+        results = []
+        for pdf_file, key, text in zip(pdf_files, keys, cached):
+            if text is not None:
+                if report is not None:
+                    report.add(pdf_file.name, decision="cached", seconds=0.0, chars=len(text))
+                results.append((text, 0.0))
+                continue
+
+            texts, seconds, complete = [], 0.0, True
+            for fut in futures[pdf_file]:
+                page_text, elapsed, info = fut.result()
+                texts.append("\n" + page_text)
+                seconds += elapsed
+                complete = complete and info["decision"] != OCR_FAILED
+                count(f"pages_{info['decision']}")
+                if report is not None:
+                    report.add(pdf_file.name, **info)
+            text = "".join(texts)
+            if complete:    # a failed OCR page is retried next run
+                cache.put(key, text)
+            results.append((text, seconds))
+    return results
+
+@timed()
 def extract_course_name(text: str) -> str:
     cleaned = " ".join(text.split())
 
@@ -60,6 +148,7 @@ def extract_course_name(text: str) -> str:
 
     return "Unknown Course"
 
+@timed()
 def extract_modules(text: str) -> list:
     modules = []
 
@@ -96,15 +185,34 @@ def extract_modules(text: str) -> list:
             ordered.append(m)
     return ordered
 
-def process_brochures(brochure_folder: str, output_csv: str) -> pd.DataFrame:
-    folder = Path(r'D:\knowledge_graph_builder\brochures')
+def process_brochures(brochure_folder: str, output_csv: str, workers: int = 1,
+                      ocr_report: str | None = None) -> pd.DataFrame:
+    """
+    workers=1 extracts serially; any other value fans pages out to a
+    process pool of that size (0 → one worker per CPU). With `ocr_report`
+    a per-page CSV/JSON of triage decisions and OCR timings is written.
+    """
+    folder = Path(brochure_folder)
+    pdf_files = sorted(folder.glob("*.pdf"))
+    report = OcrReport() if ocr_report else None
+
+    if workers == 1:
+        def texts():
+            for pdf_file in pdf_files:
+                start = time.perf_counter()
+                text = extract_text_from_pdf(pdf_file, report)
+                yield text, time.perf_counter() - start
+    else:
+        def texts():
+            yield from extract_texts_parallel(pdf_files, workers or None, report)
+
     results = []
-    for pdf_file in folder.glob("*.pdf"):
-        print(f"[Brochure] Processing: {pdf_file.name}")
-        text = extract_text_from_pdf(pdf_file)
+    for pdf_file, (text, seconds) in zip(pdf_files, texts()):
+        print(f"[Brochure] Processing: {pdf_file.name} ({seconds:.2f}s)")
         course = extract_course_name(text)
         modules = extract_modules(text)
 
+        count("modules_extracted", len(modules))
         if modules:
             results.append({
                 "course_name": course,
@@ -116,6 +224,12 @@ def process_brochures(brochure_folder: str, output_csv: str) -> pd.DataFrame:
     df = pd.DataFrame(results, columns=["course_name", "modules"])
     Path(output_csv).parent.mkdir(parents=True, exist_ok=True)
     df.drop_duplicates().to_csv(output_csv, index=False)
+
+    if report is not None:
+        report.save(ocr_report)
+        for decision, s in sorted(report.summary().items()):
+            print(f"  {decision:>10}: {s['rows']} rows, {s['seconds']:.2f}s")
+        print(f"🧾 OCR report → {ocr_report}")
     return df
 
 if __name__ == "__main__":
@@ -123,6 +237,12 @@ if __name__ == "__main__":
     ap = argparse.ArgumentParser()
     ap.add_argument("--brochures", default="data/brochures", help="Folder containing brochures")
     ap.add_argument("--out", default="data/output/courses_and_modules.csv")
+    ap.add_argument("--workers", type=int, default=1,
+                    help="Page-level OCR/extraction processes (1 = serial, 0 = all cores)")
+    ap.add_argument("--ocr-report", default=None,
+                    help="Write a per-page OCR triage report (.csv or .json)")
+    add_profile_args(ap)
     args = ap.parse_args()
-    df = process_brochures(args.brochures, args.out)
+    with cli_profiler(args):
+        df = process_brochures(args.brochures, args.out, args.workers, args.ocr_report)
     print(f"Saved {len(df)} rows to {args.out}")
@@ -0,0 +1,135 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import pdfplumber
+import pytesseract
+
+from graph_cache import file_digest
+
+# Override with KG_EXTRACT_CACHE=<dir>, or KG_EXTRACT_CACHE=off to disable.
+DEFAULT_CACHE_DIR = "data/cache/extract"
+
+
+# -----------------------------------------------------------
+# ✅ Content-addressed text store
+# -----------------------------------------------------------
+class ExtractionCache:
+    """
+    On-disk text cache addressed by content hash.
+
+    Entries are plain UTF-8 files under <root>/<key[:2]>/<key>.txt, written
+    atomically so several worker processes can share one cache directory.
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_DIR, enabled=True):
+        self.root = Path(root)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts):
+        h = hashlib.sha256()
+        for part in parts:
+            h.update(str(part).encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _path(self, key):
+        return self.root / key[:2] / f"{key}.txt"
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        try:
+            text = self._path(key).read_text(encoding="utf-8")
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return text
+
+    def put(self, key, text):
+        if not self.enabled:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+
+
+_default_cache = None
+
+
+def default_cache():
+    global _default_cache
+    if _default_cache is None:
+        root = os.environ.get("KG_EXTRACT_CACHE", DEFAULT_CACHE_DIR)
+        _default_cache = ExtractionCache(root, enabled=root.lower() != "off")
+    return _default_cache
+
+
+# -----------------------------------------------------------
+# ✅ Whole-PDF text, keyed by file content + extractor settings
+# -----------------------------------------------------------
+def pdf_key(pdf_path, tag):
+    """`tag` names the extractor and its settings (e.g. "brochure-ocr220")."""
+    return ExtractionCache.make_key("pdf", file_digest(pdf_path), tag, pdfplumber.__version__,
+                                    tesseract_version())
+
+
+def cached_pdf_text(pdf_path, extract, tag, cache=None):
+    """
+    `extract(pdf_path)` returns the text, or (text, complete). An incomplete
+    text (a page whose OCR failed) is returned but not cached, so the next
+    run tries again.
+    """
+    cache = cache or default_cache()
+    key = pdf_key(pdf_path, tag)
+
+    text = cache.get(key)
+    if text is None:
+        text, complete = extract(pdf_path), True
+        if isinstance(text, tuple):
+            text, complete = text
+        if complete:
+            cache.put(key, text)
+    return text
+
+
+# -----------------------------------------------------------
+# ✅ Per-page OCR, keyed by rendered image + resolution + engine
+# -----------------------------------------------------------
+_tesseract_version = None
+
+
+def tesseract_version():
+    global _tesseract_version
+    if _tesseract_version is None:
+        try:
+            _tesseract_version = str(pytesseract.get_tesseract_version())
+        except Exception:
+            _tesseract_version = "unknown"
+    return _tesseract_version
+
+
+def image_key(image, resolution):
+    h = hashlib.sha256()
+    h.update(f"{image.mode}:{image.size}".encode("utf-8"))
+    h.update(image.tobytes())
+    return ExtractionCache.make_key("ocr", h.hexdigest(), resolution, tesseract_version())
+
+
+def ocr_image(image, resolution, cache=None):
+    cache = cache or default_cache()
+    key = image_key(image, resolution)
+
+    text = cache.get(key)
+    if text is None:
+        text = pytesseract.image_to_string(image)
+        cache.put(key, text)
+    return text
@@ -1,47 +1,21 @@
 import pandas as pd
 from pathlib import Path
 
+from recommend import Recommender
+
 def generate_trainers_csv(courses_file, trainer_skills_file, output_file):
     courses_df = pd.read_csv(courses_file)
     skills_df = pd.read_csv(trainer_skills_file)
 
-    rows = []
-
-    for _, t in skills_df.iterrows():
-        trainer = str(t["trainer_name"]).strip()
-
-        # ✅ Handle missing / NaN skills
-        raw_skills = t.get("skills", "")
-        if isinstance(raw_skills, float):  # means NaN
-            raw_skills = ""
-
-        trainer_skills = [
-            s.strip().lower()
-            for s in str(raw_skills).split(",")
-            if isinstance(s, str) and s.strip()
-        ]
-
-        teaches = []
-
-        for _, c in courses_df.iterrows():
-            course_name = str(c["course_name"]).strip()
-            modules = str(c["modules"]).lower()
-
-            # ✅ Skip if trainer has no skills
-            if not trainer_skills:
-                continue
-
-            # ✅ Match any skill with course modules
-            if any(skill in modules for skill in trainer_skills):
-                teaches.append(course_name)
-
-        # ✅ Remove duplicates
-        teaches = list(set(teaches))
+    # ✅ Score every trainer against every course in one sparse product
+    #    (a course is taught when any skill matches its modules, best first)
+    rec = Recommender.from_frames(courses_df, skills_df)
+    trainers = skills_df["trainer_name"].astype(str).str.strip()
 
-        rows.append({
-            "trainer_name": trainer,
-            "teaches": ", ".join(teaches) if teaches else ""
-        })
+    rows = [
+        {"trainer_name": trainer, "teaches": ", ".join(teaches)}
+        for trainer, teaches in zip(trainers, rec.teaches())
+    ]
 
     df = pd.DataFrame(rows, columns=["trainer_name", "teaches"])
     Path(output_file).parent.mkdir(parents=True, exist_ok=True)
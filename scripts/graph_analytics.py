@@ -0,0 +1,377 @@
+import pandas as pd
+
+from skill_taxonomy import default_taxonomy
+
+# Bump when a table's definition changes, so stored tables are recomputed
+ANALYTICS_VERSION = 1
+
+# table -> columns
+TABLES = {
+    # one row per course: modules, who teaches it, who attends, how much is covered
+    "course_coverage": ["course", "modules", "trainers", "students",
+                        "covered_modules", "gap_modules", "coverage"],
+    # one row per (course, trainer who teaches it or is skilled for one of its modules)
+    "course_trainers": ["course", "trainer", "teaches", "modules", "students"],
+    # one row per trainer: skills, courses taught, students reached, modules they fit
+    "trainer_load": ["trainer", "skills", "courses", "students", "modules"],
+    # one row per (course, module): the skills it needs and trainers who have one
+    "module_coverage": ["course", "module", "skills", "trainers"],
+    # one row per skill: supply (trainers) against demand (modules / courses)
+    "skill_supply": ["skill", "trainers", "modules", "courses"],
+}
+
+
+# -----------------------------------------------------------
+# ✅ Relation-typed adjacency (works for DiGraph and CSRGraph edges)
+# -----------------------------------------------------------
+class _Adjacency:
+    def __init__(self, edges=()):
+        self.out = {}   # relation -> u -> {v}
+        self.inc = {}   # relation -> v -> {u}
+        for u, v, d in edges:
+            self.add(u, v, d.get("relation", ""))
+
+    def add(self, u, v, rel):
+        self.out.setdefault(rel, {}).setdefault(u, set()).add(v)
+        self.inc.setdefault(rel, {}).setdefault(v, set()).add(u)
+
+    def succ(self, n, rel):
+        return self.out.get(rel, {}).get(n, frozenset())
+
+    def pred(self, n, rel):
+        return self.inc.get(rel, {}).get(n, frozenset())
+
+    def neighbors(self, n):
+        for out in self.out.values():
+            yield from out.get(n, ())
+        for inc in self.inc.values():
+            yield from inc.get(n, ())
+
+    def drop(self, n):
+        """Forgets every edge touching n."""
+        for rel, out in self.out.items():
+            for v in out.pop(n, ()):
+                self.inc[rel].get(v, set()).discard(n)
+        for rel, inc in self.inc.items():
+            for u in inc.pop(n, ()):
+                self.out[rel].get(u, set()).discard(n)
+
+
+# -----------------------------------------------------------
+# ✅ Materialized analytics
+# -----------------------------------------------------------
+class GraphAnalytics:
+    """
+    Staff questions answered from precomputed rows instead of graph walks:
+    which trainers can cover a course, which modules have no skilled
+    trainer, how many students each trainer reaches per course.
+
+    compute() derives every row once from the has_module / teaches /
+    skilled_in / enrolled_in / relevant_to edges (module skills come from
+    relevant_to, or, for graphs built without it, from the shared skill
+    taxonomy). Lookups are dict reads. After a GraphUpdater delta,
+    apply_rows() recomputes only the rows around the changed entities.
+    """
+
+    def __init__(self):
+        self.courses = {}           # course -> course_coverage row
+        self.course_trainers = {}   # course -> {trainer: course_trainers row}
+        self.trainers = {}          # trainer -> trainer_load row
+        self.modules = {}           # module -> row with its course list
+        self.skills = {}            # skill -> skill_supply row
+        self.course_modules = {}    # course -> its modules
+        self._tables = None
+
+        # only kept on computed (not loaded) analytics, for incremental refresh
+        self._adj = None
+        self._types = None
+        self._taxonomy = None
+        self._linker = None
+        self._module_skills = None  # module -> skills, when there are no relevant_to edges
+        self._skill_modules = None  # ... and the reverse
+        self._module_trainers = {}
+
+    # -------------------------------------------------------
+    # Building
+    # -------------------------------------------------------
+    @classmethod
+    def compute(cls, G, taxonomy=None):
+        a = cls()
+        a._types = {n: d.get("type", "Unknown") for n, d in G.nodes(data=True)}
+        a._adj = _Adjacency(G.edges(data=True))
+        a._taxonomy = taxonomy or default_taxonomy()
+        if not a._adj.out.get("relevant_to"):
+            a._module_skills, a._skill_modules = {}, {}
+            a._scan_modules(a._of_type(a._types, "Module", a._types))
+        a._recompute(set(a._types))
+        return a
+
+    @staticmethod
+    def _of_type(nodes, ntype, types):
+        return [n for n in nodes if types.get(n) == ntype]
+
+    def _scan_modules(self, modules):
+        if self._linker is None:
+            self._linker = self._taxonomy.linker(self._of_type(self._types, "Skill", self._types))
+        for m in modules:
+            self._forget_module(m)
+            skills = self._linker.match_keys(m)
+            self._module_skills[m] = skills
+            for sk in skills:
+                self._skill_modules.setdefault(sk, set()).add(m)
+
+    def _forget_module(self, m):
+        for sk in self._module_skills.pop(m, ()):
+            self._skill_modules.get(sk, set()).discard(m)
+
+    def _skills_of_module(self, m):
+        if self._module_skills is not None:
+            return self._module_skills.get(m, frozenset())
+        return self._adj.pred(m, "relevant_to")
+
+    def _modules_of_skill(self, sk):
+        if self._skill_modules is not None:
+            return self._skill_modules.get(sk, frozenset())
+        return self._adj.succ(sk, "relevant_to")
+
+    def _recompute(self, dirty):
+        adj, types = self._adj, self._types
+        self._tables = None
+        for table in (self.courses, self.course_trainers, self.trainers, self.modules, self.skills,
+                      self.course_modules):
+            for n in dirty:
+                table.pop(n, None)
+
+        for m in self._of_type(dirty, "Module", types):
+            skills = self._skills_of_module(m)
+            trainers = set()
+            for sk in skills:
+                trainers |= adj.pred(sk, "skilled_in")
+            self._module_trainers[m] = trainers
+            self.modules[m] = {
+                "module": m,
+                "course_list": sorted(adj.pred(m, "has_module")),
+                "skills": ", ".join(sorted(skills)),
+                "trainers": len(trainers),
+            }
+
+        for sk in self._of_type(dirty, "Skill", types):
+            modules = self._modules_of_skill(sk)
+            courses = set()
+            for m in modules:
+                courses |= adj.pred(m, "has_module")
+            self.skills[sk] = {
+                "skill": sk,
+                "trainers": len(adj.pred(sk, "skilled_in")),
+                "modules": len(modules),
+                "courses": len(courses),
+            }
+
+        for c in self._of_type(dirty, "Course", types):
+            modules = adj.succ(c, "has_module")
+            teaching = adj.pred(c, "teaches")
+            students = len(adj.pred(c, "enrolled_in"))
+            covered = [m for m in modules if self._module_trainers.get(m)]
+            self.course_modules[c] = sorted(modules)
+
+            fit = {}
+            for m in modules:
+                for t in self._module_trainers.get(m, ()):
+                    fit[t] = fit.get(t, 0) + 1
+            self.course_trainers[c] = {
+                t: {"course": c, "trainer": t, "teaches": t in teaching,
+                    "modules": fit.get(t, 0), "students": students if t in teaching else 0}
+                for t in teaching | set(fit)
+            }
+            self.courses[c] = {
+                "course": c,
+                "modules": len(modules),
+                "trainers": len(teaching),
+                "students": students,
+                "covered_modules": len(covered),
+                "gap_modules": len(modules) - len(covered),
+                "coverage": round(len(covered) / len(modules), 3) if modules else None,
+            }
+
+        for t in self._of_type(dirty, "Trainer", types):
+            skills = adj.succ(t, "skilled_in")
+            courses = adj.succ(t, "teaches")
+            modules = set()
+            for sk in skills:
+                modules |= set(self._modules_of_skill(sk))
+            self.trainers[t] = {
+                "trainer": t,
+                "skills": len(skills),
+                "courses": len(courses),
+                "students": sum(self.courses.get(c, {}).get("students", 0) for c in courses),
+                "modules": len(modules),
+            }
+
+    # -------------------------------------------------------
+    # Incremental refresh
+    # -------------------------------------------------------
+    def _near(self, nodes):
+        found = set(nodes)
+        for n in nodes:
+            found.update(self._adj.neighbors(n))
+        return found
+
+    def _dirty(self, touched):
+        """
+        Rows that can change when edges at `touched` change: two hops out
+        (students only as given, their own rows do not exist), the modules
+        needing any of those skills and the courses holding those modules.
+        """
+        types = self._types
+        dirty = set(touched)
+        frontier = set(touched)
+        for _ in range(2):
+            nxt = {v for n in frontier for v in self._adj.neighbors(n)
+                   if v not in dirty and types.get(v) != "Student"}
+            dirty |= nxt
+            frontier = nxt
+
+        for sk in self._of_type(dirty, "Skill", types):
+            dirty.update(self._modules_of_skill(sk))
+        for m in self._of_type(dirty, "Module", types):
+            dirty.update(self._adj.pred(m, "has_module"))
+        for c in self._of_type(dirty, "Course", types):
+            dirty.update(self._adj.pred(c, "teaches"))
+        return dirty
+
+    def refresh(self, G, touched, before=None):
+        """
+        Re-derives the rows around `touched` after the networkx graph G was
+        changed in place. `before` is the (near, dirty) pair from
+        prepare(touched), taken before the change.
+        """
+        if self._adj is None:
+            raise ValueError("loaded analytics are read-only; compute() them from a graph")
+        touched = [n for n in touched if n]
+        near_before, dirty_before = before or (self._near(touched), self._dirty(touched))
+
+        near = set(near_before) | set(touched)
+        for n in touched:
+            if n in G:
+                near.update(G.successors(n))
+                near.update(G.predecessors(n))
+
+        old_skills = {n for n in near if self._types.get(n) == "Skill"}
+        for n in near:
+            self._adj.drop(n)
+        for n in near:
+            if n not in G:
+                self._types.pop(n, None)
+                self._module_trainers.pop(n, None)
+                if self._module_skills is not None:
+                    self._forget_module(n)
+                continue
+            self._types[n] = G.nodes[n].get("type", "Unknown")
+            for v, d in G.succ[n].items():
+                self._adj.add(n, v, d.get("relation", ""))
+            for u, d in G.pred[n].items():
+                self._adj.add(u, n, d.get("relation", ""))
+
+        dirty = set(dirty_before) | self._dirty(touched)
+        if self._module_skills is not None:
+            new_skills = {n for n in near if self._types.get(n) == "Skill"}
+            added, removed = new_skills - old_skills, old_skills - new_skills
+            rescan = set(self._of_type(dirty, "Module", self._types))
+            if added or removed:
+                self._linker = None
+                for sk in removed:
+                    rescan |= self._skill_modules.pop(sk, set())
+                if added:
+                    scan = self._taxonomy.linker(added)
+                    rescan |= {m for m in self._of_type(self._types, "Module", self._types) if scan.match_keys(m)}
+            self._scan_modules(rescan)
+            dirty |= rescan
+            for m in rescan:
+                dirty.update(self._adj.pred(m, "has_module"))
+            for c in self._of_type(dirty, "Course", self._types):
+                dirty.update(self._adj.pred(c, "teaches"))
+
+        self._recompute(dirty)
+        return dirty
+
+    def prepare(self, touched):
+        touched = [n for n in touched if n]
+        return self._near(touched), self._dirty(touched)
+
+    def apply_rows(self, updater, kind, rows):
+        """GraphUpdater.apply_rows plus a refresh of the rows it can affect."""
+        rows = list(rows)
+        touched = set()
+        for r in rows:
+            if kind == "courses":
+                touched.add(str(r["course_name"]).strip())
+            elif kind == "trainer_skills":
+                touched.add(str(r["trainer_name"]).strip())
+            elif kind == "students":
+                touched.add(str(r["student_name"]).strip())
+                touched.add(str(r.get("enrolled", "")).strip())
+        before = self.prepare(touched)
+        updater.apply_rows(kind, rows)
+        self.refresh(updater.G, touched, before)
+        return updater.G
+
+    # -------------------------------------------------------
+    # O(1) lookups
+    # -------------------------------------------------------
+    def course(self, name):
+        return self.courses.get(name)
+
+    def trainer(self, name):
+        return self.trainers.get(name)
+
+    def trainers_for(self, course):
+        """Trainers who teach or can cover `course`, best fit first."""
+        rows = self.course_trainers.get(course, {}).values()
+        return sorted(rows, key=lambda r: (not r["teaches"], -r["modules"], r["trainer"]))
+
+    def gaps(self, course):
+        """Modules of `course` with no skilled trainer."""
+        return [m for m in self.course_modules.get(course, ()) if not self.modules[m]["trainers"]]
+
+    # -------------------------------------------------------
+    # Tables (for storage / display)
+    # -------------------------------------------------------
+    def tables(self):
+        """{table: DataFrame}, built once and reused until the next refresh."""
+        if self._tables is not None:
+            return self._tables
+        module_rows = [
+            {"course": c, "module": row["module"], "skills": row["skills"], "trainers": row["trainers"]}
+            for row in self.modules.values()
+            for c in (row["course_list"] or [""])
+        ]
+        rows = {
+            "course_coverage": list(self.courses.values()),
+            "course_trainers": [r for by_trainer in self.course_trainers.values() for r in by_trainer.values()],
+            "trainer_load": list(self.trainers.values()),
+            "module_coverage": module_rows,
+            "skill_supply": list(self.skills.values()),
+        }
+        self._tables = {name: pd.DataFrame(rows[name], columns=cols) for name, cols in TABLES.items()}
+        return self._tables
+
+    @classmethod
+    def from_tables(cls, tables):
+        """Read-only analytics from stored tables (no graph needed)."""
+        a = cls()
+        records = {name: tables[name].to_dict("records") for name in TABLES if name in tables}
+        a.courses = {r["course"]: r for r in records.get("course_coverage", [])}
+        for r in records.get("course_trainers", []):
+            r["teaches"] = bool(r["teaches"])
+            a.course_trainers.setdefault(r["course"], {})[r["trainer"]] = r
+        a.trainers = {r["trainer"]: r for r in records.get("trainer_load", [])}
+        for r in records.get("module_coverage", []):
+            row = a.modules.setdefault(r["module"], {
+                "module": r["module"], "course_list": [],
+                "skills": r["skills"] or "", "trainers": int(r["trainers"]),
+            })
+            if r["course"]:
+                row["course_list"].append(r["course"])
+                a.course_modules.setdefault(r["course"], []).append(r["module"])
+        a.skills = {r["skill"]: r for r in records.get("skill_supply", [])}
+        return a
@@ -0,0 +1,172 @@
+from collections import namedtuple
+from pathlib import Path
+
+import networkx as nx
+import pandas as pd
+
+from ingest import add_edges, add_nodes, clean_column, explode_list_column
+from profiling import count, span
+from skill_taxonomy import default_taxonomy
+
+# Bump when build semantics change, so cached graphs/snapshots are rebuilt
+BUILDER_VERSION = 1
+
+# Input tables and the columns each one must have
+TABLES = {
+    "courses": ["course_name", "modules"],
+    "trainers": ["trainer_name", "teaches"],
+    "students": ["student_name", "enrolled"],
+    "trainer_skills": ["trainer_name", "skills"],
+}
+
+
+# -----------------------------------------------------------
+# ✅ Declarative relation spec
+# -----------------------------------------------------------
+# Column relation: one edge per row (kind="value") or per comma-separated
+# item (kind="list") of `table`, source column → target column. Every
+# non-empty source becomes a node even without targets. `owns_*` says
+# whether this relation decides the node type when the name already exists.
+Relation = namedtuple(
+    "Relation",
+    ["name", "kind", "table", "source", "target", "source_type", "target_type",
+     "lower", "owns_source", "owns_target"],
+    defaults=[False, True, True],
+)
+
+# Mention relation: edge when a Skill (or one of its taxonomy aliases) is
+# mentioned in a target's text. The text is the target node's own name, or
+# `text` column of `table` keyed by `key`. With `via`, the edge starts at the
+# nodes linked to the skill by that relation (trainer --skilled_in--> skill)
+# instead of at the skill itself.
+Mention = namedtuple(
+    "Mention",
+    ["name", "source_type", "target_type", "table", "key", "text", "via"],
+    defaults=[None, None, None, None],
+)
+
+HAS_MODULE = Relation("has_module", "list", "courses", "course_name", "modules", "Course", "Module")
+TEACHES = Relation("teaches", "list", "trainers", "trainer_name", "teaches", "Trainer", "Course",
+                   owns_target=False)
+ENROLLED_IN = Relation("enrolled_in", "value", "students", "student_name", "enrolled", "Student", "Course",
+                       owns_target=False)
+SKILLED_IN = Relation("skilled_in", "list", "trainer_skills", "trainer_name", "skills", "Trainer", "Skill",
+                      owns_source=False)
+RELEVANT_TO = Mention("relevant_to", "Skill", "Module")
+TEACHES_BY_SKILL = Mention("teaches", "Trainer", "Course", table="courses", key="course_name",
+                           text="modules", via="skilled_in")
+
+# Batch pipeline (build_and_visualize / build_kg): explicit trainers.csv
+PIPELINE = [HAS_MODULE, TEACHES, ENROLLED_IN, SKILLED_IN, RELEVANT_TO]
+
+# Dashboard (kg_app): no trainers.csv; skills are lower-cased and
+# trainer → course is derived from skills mentioned in the course modules
+DASHBOARD = [HAS_MODULE, SKILLED_IN._replace(lower=True), TEACHES_BY_SKILL, ENROLLED_IN]
+
+
+# -----------------------------------------------------------
+# ✅ Loading
+# -----------------------------------------------------------
+def load_csv(path, expected_cols, warn=print):
+    """Missing file → empty frame; missing columns → empty strings."""
+    p = Path(path) if path else None
+    if p is None or not p.exists():
+        if p is not None:
+            warn(f"⚠️ Missing file: {p}")
+        return pd.DataFrame(columns=expected_cols)
+
+    df = pd.read_csv(p)
+    for col in expected_cols:
+        if col not in df.columns:
+            df[col] = ""
+    return df[expected_cols].fillna("")
+
+
+def load_tables(paths, warn=print):
+    """{table: csv path} → {table: DataFrame}; unknown table names are rejected."""
+    unknown = set(paths) - set(TABLES)
+    if unknown:
+        raise ValueError(f"unknown input tables: {sorted(unknown)}")
+    return {name: load_csv(path, TABLES[name], warn) for name, path in paths.items()}
+
+
+# -----------------------------------------------------------
+# ✅ Engine
+# -----------------------------------------------------------
+def _apply_columns(G, rel, df):
+    sources = clean_column(df[rel.source])
+    add_nodes(G, sources[sources != ""], rel.source_type, overwrite=rel.owns_source)
+
+    if rel.kind == "list":
+        pairs = explode_list_column(df, rel.source, rel.target, lower=rel.lower)
+        src, dst = pairs[rel.source], pairs[rel.target]
+    elif rel.kind == "value":
+        targets = clean_column(df[rel.target], lower=rel.lower)
+        keep = (sources != "") & (targets != "")
+        src, dst = sources[keep], targets[keep]
+    else:
+        raise ValueError(f"unknown relation kind: {rel.kind}")
+
+    add_nodes(G, dst, rel.target_type, overwrite=rel.owns_target)
+    add_edges(G, src, dst, rel.name)
+
+
+def _apply_mentions(G, rel, tables, taxonomy):
+    skills = [n for n, d in G.nodes(data=True) if d.get("type") == "Skill"]
+    if not skills:
+        return
+
+    if rel.via is None:
+        sources_of = {sk: [sk] for sk in skills}
+    else:
+        sources_of = {}
+        for u, v, d in G.edges(data=True):
+            if d.get("relation") == rel.via:
+                sources_of.setdefault(v, []).append(u)
+
+    if rel.table is None:
+        targets = [(n, n) for n, d in G.nodes(data=True) if d.get("type") == rel.target_type]
+    else:
+        df = tables.get(rel.table)
+        if df is None or df.empty:
+            return
+        keys = clean_column(df[rel.key])
+        targets = [(k, text) for k, text in zip(keys, df[rel.text].fillna("").astype(str)) if k]
+
+    matcher = taxonomy.linker(sources_of)
+    edges = []
+    for target, text in targets:
+        for sk in matcher.matches(text):
+            edges.extend((src, target) for src in sources_of[sk])
+
+    add_nodes(G, [t for _, t in edges], rel.target_type, overwrite=False)
+    G.add_edges_from(edges, relation=rel.name)
+
+
+def build_graph(tables, relations=PIPELINE, taxonomy=None):
+    """
+    Builds the knowledge graph from {table: DataFrame} by applying each
+    relation of the spec in order. Relations whose table is absent are skipped.
+    """
+    taxonomy = taxonomy or default_taxonomy()
+    G = nx.DiGraph()
+    with span("build_graph") as facts:
+        for rel in relations:
+            with span(f"build_graph/{rel.name}"):
+                if isinstance(rel, Mention):
+                    _apply_mentions(G, rel, tables, taxonomy)
+                    continue
+                df = tables.get(rel.table)
+                if df is not None and not df.empty:
+                    _apply_columns(G, rel, df)
+        facts.update(nodes=G.number_of_nodes(), edges=G.number_of_edges())
+    count("nodes_built", G.number_of_nodes())
+    count("edges_built", G.number_of_edges())
+    return G
+
+
+def build_graph_from_csv(paths, relations=PIPELINE, warn=print, taxonomy=None):
+    """Same as build_graph, reading {table: csv path} (missing files warn and count as empty)."""
+    with span("load_tables"):
+        tables = load_tables(paths, warn)
+    return build_graph(tables, relations, taxonomy)
@@ -0,0 +1,126 @@
+import hashlib
+import threading
+from pathlib import Path
+
+from graph_snapshot import SnapshotError, load_snapshot, save_snapshot
+
+
+# -----------------------------------------------------------
+# ✅ File fingerprints (mtime/size first, content hash second)
+# -----------------------------------------------------------
+def file_digest(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class GraphCache:
+    """
+    Keeps one built graph in memory and rebuilds it only when one of the
+    input files actually changes.
+
+    The cheap (mtime, size) stat is checked on every lookup; the file is only
+    re-hashed when the stat moves, so a `touch` without a content change is
+    still a cache hit.
+
+    With `snapshot_path` the built graph is also written to a binary
+    snapshot tagged with the input fingerprint, so a fresh process whose
+    inputs are unchanged maps the snapshot instead of rebuilding.
+
+    `salt` (e.g. a builder version) is mixed into the version, so a change
+    in how the graph is built also invalidates graphs built from the same
+    files.
+
+    With a `store` (graph_store.GraphStore) the built graph is written to
+    SQLite instead and the store itself is what get() returns; a store that
+    already holds this version is used without building anything.
+    """
+
+    def __init__(self, builder, snapshot_path=None, salt=None, store=None):
+        self.builder = builder
+        self.salt = salt
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._stats = {}  # path -> (mtime_ns, size, digest)
+        self._key = None
+        self._graph = None
+
+    def _digest(self, path):
+        p = Path(path)
+        if not p.exists():
+            self._stats.pop(str(p), None)
+            return None
+
+        st = p.stat()
+        seen = self._stats.get(str(p))
+        if seen and seen[0] == st.st_mtime_ns and seen[1] == st.st_size:
+            return seen[2]
+
+        digest = file_digest(p)
+        self._stats[str(p)] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
+
+    def fingerprint(self, paths):
+        return tuple((str(p), self._digest(p)) for p in paths)
+
+    def get(self, *paths):
+        with self._lock:
+            key = self.fingerprint(paths)
+            if self._graph is not None and key == self._key:
+                self.hits += 1
+                return self._graph
+
+            self.misses += 1
+            # the new key is only adopted once its graph exists, so a failed
+            # build leaves the previous graph and version in place
+            version = self._version_of(key)
+            G = self._load_snapshot(version)
+            if G is None:
+                G = self._build(paths, version)
+            self._key, self._graph = key, G
+            return G
+
+    def _load_snapshot(self, version):
+        if self.store is not None:
+            return self.store if self.store.version == version else None
+        if self.snapshot_path is None or not self.snapshot_path.exists():
+            return None
+        try:
+            G = load_snapshot(self.snapshot_path)
+        except (OSError, SnapshotError):
+            return None
+        return G if G.meta.get("source") == version else None
+
+    def _build(self, paths, version):
+        G = self.builder(*paths)
+        if self.store is not None:
+            return self.store.write(G, version)
+        if self.snapshot_path is not None:
+            save_snapshot(G, self.snapshot_path, meta={"source": version})
+        return G
+
+    def _version_of(self, key):
+        h = hashlib.sha256(repr((self.salt, key) if self.salt else key).encode("utf-8"))
+        return h.hexdigest()[:12]
+
+    @property
+    def version(self):
+        """Short, stable id of the inputs the cached graph was built from."""
+        return None if self._key is None else self._version_of(self._key)
+
+    def clear(self):
+        with self._lock:
+            self._key = None
+            self._graph = None
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "version": self.version,
+        }
@@ -0,0 +1,175 @@
+import gzip
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from xml.sax.saxutils import quoteattr
+
+import pandas as pd
+
+from csr_graph import CSRGraph
+from profiling import count
+
+# label -> (file extension, mime type)
+EXPORT_FORMATS = {
+    "CSV": ("csv", "text/csv"),
+    "CSV (gzip)": ("csv.gz", "application/gzip"),
+    "Parquet": ("parquet", "application/vnd.apache.parquet"),
+    "GraphML": ("graphml", "application/xml"),
+    "JSON Lines": ("jsonl", "application/x-ndjson"),
+}
+# formats written as separate nodes / edges tables
+TABLE_FORMATS = ["CSV", "CSV (gzip)", "Parquet"]
+
+CHUNK_ROWS = 50_000
+
+
+def available_formats():
+    """Parquet needs pyarrow or fastparquet; everything else is stdlib/pandas."""
+    has_parquet = any(importlib.util.find_spec(m) for m in ("pyarrow", "fastparquet"))
+    return [f for f in EXPORT_FORMATS if f != "Parquet" or has_parquet]
+
+
+def export_key(*parts):
+    """Short hash of whatever identifies an export (graph version + filters)."""
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def graph_frames(G):
+    """(nodes_df, edges_df) for either backend."""
+    if isinstance(G, CSRGraph):
+        return G.to_frames()
+
+    nodes_df = pd.DataFrame(
+        [(n, d.get("type", "Unknown")) for n, d in G.nodes(data=True)],
+        columns=["node", "type"],
+    )
+    edges_df = pd.DataFrame(
+        [(u, v, d.get("relation", "")) for u, v, d in G.edges(data=True)],
+        columns=["source", "target", "relation"],
+    )
+    return nodes_df, edges_df
+
+
+# -----------------------------------------------------------
+# ✅ Writers (chunked; never hold a second full copy in memory)
+# -----------------------------------------------------------
+def write_table(df, f, fmt):
+    if fmt == "Parquet":
+        df.to_parquet(f, index=False)
+        return
+
+    out = gzip.GzipFile(fileobj=f, mode="wb", mtime=0) if fmt == "CSV (gzip)" else f
+    for start in range(0, max(len(df), 1), CHUNK_ROWS):
+        chunk = df.iloc[start:start + CHUNK_ROWS]
+        out.write(chunk.to_csv(index=False, header=start == 0).encode("utf-8"))
+    if out is not f:
+        out.close()
+
+
+def write_jsonl(G, f):
+    for n, d in G.nodes(data=True):
+        rec = {"kind": "node", "id": n, "type": d.get("type", "Unknown")}
+        f.write((json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8"))
+    for u, v, d in G.edges(data=True):
+        rec = {"kind": "edge", "source": u, "target": v, "relation": d.get("relation", "")}
+        f.write((json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8"))
+
+
+def write_graphml(G, f):
+    """Minimal GraphML (same keys networkx.write_graphml emits), streamed."""
+    f.write(
+        b'<?xml version="1.0" encoding="utf-8"?>\n'
+        b'<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+        b'  <key id="d0" for="node" attr.name="type" attr.type="string" />\n'
+        b'  <key id="d1" for="edge" attr.name="relation" attr.type="string" />\n'
+        b'  <graph edgedefault="directed">\n'
+    )
+    for n, d in G.nodes(data=True):
+        f.write((
+            f'    <node id={quoteattr(str(n))}>'
+            f'<data key="d0">{_text(d.get("type", "Unknown"))}</data></node>\n'
+        ).encode("utf-8"))
+    for u, v, d in G.edges(data=True):
+        f.write((
+            f'    <edge source={quoteattr(str(u))} target={quoteattr(str(v))}>'
+            f'<data key="d1">{_text(d.get("relation", ""))}</data></edge>\n'
+        ).encode("utf-8"))
+    f.write(b"  </graph>\n</graphml>\n")
+
+
+def _text(value):
+    return quoteattr(str(value))[1:-1]
+
+
+def write_export(G, f, fmt, part=None):
+    """Writes one export file. `part` is "nodes" / "edges" for table formats."""
+    if fmt in TABLE_FORMATS:
+        nodes_df, edges_df = graph_frames(G)
+        write_table(nodes_df if part == "nodes" else edges_df, f, fmt)
+    elif fmt == "GraphML":
+        write_graphml(G, f)
+    elif fmt == "JSON Lines":
+        write_jsonl(G, f)
+    else:
+        raise ValueError(f"unknown export format: {fmt}")
+
+
+# -----------------------------------------------------------
+# ✅ On-disk export cache (generated on first request only)
+# -----------------------------------------------------------
+class ExportCache:
+    """
+    Exports are written once per (key, format, part) to
+    `<root>/<key>-<part>.<ext>`, streaming rows to disk in chunks, and
+    only when a download is actually requested. The oldest files are
+    pruned beyond `max_files`.
+
+    Writes hold a lock striped by path, not the whole cache, so a slow
+    export never blocks other sessions' hits; the file appears via
+    os.replace, so readers never see it half-written.
+    """
+
+    def __init__(self, root="data/cache/exports", max_files=64, stripes=16):
+        self.root = Path(root)
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+
+    def path(self, key, fmt, part=None):
+        ext = EXPORT_FORMATS[fmt][0]
+        return self.root / f"{key}-{part or 'graph'}.{ext}"
+
+    def get(self, G, key, fmt, part=None):
+        path = self.path(key, fmt, part)
+        with self._stripes[hash(path.name) % len(self._stripes)]:
+            try:
+                data = path.read_bytes()
+                count("export_cache_hits")
+                return data
+            except FileNotFoundError:
+                count("export_cache_misses")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    write_export(G, f, fmt, part)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            data = path.read_bytes()
+        with self._lock:
+            self._prune()
+        return data
+
+    def _prune(self):
+        files = sorted(
+            (p for p in self.root.iterdir() if not p.name.endswith(".tmp")),
+            key=lambda p: p.stat().st_mtime,
+        )
+        for p in files[:-self.max_files]:
+            p.unlink(missing_ok=True)
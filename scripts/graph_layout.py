@@ -0,0 +1,218 @@
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from csr_graph import CSRGraph
+
+LAYOUTS = ["Force-Directed", "Hierarchical"]
+LAYOUT_VERSION = 1   # bump when the layouts change, so stored positions are recomputed
+
+# Column of each node type in the hierarchical (left -> right) layout
+LAYER_OF_TYPE = {"Trainer": 0, "Student": 0, "Course": 1, "Module": 2, "Skill": 2, "Unknown": 3}
+LEVEL_SEPARATION = 200   # same spacing the vis.js hierarchical options used
+NODE_SPACING = 60
+
+EXACT_REPULSION_LIMIT = 1000   # above this, repulsion is estimated from a sample
+REPULSION_SAMPLE = 128
+
+
+def _arrays(G):
+    """names, type labels and (src, dst) id arrays for either backend."""
+    if isinstance(G, CSRGraph):
+        types = np.array(G.type_names, dtype=object)[G.node_type]
+        return list(G.names), list(types), G.src.astype(np.int64), G.dst.astype(np.int64)
+
+    names = list(G)
+    ids = {n: i for i, n in enumerate(names)}
+    types = [G.nodes[n].get("type", "Unknown") for n in names]
+    edges = list(G.edges())
+    src = np.fromiter((ids[u] for u, _ in edges), dtype=np.int64, count=len(edges))
+    dst = np.fromiter((ids[v] for _, v in edges), dtype=np.int64, count=len(edges))
+    return names, types, src, dst
+
+
+# -----------------------------------------------------------
+# ✅ Force-directed (Fruchterman-Reingold, vectorized)
+# -----------------------------------------------------------
+def force_layout(n, src, dst, iterations=60, seed=0):
+    """
+    Fruchterman-Reingold on numpy arrays. Attraction runs over the edge
+    list (O(m) per step); repulsion is exact for small graphs and estimated
+    from a random sample of nodes for large ones, so a step stays O(n * k).
+    """
+    rng = np.random.default_rng(seed)
+    pos = rng.uniform(-1, 1, size=(n, 2))
+    if n < 2:
+        return pos * LEVEL_SEPARATION
+
+    k = np.sqrt(4.0 / n)  # ideal edge length in the unit square
+    temp = 0.1
+    cool = temp / (iterations + 1)
+
+    for _ in range(iterations):
+        disp = np.zeros_like(pos)
+        others = pos if n <= EXACT_REPULSION_LIMIT else pos[rng.choice(n, REPULSION_SAMPLE, replace=False)]
+        weight = 1.0 if n <= EXACT_REPULSION_LIMIT else n / REPULSION_SAMPLE
+
+        for start in range(0, n, 1024):
+            block = pos[start:start + 1024]
+            dx = block[:, :1] - others[:, 0]
+            dy = block[:, 1:] - others[:, 1]
+            force = (k * k * weight) / np.maximum(dx * dx + dy * dy, 1e-6)
+            disp[start:start + 1024, 0] += (dx * force).sum(1)
+            disp[start:start + 1024, 1] += (dy * force).sum(1)
+
+        delta = pos[src] - pos[dst]
+        dist = np.maximum(np.sqrt((delta ** 2).sum(-1)), 1e-3)
+        pull = delta * (dist / k)[:, None]
+        np.subtract.at(disp, src, pull)
+        np.add.at(disp, dst, pull)
+
+        length = np.maximum(np.sqrt((disp ** 2).sum(-1)), 1e-9)
+        pos += disp * (np.minimum(length, temp) / length)[:, None]
+        temp -= cool
+
+    pos -= pos.mean(0)
+    span = np.abs(pos).max() or 1.0
+    # spread to roughly the area vis.js used with springLength=150
+    return pos / span * 150 * np.sqrt(n)
+
+
+# -----------------------------------------------------------
+# ✅ Hierarchical (layered by node type)
+# -----------------------------------------------------------
+def hierarchical_layout(types, src, dst):
+    """
+    One column per node-type layer, left to right. Within a column nodes
+    are ordered by the mean row of their neighbours in earlier columns
+    (a single barycenter sweep), which removes most edge crossings.
+    """
+    n = len(types)
+    layer = np.array([LAYER_OF_TYPE.get(t, LAYER_OF_TYPE["Unknown"]) for t in types])
+    row = np.zeros(n)
+    pos = np.zeros((n, 2))
+
+    both_src = np.concatenate([src, dst])
+    both_dst = np.concatenate([dst, src])
+    for lvl in sorted(set(layer.tolist())):
+        members = np.flatnonzero(layer == lvl)
+        earlier = layer[both_dst] < lvl
+        tally = np.bincount(both_src[earlier], weights=row[both_dst[earlier]], minlength=n)
+        degree = np.bincount(both_src[earlier], minlength=n)
+        bary = np.where(degree > 0, tally / np.maximum(degree, 1), np.inf)
+
+        order = members[np.lexsort((members, bary[members]))]
+        row[order] = np.arange(len(order))
+        pos[order, 0] = lvl * LEVEL_SEPARATION
+        pos[order, 1] = (np.arange(len(order)) - len(order) / 2) * NODE_SPACING
+    return pos
+
+
+def compute_layout(G, layout="Force-Directed", seed=0):
+    """Returns (names, positions) with one (x, y) row per node of `G`."""
+    names, types, src, dst = _arrays(G)
+    if layout == "Hierarchical":
+        pos = hierarchical_layout(types, src, dst)
+    else:
+        pos = force_layout(len(names), src, dst, seed=seed)
+    return names, pos.astype(np.float32)
+
+
+def layout_table(layout):
+    """Name of the stored positions table for `layout`."""
+    return "layout_" + layout.lower().replace("-", "_").replace(" ", "_")
+
+
+def layout_tables(G, layouts=LAYOUTS):
+    """
+    Full-graph positions as {layout_table(layout): node/x/y frame}, for
+    GraphStore(derived=...): the store then serves a slice's positions by
+    node name, and they match what LayoutCache computes for other backends.
+    """
+    tables = {}
+    for layout in layouts:
+        names, xy = compute_layout(G, layout)
+        xy = xy.astype(float)
+        tables[layout_table(layout)] = pd.DataFrame(
+            {"node": [str(n) for n in names], "x": xy[:, 0], "y": xy[:, 1]}
+        )
+    return tables
+
+
+def stored_positions(store, layout, names):
+    """{node: (x, y)} for `names` from a GraphStore written with layout_tables."""
+    df = store.read_table(layout_table(layout), keys=names)
+    if df is None:
+        return {}
+    return dict(zip(df["node"], zip(df["x"], df["y"])))
+
+
+# -----------------------------------------------------------
+# ✅ Per-version layout cache (memory + .npy next to the snapshot)
+# -----------------------------------------------------------
+class LayoutCache:
+    """
+    Computes each layout once per graph version. Positions are kept in
+    memory as {node: (x, y)} for the `maxsize` most recently used
+    (version, layout) pairs and written to `<root>/<version>-<layout>.npy`
+    in graph node order, so a restarted app reuses them as long as the
+    inputs are unchanged.
+    """
+
+    def __init__(self, root=None, maxsize=4):
+        self.root = Path(root) if root else None
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._positions = OrderedDict()
+
+    def _path(self, version, layout):
+        slug = layout.lower().replace(" ", "-")
+        return self.root / f"{version}-{slug}.npy"
+
+    def _load(self, version, layout, n):
+        if self.root is None or version is None:
+            return None
+        path = self._path(version, layout)
+        try:
+            pos = np.load(path, allow_pickle=False)
+        except (OSError, ValueError):
+            return None
+        return pos if pos.shape == (n, 2) else None
+
+    def _save(self, version, layout, pos):
+        if self.root is None or version is None:
+            return
+        path = self._path(version, layout)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, pos, allow_pickle=False)
+        os.replace(tmp, path)
+
+    def get(self, G, version, layout="Force-Directed"):
+        key = (version, layout)
+        with self._lock:
+            if key in self._positions:
+                self._positions.move_to_end(key)
+                return self._positions[key]
+
+            names = list(G)
+            pos = self._load(version, layout, len(names))
+            if pos is None:
+                names, pos = compute_layout(G, layout)
+                self._save(version, layout, pos)
+
+            positions = dict(zip(names, map(tuple, pos.tolist())))
+            self._positions[key] = positions
+            while len(self._positions) > self.maxsize:
+                self._positions.popitem(last=False)
+            return positions
+
+    def clear(self):
+        with self._lock:
+            self._positions.clear()
@@ -0,0 +1,205 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from csr_graph import CSRGraph
+
+# -----------------------------------------------------------
+# ✅ Binary graph snapshot (.kgs)
+# -----------------------------------------------------------
+#
+#   header   MAGIC, format version, section count
+#   toc      (offset, length) per section, in SECTIONS order
+#   sections each 8-byte aligned, little-endian, raw array bytes
+#
+# Every array maps straight onto the file with np.frombuffer, so opening a
+# snapshot is an mmap plus bounds checks; nothing is unpickled.
+
+MAGIC = b"KGSNAP\0\0"
+VERSION = 1
+
+SECTIONS = [
+    ("meta", np.uint8),         # JSON: type/relation labels + caller metadata
+    ("str_offsets", "<i8"),     # n_nodes + 1 byte offsets into str_pool
+    ("str_pool", np.uint8),     # UTF-8 node names, concatenated
+    ("node_type", np.int8),
+    ("src", "<i4"),
+    ("dst", "<i4"),
+    ("rel", np.int8),
+    ("succ_ptr", "<i8"),
+    ("succ_idx", "<i4"),
+    ("succ_rel", np.int8),
+    ("pred_ptr", "<i8"),
+    ("pred_idx", "<i4"),
+    ("pred_rel", np.int8),
+]
+
+_HEADER = struct.Struct("<8sII")
+_TOC = struct.Struct("<QQ")
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def _align(n):
+    return (n + 7) & ~7
+
+
+def dump_snapshot(G, meta=None):
+    """Serializes a CSRGraph (or networkx DiGraph) to snapshot bytes."""
+    if not isinstance(G, CSRGraph):
+        G = CSRGraph.from_networkx(G)
+
+    encoded = [str(n).encode("utf-8") for n in G.names]
+    offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+
+    header_meta = {
+        "types": G.type_names,
+        "relations": G.relation_names,
+        "meta": meta or {},
+    }
+    arrays = {
+        "meta": np.frombuffer(json.dumps(header_meta).encode("utf-8"), dtype=np.uint8),
+        "str_offsets": offsets,
+        "str_pool": np.frombuffer(b"".join(encoded), dtype=np.uint8),
+        "node_type": G.node_type,
+        "src": G.src,
+        "dst": G.dst,
+        "rel": G.rel,
+        "succ_ptr": G.succ_ptr,
+        "succ_idx": G.succ_idx,
+        "succ_rel": G.succ_rel,
+        "pred_ptr": G.pred_ptr,
+        "pred_idx": G.pred_idx,
+        "pred_rel": G.pred_rel,
+    }
+
+    pos = _align(_HEADER.size + _TOC.size * len(SECTIONS))
+    toc, chunks = [], []
+    for name, dtype in SECTIONS:
+        data = np.ascontiguousarray(arrays[name], dtype=dtype).tobytes()
+        toc.append((pos, len(data)))
+        pad = _align(len(data)) - len(data)
+        chunks.append(data + b"\0" * pad)
+        pos += len(data) + pad
+
+    head = _HEADER.pack(MAGIC, VERSION, len(SECTIONS)) + b"".join(_TOC.pack(*t) for t in toc)
+    head += b"\0" * (_align(len(head)) - len(head))
+    return head + b"".join(chunks)
+
+
+def save_snapshot(G, path, meta=None):
+    """Writes a snapshot atomically (readers never see a half-written file)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(dump_snapshot(G, meta))
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, path)
+    return path
+
+
+# -----------------------------------------------------------
+# ✅ Loading (validated; safe on untrusted input)
+# -----------------------------------------------------------
+def _sections(buf):
+    if len(buf) < _HEADER.size:
+        raise SnapshotError("file too small")
+    magic, version, count = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise SnapshotError("not a graph snapshot")
+    if version != VERSION:
+        raise SnapshotError(f"unsupported snapshot version {version}")
+    if count != len(SECTIONS):
+        raise SnapshotError("unexpected section count")
+    if len(buf) < _HEADER.size + _TOC.size * count:
+        raise SnapshotError("truncated table of contents")
+
+    out = {}
+    for i, (name, dtype) in enumerate(SECTIONS):
+        offset, length = _TOC.unpack_from(buf, _HEADER.size + _TOC.size * i)
+        itemsize = np.dtype(dtype).itemsize
+        if offset + length > len(buf) or length % itemsize:
+            raise SnapshotError(f"section {name} out of bounds")
+        out[name] = np.frombuffer(buf, dtype=dtype, count=length // itemsize, offset=offset)
+    return out
+
+
+def _check(cond, what):
+    if not cond:
+        raise SnapshotError(f"corrupt snapshot: {what}")
+
+
+def _validate(s, n_types, n_rels):
+    n = len(s["node_type"])
+    m = len(s["src"])
+    offsets = s["str_offsets"]
+
+    _check(len(offsets) == n + 1 and offsets[0] == 0, "string offsets")
+    _check(offsets[-1] == len(s["str_pool"]) and np.all(np.diff(offsets) >= 0), "string offsets")
+    _check(len(s["dst"]) == m and len(s["rel"]) == m, "edge arrays")
+    _check(not n or (s["node_type"].min() >= 0 and s["node_type"].max() < n_types), "node types")
+    _check(not m or (s["rel"].min() >= 0 and s["rel"].max() < n_rels), "relations")
+    for key in ("src", "dst"):
+        _check(not m or (s[key].min() >= 0 and s[key].max() < n), f"{key} ids")
+
+    for side in ("succ", "pred"):
+        ptr, idx, rel = s[f"{side}_ptr"], s[f"{side}_idx"], s[f"{side}_rel"]
+        _check(len(ptr) == n + 1 and ptr[0] == 0 and ptr[-1] == m, f"{side} pointers")
+        _check(np.all(np.diff(ptr) >= 0), f"{side} pointers")
+        _check(len(idx) == m and len(rel) == m, f"{side} arrays")
+        _check(not m or (idx.min() >= 0 and idx.max() < n), f"{side} ids")
+        _check(not m or (rel.min() >= 0 and rel.max() < n_rels), f"{side} relations")
+
+
+def loads_snapshot(buf):
+    """Builds a CSRGraph over `buf` (bytes or mmap) without copying the arrays."""
+    s = _sections(buf)
+    try:
+        header_meta = json.loads(s["meta"].tobytes().decode("utf-8"))
+        type_names = [str(t) for t in header_meta["types"]]
+        relation_names = [str(r) for r in header_meta["relations"]]
+        meta = header_meta.get("meta") or {}
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise SnapshotError(f"corrupt snapshot metadata: {e}") from None
+    if not isinstance(meta, dict):
+        raise SnapshotError("corrupt snapshot metadata: meta is not an object")
+
+    _validate(s, len(type_names), len(relation_names))
+
+    pool = s["str_pool"].tobytes()
+    offsets = s["str_offsets"].tolist()
+    try:
+        names = [pool[a:b].decode("utf-8") for a, b in zip(offsets, offsets[1:])]
+    except UnicodeDecodeError:
+        raise SnapshotError("corrupt snapshot: node names") from None
+    names_arr = np.empty(len(names), dtype=object)
+    names_arr[:] = names
+
+    G = CSRGraph(
+        names_arr, s["node_type"], s["src"], s["dst"], s["rel"],
+        type_names, relation_names,
+        csr=(s["succ_ptr"], s["succ_idx"], s["succ_rel"],
+             s["pred_ptr"], s["pred_idx"], s["pred_rel"]),
+    )
+    G.meta = meta
+    return G
+
+
+def load_snapshot(path):
+    """Memory-maps a snapshot file and returns a read-only CSRGraph."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise SnapshotError("file too small")
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    G = loads_snapshot(buf)
+    G._mmap = buf  # keep the mapping alive as long as the graph
+    return G
@@ -0,0 +1,368 @@
+import json
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+
+import networkx as nx
+import pandas as pd
+
+from profiling import count, span
+
+STORE_VERSION = 1   # bump when the schema changes; older stores are rebuilt
+MIN_TRIGRAM = 3     # shorter keywords fall back to a LIKE scan
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS nodes (
+    id      INTEGER PRIMARY KEY,
+    name    TEXT NOT NULL,
+    type    TEXT NOT NULL,
+    summary TEXT
+);
+CREATE TABLE IF NOT EXISTS edges (
+    src      INTEGER NOT NULL,
+    dst      INTEGER NOT NULL,
+    relation TEXT NOT NULL,
+    PRIMARY KEY (src, dst)
+) WITHOUT ROWID;
+"""
+
+# Dropped during a bulk write and rebuilt once afterwards
+INDEXES = """
+CREATE UNIQUE INDEX IF NOT EXISTS nodes_name ON nodes(name);
+CREATE INDEX IF NOT EXISTS nodes_type ON nodes(type);
+CREATE INDEX IF NOT EXISTS edges_dst ON edges(dst, src);
+CREATE INDEX IF NOT EXISTS edges_relation ON edges(relation);
+"""
+DROP_INDEXES = """
+DROP INDEX IF EXISTS nodes_name;
+DROP INDEX IF EXISTS nodes_type;
+DROP INDEX IF EXISTS edges_dst;
+DROP INDEX IF EXISTS edges_relation;
+"""
+
+# Keyword search: a trigram full-text index over name + summary answers
+# substring queries without scanning the nodes table
+FTS_SCHEMA = "CREATE VIRTUAL TABLE IF NOT EXISTS node_text USING fts5(text, tokenize='trigram')"
+
+
+def _ids(values):
+    """Integer ids as one JSON parameter (expanded in SQL with json_each)."""
+    return json.dumps([int(v) for v in values])
+
+
+def _in(column, values):
+    """`column IN (?, ?, ...)` and its parameters; no filter for None."""
+    if values is None:
+        return "1", []
+    values = list(values)
+    return f"{column} IN ({', '.join('?' * len(values))})" if values else "0", values
+
+
+# -----------------------------------------------------------
+# ✅ SQLite graph store
+# -----------------------------------------------------------
+class GraphStore:
+    """
+    Nodes, typed edges and metadata in one SQLite file (no server).
+
+    Nodes are indexed by name and type, edges by both endpoints and by
+    relation, so keyword / type seeds and each BFS hop are index lookups,
+    and a query only loads the slice it returns. The same graph can be
+    queried from several threads: each one gets its own connection, and
+    WAL mode lets readers run while a rebuild is being written.
+
+    `derived` (G -> {name: DataFrame}) computes extra tables, e.g. the
+    graph_analytics tables or full-graph layout positions, that are
+    written in the same transaction as the graph, so they always describe
+    the stored version. Each is indexed on its first column, so rows for
+    a slice of the graph can be looked up by key.
+    """
+
+    def __init__(self, path="data/cache/kg_graph.sqlite", derived=None):
+        self.path = Path(path)
+        self.derived = derived
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path)) as con:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.executescript(SCHEMA)
+            con.executescript(INDEXES)
+            try:
+                con.execute(FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError:
+                # SQLite < 3.34 has no trigram tokenizer; search scans instead
+                self.fts = False
+            con.commit()
+
+    @property
+    def _con(self):
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(self.path)
+            con.execute("PRAGMA query_only=ON")
+            self._local.con = con
+        return con
+
+    def _query(self, sql, params=()):
+        return self._con.execute(sql, params).fetchall()
+
+    # -------------------------------------------------------
+    # Metadata
+    # -------------------------------------------------------
+    def meta(self):
+        return {k: json.loads(v) for k, v in self._query("SELECT key, value FROM meta")}
+
+    @property
+    def version(self):
+        """Version stamp of the stored graph (None if empty or from an older schema)."""
+        meta = self.meta()
+        if meta.get("store_version") != STORE_VERSION:
+            return None
+        return meta.get("version")
+
+    def number_of_nodes(self):
+        return self.meta().get("nodes", 0)
+
+    def number_of_edges(self):
+        return self.meta().get("edges", 0)
+
+    # -------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------
+    def write(self, G, version, summaries=None, meta=None):
+        """
+        Replaces the stored graph with G (networkx DiGraph or CSRGraph) in one
+        transaction; readers keep seeing the previous graph until it commits.
+        """
+        summaries = summaries or {}
+        with self._write_lock, span("graph_store.write") as facts, \
+                closing(sqlite3.connect(self.path, isolation_level=None)) as con:
+            # one explicit transaction (executescript would commit halfway);
+            # closing without COMMIT rolls everything back
+            con.execute("BEGIN")
+            for stmt in DROP_INDEXES.strip().splitlines():
+                con.execute(stmt)
+            con.execute("DELETE FROM edges")
+            con.execute("DELETE FROM nodes")
+            if self.fts:
+                con.execute("DELETE FROM node_text")
+
+            ids = {}
+            rows = []
+            for i, (n, d) in enumerate(G.nodes(data=True)):
+                ids[n] = i
+                rows.append((i, str(n), d.get("type", "Unknown"), summaries.get(n)))
+            con.executemany("INSERT INTO nodes (id, name, type, summary) VALUES (?, ?, ?, ?)", rows)
+            if self.fts:
+                con.executemany(
+                    "INSERT INTO node_text (rowid, text) VALUES (?, ?)",
+                    ((i, name if not summary else f"{name}\n{summary}") for i, name, _, summary in rows),
+                )
+            con.executemany(
+                "INSERT OR REPLACE INTO edges (src, dst, relation) VALUES (?, ?, ?)",
+                ((ids[u], ids[v], d.get("relation", "")) for u, v, d in G.edges(data=True)),
+            )
+            for stmt in INDEXES.strip().splitlines():
+                con.execute(stmt)
+
+            info = {**(meta or {}), "store_version": STORE_VERSION, "version": version,
+                    "nodes": len(rows), "edges": G.number_of_edges()}
+            con.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                            ((k, json.dumps(v)) for k, v in info.items()))
+            if self.derived is not None:
+                with span("graph_store.derived"):
+                    self._write_tables(con, self.derived(G))
+            con.execute("COMMIT")
+            con.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            facts.update(nodes=len(rows), edges=info["edges"])
+        return self
+
+    # -------------------------------------------------------
+    # Derived tables (stored next to the graph)
+    # -------------------------------------------------------
+    @staticmethod
+    def _table(name):
+        if not re.fullmatch(r"\w+", name):
+            raise ValueError(f"bad table name: {name!r}")
+        return f'"table_{name}"'
+
+    def _write_tables(self, con, tables):
+        for name, df in tables.items():
+            table = self._table(name)
+            cols = ", ".join('"' + str(c).replace('"', '""') + '"' for c in df.columns)
+            con.execute(f"DROP TABLE IF EXISTS {table}")
+            con.execute(f"CREATE TABLE {table} ({cols})")
+            if len(df.columns):
+                marks = ", ".join("?" * len(df.columns))
+                con.executemany(f"INSERT INTO {table} VALUES ({marks})",
+                                df.astype(object).where(df.notna(), None).itertuples(index=False))
+                index = self._table(f"{name}_key")
+                con.execute(f"CREATE INDEX {index} ON {table} ({cols.split(', ')[0]})")
+
+    def write_tables(self, tables):
+        """Replaces some derived tables (e.g. after an incremental refresh)."""
+        with self._write_lock, closing(sqlite3.connect(self.path, isolation_level=None)) as con:
+            con.execute("BEGIN")
+            self._write_tables(con, tables)
+            con.execute("COMMIT")
+
+    def read_table(self, name, keys=None):
+        """
+        A derived table as a DataFrame (None if it was never written); with
+        `keys`, only the rows whose first column is one of them.
+        """
+        sql = f"SELECT * FROM {self._table(name)}"
+        params = ()
+        if keys is not None:
+            sql = (f"SELECT t.* FROM {self._table(name)} t "
+                   f"JOIN json_each(?) k ON k.value = t.{self._first_column(name)}")
+            params = (json.dumps(list(dict.fromkeys(keys))),)
+        try:
+            return pd.read_sql_query(sql, self._con, params=params)
+        except (pd.errors.DatabaseError, sqlite3.OperationalError):
+            return None
+
+    def _first_column(self, name):
+        cols = self._query(f"PRAGMA table_info({self._table(name)})")
+        return '"' + cols[0][1].replace('"', '""') + '"' if cols else "NULL"
+
+    # -------------------------------------------------------
+    # Queries (each returns only the requested slice)
+    # -------------------------------------------------------
+    def search(self, keyword, types=None, limit=None):
+        """
+        Ids of nodes whose name or summary contains `keyword` (case-insensitive),
+        lowest ids first; an empty keyword matches every node of `types`.
+        """
+        kw = keyword.lower().strip()
+        type_sql, type_params = _in("n.type", types)
+        limit_sql = f" LIMIT {int(limit)}" if limit is not None else ""
+        if not kw:
+            return [i for i, in self._query(
+                f"SELECT n.id FROM nodes n WHERE {type_sql} ORDER BY n.id{limit_sql}", type_params)]
+
+        if self.fts and len(kw) >= MIN_TRIGRAM:
+            sql = (f"SELECT n.id FROM node_text t JOIN nodes n ON n.id = t.rowid "
+                   f"WHERE t.text MATCH ? AND {type_sql} ORDER BY n.id{limit_sql}")
+            params = ['"' + kw.replace('"', '""') + '"'] + type_params
+        else:
+            pattern = "%" + kw.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            sql = (f"SELECT n.id FROM nodes n WHERE {type_sql} AND "
+                   f"(lower(n.name) LIKE ? ESCAPE '\\' OR lower(coalesce(n.summary, '')) LIKE ? ESCAPE '\\') "
+                   f"ORDER BY n.id{limit_sql}")
+            params = type_params + [pattern, pattern]
+        return [i for i, in self._query(sql, params)]
+
+    def ids_of(self, names):
+        names = [str(n) for n in names]
+        return [i for i, in self._query(
+            "SELECT id FROM nodes WHERE name IN (SELECT value FROM json_each(?)) ORDER BY id",
+            (json.dumps(names),),
+        )]
+
+    def _neighbors(self, frontier, relations, node_types):
+        rel_sql, rel_params = _in("e.relation", relations)
+        type_sql, type_params = _in("n.type", node_types)
+        sql = f"""
+            SELECT n.id FROM edges e JOIN nodes n ON n.id = e.dst
+             WHERE e.src IN (SELECT value FROM json_each(?)) AND {rel_sql} AND {type_sql}
+            UNION
+            SELECT n.id FROM edges e JOIN nodes n ON n.id = e.src
+             WHERE e.dst IN (SELECT value FROM json_each(?)) AND {rel_sql} AND {type_sql}
+            ORDER BY 1
+        """
+        frontier = _ids(frontier)
+        params = [frontier] + rel_params + type_params + [frontier] + rel_params + type_params
+        return [i for i, in self._query(sql, params)]
+
+    def expand(self, seeds, hops, relations=None, node_types=None, max_nodes=None):
+        """
+        Frontier BFS over both edge directions, one indexed query per hop.
+        Returns (kept ids, truncated). Seeds, then each hop's new nodes, are
+        taken in id order (the node order of the written graph), as
+        CSRGraph.expand does, so when `max_nodes` cuts a hop short both keep
+        the same nodes. expansion.expand_neighborhood keeps discovery order
+        instead, so a truncated networkx result may differ.
+        """
+        keep = dict.fromkeys(sorted(set(seeds)))
+        truncated = max_nodes is not None and len(keep) > max_nodes
+        if truncated:
+            keep = dict.fromkeys(list(keep)[:max_nodes])
+
+        frontier = list(keep)
+        for _ in range(hops):
+            if truncated or not frontier:
+                break
+            nbrs = [i for i in self._neighbors(frontier, relations, node_types) if i not in keep]
+            if max_nodes is not None and len(keep) + len(nbrs) > max_nodes:
+                truncated = True
+                nbrs = nbrs[:max_nodes - len(keep)]
+            keep.update(dict.fromkeys(nbrs))
+            frontier = nbrs
+        return list(keep), truncated
+
+    def subgraph(self, ids):
+        """Induced subgraph on node ids, loaded into a networkx DiGraph."""
+        ids = _ids(ids)
+        G = nx.DiGraph()
+        names = {}
+        for i, name, ntype in self._query(
+            "SELECT id, name, type FROM nodes WHERE id IN (SELECT value FROM json_each(?)) ORDER BY id",
+            (ids,),
+        ):
+            names[i] = name
+            G.add_node(name, type=ntype)
+        # seek by source only; a second IN on dst makes SQLite rescan the list per row
+        G.add_edges_from(
+            (names[u], names[v], {"relation": rel})
+            for u, v, rel in self._query(
+                "SELECT src, dst, relation FROM edges WHERE src IN (SELECT value FROM json_each(?))",
+                (ids,),
+            )
+            if v in names
+        )
+        count("store_nodes_loaded", G.number_of_nodes())
+        return G
+
+    def neighborhood(self, names, hops=1, relations=None, node_types=None, max_nodes=None):
+        """Subgraph around the named nodes."""
+        keep, _ = self.expand(self.ids_of(names), hops, relations, node_types, max_nodes)
+        return self.subgraph(keep)
+
+    def filter(self, keyword, allowed_types, hops, relations=None, expand_types=None, max_nodes=None):
+        """Same semantics as dashboard.filter_graph, answered by SQL: (subgraph, truncated)."""
+        # one seed past the cap is enough to know the expansion is truncated
+        seeds = self.search(keyword, allowed_types, None if max_nodes is None else max_nodes + 1)
+        if not seeds:
+            return nx.DiGraph(), False
+        keep, truncated = self.expand(seeds, hops, relations, expand_types, max_nodes)
+        return self.subgraph(keep), truncated
+
+    def to_networkx(self):
+        """The whole stored graph (only for graphs that fit in memory)."""
+        return self.subgraph(i for i, in self._query("SELECT id FROM nodes"))
+
+    def to_frames(self):
+        """node/type and source/target/relation tables of the whole graph."""
+        nodes_df = pd.read_sql_query("SELECT name AS node, type FROM nodes ORDER BY id", self._con)
+        edges_df = pd.read_sql_query(
+            "SELECT s.name AS source, d.name AS target, e.relation FROM edges e "
+            "JOIN nodes s ON s.id = e.src JOIN nodes d ON d.id = e.dst",
+            self._con,
+        )
+        return nodes_df, edges_df
+
+    def dump_bytes(self):
+        """The database as bytes (a consistent copy, e.g. for a download)."""
+        return self._con.serialize()
+
+    def close(self):
+        con = getattr(self._local, "con", None)
+        if con is not None:
+            con.close()
+            self._local.con = None
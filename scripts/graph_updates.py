@@ -0,0 +1,303 @@
+import networkx as nx
+
+from skill_taxonomy import default_taxonomy
+
+
+def split_list(value, lower=False):
+    items = [s.strip() for s in str(value).split(",") if s.strip()]
+    return [s.lower() for s in items] if lower else items
+
+
+# -----------------------------------------------------------
+# ✅ Incremental graph updates
+# -----------------------------------------------------------
+class GraphUpdater:
+    """
+    Patches a built knowledge graph in place from row-level deltas instead
+    of rebuilding it from the CSVs.
+
+    The graph follows the dashboard's conventions (graph_builder.DASHBOARD):
+    skills are lower-cased Skill nodes and trainer → course "teaches" edges
+    are derived from a trainer skill appearing in the course's module text.
+    derive_relevant=True also adds the batch pipeline's skill → module
+    "relevant_to" edges (a skill appearing in the module name);
+    derive_teaches=False leaves "teaches" alone.
+
+    Only the links touched by a delta are recomputed: a course change
+    rescans that course's modules, a trainer change looks up its skills in
+    the skill → course index, and a skill entering the vocabulary is
+    scanned for on its own.
+    """
+
+    def __init__(self, G=None, derive_teaches=True, derive_relevant=False):
+        self.G = G if G is not None else nx.DiGraph()
+        self.derive_teaches = derive_teaches
+        self.derive_relevant = derive_relevant
+        self.revision = 0
+        self.listeners = []          # objects with node_added(n) / node_removed(n)
+
+        self.course_text = {}        # course -> module text it was listed with
+        self.courses_by_skill = {}   # skill -> courses whose text mentions it
+        self._matcher = None
+        self._index()
+
+    # -------------------------------------------------------
+    # Indexes
+    # -------------------------------------------------------
+    def _index(self):
+        G = self.G
+        for n, d in G.nodes(data=True):
+            if d.get("type") == "Course":
+                mods = [v for v in G.successors(n) if G[n][v].get("relation") == "has_module"]
+                if mods:
+                    self.course_text[n] = ", ".join(mods)
+
+        for course, text in self.course_text.items():
+            for sk in self.matcher.match_keys(text):
+                self.courses_by_skill.setdefault(sk, set()).add(course)
+
+    def skills(self):
+        return [n for n, d in self.G.nodes(data=True) if d.get("type") == "Skill"]
+
+    @property
+    def matcher(self):
+        if self._matcher is None:
+            self._matcher = default_taxonomy().linker(self.skills())
+        return self._matcher
+
+    def _add_node(self, n, type):
+        new = n not in self.G
+        self.G.add_node(n, type=type)
+        if new:
+            for listener in self.listeners:
+                listener.node_added(n)
+
+    def _remove_node(self, n):
+        self.G.remove_node(n)
+        for listener in self.listeners:
+            listener.node_removed(n)
+
+    def _related(self, n, relation, incoming=False):
+        G = self.G
+        if n not in G:
+            return []
+        if incoming:
+            return [u for u in G.predecessors(n) if G[u][n].get("relation") == relation]
+        return [v for v in G.successors(n) if G[n][v].get("relation") == relation]
+
+    def _drop_if_orphan(self, n, relation):
+        if n in self.G and not self._related(n, relation, incoming=True):
+            self._remove_node(n)
+            return True
+        return False
+
+    # -------------------------------------------------------
+    # Courses
+    # -------------------------------------------------------
+    def upsert_course(self, course, modules, merge=False):
+        """
+        Add or re-extract a course; `modules` is a list or comma-separated
+        string. merge=True adds them to the course's current modules instead
+        of replacing them (a course listed on several CSV rows).
+        """
+        G = self.G
+        course = course.strip()
+        if not course:
+            return
+        if isinstance(modules, str):
+            modules = split_list(modules)
+
+        old = set(self._related(course, "has_module"))
+        text = ", ".join(modules)
+        if merge and course in self.course_text:
+            text = ", ".join([self.course_text[course]] + ([text] if text else []))
+
+        self._add_node(course, "Course")
+        for m in modules:
+            if m not in G:
+                self._add_node(m, "Module")
+            G.add_edge(course, m, relation="has_module")
+
+        if not merge:
+            for m in old - set(modules):
+                G.remove_edge(course, m)
+                self._drop_if_orphan(m, "has_module")
+
+        if self.derive_relevant:
+            for m in set(modules) - old:
+                for sk in self.matcher.matches(m):
+                    G.add_edge(sk, m, relation="relevant_to")
+
+        self._relink_course(course, text)
+        self.revision += 1
+
+    def remove_course(self, course):
+        G = self.G
+        course = course.strip()
+        for m in self._related(course, "has_module"):
+            G.remove_edge(course, m)
+            self._drop_if_orphan(m, "has_module")
+
+        self._relink_course(course, None)
+        if course in G and not self._related(course, "enrolled_in", incoming=True):
+            self._remove_node(course)
+        self.revision += 1
+
+    def _relink_course(self, course, text):
+        """Recompute trainer → course "teaches" edges for one course."""
+        G = self.G
+        for sk in self.matcher.match_keys(self.course_text.get(course, "")):
+            self.courses_by_skill.get(sk, set()).discard(course)
+
+        if text is None:
+            self.course_text.pop(course, None)
+        else:
+            self.course_text[course] = text
+            for sk in self.matcher.match_keys(text):
+                self.courses_by_skill.setdefault(sk, set()).add(course)
+
+        if not self.derive_teaches or course not in G:
+            return
+
+        for t in self._related(course, "teaches", incoming=True):
+            G.remove_edge(t, course)
+        if text is not None:
+            for sk in self.matcher.match_keys(text):
+                for t in self._related(sk, "skilled_in", incoming=True):
+                    G.add_edge(t, course, relation="teaches")
+
+    # -------------------------------------------------------
+    # Trainers
+    # -------------------------------------------------------
+    def set_trainer_skills(self, trainer, skills):
+        """Replace a trainer's skill list; `skills` is a list or comma-separated string."""
+        G = self.G
+        trainer = trainer.strip()
+        if isinstance(skills, str):
+            skills = split_list(skills, lower=True)
+        else:
+            skills = [s.strip().lower() for s in skills if s.strip()]
+
+        self._add_node(trainer, "Trainer")
+        old = set(self._related(trainer, "skilled_in"))
+
+        dropped = [sk for sk in old - set(skills) if self._unlink_skill(trainer, sk)]
+        new_vocab = [sk for sk in skills if sk not in G]
+        for sk in skills:
+            self._add_node(sk, "Skill")
+            G.add_edge(trainer, sk, relation="skilled_in")
+
+        if dropped or new_vocab:
+            self._matcher = None
+        if new_vocab:
+            self._scan_new_skills(new_vocab)
+
+        if self.derive_teaches:
+            for c in self._related(trainer, "teaches"):
+                G.remove_edge(trainer, c)
+            for sk in skills:
+                for c in self.courses_by_skill.get(sk, ()):
+                    G.add_edge(trainer, c, relation="teaches")
+        self.revision += 1
+
+    def remove_trainer(self, trainer):
+        trainer = trainer.strip()
+        if trainer not in self.G:
+            return
+        self.set_trainer_skills(trainer, [])
+        self._remove_node(trainer)
+
+    def _unlink_skill(self, trainer, sk):
+        """Drop trainer → skill; returns True if the skill left the vocabulary."""
+        self.G.remove_edge(trainer, sk)
+        if self._drop_if_orphan(sk, "skilled_in"):
+            self.courses_by_skill.pop(sk, None)
+            return True
+        return False
+
+    def _scan_new_skills(self, new_skills):
+        """Find courses/modules mentioning skills that just joined the vocabulary."""
+        G = self.G
+        m = default_taxonomy().linker(new_skills)
+        for course, text in self.course_text.items():
+            for sk in m.match_keys(text):
+                self.courses_by_skill.setdefault(sk, set()).add(course)
+
+        if self.derive_relevant:
+            modules = [n for n, d in G.nodes(data=True) if d.get("type") == "Module"]
+            for mod in modules:
+                for sk in m.matches(mod):
+                    G.add_edge(sk, mod, relation="relevant_to")
+
+    # -------------------------------------------------------
+    # Students
+    # -------------------------------------------------------
+    def enroll(self, student, course):
+        G = self.G
+        student, course = student.strip(), course.strip()
+        if not student:
+            return
+        self._add_node(student, "Student")
+        if course:
+            if course not in G:
+                self._add_node(course, "Course")
+            G.add_edge(student, course, relation="enrolled_in")
+        self.revision += 1
+
+    def unenroll(self, student, course):
+        """Drop one enrollment; a student left without enrollments is removed."""
+        G = self.G
+        student, course = student.strip(), course.strip()
+        if G.has_edge(student, course):
+            G.remove_edge(student, course)
+            if course not in self.course_text and G.degree(course) == 0:
+                self._remove_node(course)
+        if student in G and G.nodes[student].get("type") == "Student" \
+                and not self._related(student, "enrolled_in"):
+            self._remove_node(student)
+        self.revision += 1
+
+    def remove_student(self, student):
+        for c in self._related(student.strip(), "enrolled_in"):
+            self.unenroll(student, c)
+        if student.strip() in self.G:
+            self._remove_node(student.strip())
+
+    # -------------------------------------------------------
+    # Row-level deltas (same shape as the input CSVs)
+    # -------------------------------------------------------
+    def apply_rows(self, kind, rows):
+        """
+        kind: "courses"        rows with course_name, modules
+              "trainer_skills" rows with trainer_name, skills
+              "students"       rows with student_name, enrolled
+
+        A row carrying `"deleted": True` removes the entity (or, for
+        students, that single enrollment; a student left without any is
+        removed too). Rows of one course within a call are merged, as the
+        builder does, so a course listed twice keeps both rows' modules.
+        """
+        listed = set()     # courses already upserted by this call
+        for r in rows:
+            deleted = bool(r.get("deleted"))
+            if kind == "courses":
+                course = str(r["course_name"]).strip()
+                if deleted:
+                    self.remove_course(course)
+                    listed.discard(course)
+                else:
+                    self.upsert_course(course, str(r.get("modules", "")), merge=course in listed)
+                    listed.add(course)
+            elif kind == "trainer_skills":
+                if deleted:
+                    self.remove_trainer(str(r["trainer_name"]))
+                else:
+                    self.set_trainer_skills(str(r["trainer_name"]), str(r.get("skills", "")))
+            elif kind == "students":
+                if deleted:
+                    self.unenroll(str(r["student_name"]), str(r.get("enrolled", "")))
+                else:
+                    self.enroll(str(r["student_name"]), str(r.get("enrolled", "")))
+            else:
+                raise ValueError(f"Unknown delta kind: {kind}")
+        return self.G
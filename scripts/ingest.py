@@ -0,0 +1,42 @@
+import pandas as pd
+
+
+# -----------------------------------------------------------
+# ✅ Vectorized CSV → edge-list helpers
+# -----------------------------------------------------------
+def clean_column(series, lower=False):
+    s = series.fillna("").astype(str).str.strip()
+    return s.str.lower() if lower else s
+
+
+def explode_list_column(df, key_col, list_col, lower=False):
+    """
+    Splits a comma-separated column into a long (key, item) frame in one
+    pass of pandas string ops, e.g. course_name/modules → one row per module.
+
+    Keys are stripped; empty keys and empty items are dropped. `lower`
+    lower-cases the items (the dashboard stores skills lower-cased). The
+    index of each output row is the index of the row it came from.
+    """
+    if df.empty:
+        return pd.DataFrame(columns=[key_col, list_col])
+
+    long = pd.DataFrame({
+        key_col: clean_column(df[key_col]),
+        list_col: df[list_col].fillna("").astype(str).str.split(","),
+    }).explode(list_col)
+
+    long[list_col] = clean_column(long[list_col], lower=lower)
+    return long[(long[key_col] != "") & (long[list_col] != "")]
+
+
+def add_nodes(G, names, type, overwrite=True):
+    """Bulk-add typed nodes; with overwrite=False existing nodes keep their type."""
+    names = pd.unique(pd.Series(names, dtype=object))
+    if not overwrite:
+        names = [n for n in names if n not in G]
+    G.add_nodes_from(names, type=type)
+
+
+def add_edges(G, sources, targets, relation):
+    G.add_edges_from(zip(sources, targets), relation=relation)
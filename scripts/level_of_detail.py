@@ -0,0 +1,112 @@
+import math
+from collections import namedtuple
+
+import networkx as nx
+
+# graph:     display graph (nx.DiGraph) to hand to the renderer
+# groups:    ids of the aggregate nodes that can be expanded
+# truncated: True if the budget still forced nodes/edges to be dropped
+LevelOfDetail = namedtuple("LevelOfDetail", ["graph", "groups", "truncated"])
+
+# (member type, relation tying it to a course, member is the edge source)
+COLLAPSE_STAGES = [
+    ("Student", "enrolled_in", True),
+    ("Module", "has_module", False),
+]
+
+
+def group_id(member_type, owner):
+    return f"{member_type}s · {owner}"
+
+
+# -----------------------------------------------------------
+# ✅ Aggregation
+# -----------------------------------------------------------
+def _collapse(types, edges, member_type, relation, member_is_src, expanded):
+    """Folds members of one type into one count node per owning course."""
+    owners = {}
+    for u, v, rel, _ in edges:
+        member, owner = (u, v) if member_is_src else (v, u)
+        if rel == relation and types.get(member) == member_type:
+            owners.setdefault(member, set()).add(owner)
+
+    mapping, counts, anchors = {}, {}, {}
+    for n, t in types.items():
+        if t != member_type:
+            continue
+        groups = {group_id(member_type, o): o for o in owners.get(n, {"(unassigned)"})}
+        if groups.keys() & expanded:
+            continue
+        mapping[n] = set(groups)
+        anchors.update(groups)
+        for g in groups:
+            counts[g] = counts.get(g, 0) + 1
+
+    if not mapping:
+        return types, edges, {}, {}
+
+    new_types = {n: t for n, t in types.items() if n not in mapping}
+    for g in counts:
+        new_types[g] = f"{member_type} Group"
+
+    merged = {}
+    for u, v, rel, c in edges:
+        for a in mapping.get(u, (u,)):
+            for b in mapping.get(v, (v,)):
+                if a != b:
+                    merged[(a, b, rel)] = merged.get((a, b, rel), 0) + c
+    edges = [(a, b, rel, c) for (a, b, rel), c in merged.items()]
+    return new_types, edges, counts, anchors
+
+
+def level_of_detail(G, node_budget=400, edge_budget=1500, expanded=()):
+    """
+    Shrinks a (sub)graph to a render budget.
+
+    Students are first folded into one "N students" node per course, then
+    modules into one node per course, until the graph fits. Group ids listed
+    in `expanded` are left unfolded. If the graph still does not fit, the
+    highest-degree nodes are kept and the remaining edges are cut.
+    """
+    types = {n: d.get("type", "Unknown") for n, d in G.nodes(data=True)}
+    edges = [(u, v, d.get("relation", ""), 1) for u, v, d in G.edges(data=True)]
+    expanded = set(expanded)
+    counts, anchors = {}, {}
+
+    for member_type, relation, member_is_src in COLLAPSE_STAGES:
+        if len(types) <= node_budget and len(edges) <= edge_budget:
+            break
+        types, merged, stage_counts, stage_anchors = _collapse(
+            types, edges, member_type, relation, member_is_src, expanded,
+        )
+        if stage_counts:
+            edges = merged
+            counts.update(stage_counts)
+            anchors.update(stage_anchors)
+
+    truncated = False
+    if len(types) > node_budget:
+        degree = {n: 0 for n in types}
+        for u, v, _, _ in edges:
+            degree[u] += 1
+            degree[v] += 1
+        keep = set(sorted(types, key=lambda n: (n not in counts, -degree[n]))[:node_budget])
+        types = {n: t for n, t in types.items() if n in keep}
+        edges = [e for e in edges if e[0] in keep and e[1] in keep]
+        truncated = True
+    if len(edges) > edge_budget:
+        edges = sorted(edges, key=lambda e: -e[3])[:edge_budget]
+        truncated = True
+
+    D = nx.DiGraph()
+    for n, t in types.items():
+        if n in counts:
+            c = counts[n]
+            D.add_node(n, type=t, count=c, owner=anchors[n],
+                       label=f"{c} {t.split()[0].lower()}s", size=18 + 6 * math.log2(c + 1))
+        else:
+            D.add_node(n, type=t)
+    for u, v, rel, c in edges:
+        D.add_edge(u, v, relation=rel, count=c)
+
+    return LevelOfDetail(D, sorted(counts), truncated)
@@ -0,0 +1,151 @@
+import json
+import re
+from bisect import bisect_left
+from pathlib import Path
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def load_summaries(metadata_json):
+    """Flattens kg_metadata.json ({"courses": {name: summary}, ...}) to {name: summary}."""
+    p = Path(metadata_json)
+    if not p.exists():
+        return {}
+    data = json.loads(p.read_text(encoding="utf-8"))
+    summaries = {}
+    for section in data.values():
+        if isinstance(section, dict):
+            for name, summary in section.items():
+                if isinstance(summary, str):
+                    summaries[name] = summary
+    return summaries
+
+
+# -----------------------------------------------------------
+# ✅ Inverted n-gram / token index over node names
+# -----------------------------------------------------------
+class NodeIndex:
+    """
+    Keyword index over node names (and, optionally, metadata summaries).
+
+    Substring queries intersect the posting lists of the query's character
+    n-grams and only verify the few surviving candidates; prefix queries
+    bisect a sorted token list. Neither touches every node.
+    """
+
+    def __init__(self, G=None, n=3, summaries=None):
+        self.n = n
+        self.summaries = summaries or {}
+        self.texts = {}     # node -> lower-cased searchable text
+        self.grams = {}     # n-gram -> nodes
+        self.tokens = {}    # token -> nodes
+        self._sorted_tokens = None
+        if G is not None:
+            for node in G:
+                self.add(node)
+
+    def __len__(self):
+        return len(self.texts)
+
+    def _grams(self, text):
+        n = self.n
+        if len(text) < n:
+            return {text} if text else set()
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+    def add(self, node):
+        if node in self.texts:
+            return
+        text = str(node).lower()
+        summary = self.summaries.get(node)
+        if summary:
+            text += "\n" + summary.lower()
+
+        self.texts[node] = text
+        for g in self._grams(text):
+            self.grams.setdefault(g, set()).add(node)
+        for tok in TOKEN_RE.findall(text):
+            if tok not in self.tokens:
+                self._sorted_tokens = None
+            self.tokens.setdefault(tok, set()).add(node)
+
+    def remove(self, node):
+        text = self.texts.pop(node, None)
+        if text is None:
+            return
+        for g in self._grams(text):
+            posting = self.grams.get(g)
+            if posting is not None:
+                posting.discard(node)
+                if not posting:
+                    del self.grams[g]
+        for tok in TOKEN_RE.findall(text):
+            posting = self.tokens.get(tok)
+            if posting is not None:
+                posting.discard(node)
+                if not posting:
+                    del self.tokens[tok]
+                    self._sorted_tokens = None
+
+    # GraphUpdater listener hooks
+    def node_added(self, node):
+        self.add(node)
+
+    def node_removed(self, node):
+        self.remove(node)
+
+    # -------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------
+    def search(self, keyword):
+        """Nodes whose text contains `keyword` (case-insensitive substring)."""
+        kw = keyword.lower().strip()
+        if not kw:
+            return set(self.texts)
+
+        if len(kw) >= self.n:
+            postings = sorted((self.grams.get(g, set()) for g in self._grams(kw)), key=len)
+            if not postings[0]:
+                return set()
+            candidates = set(postings[0])
+            for p in postings[1:]:
+                candidates &= p
+                if not candidates:
+                    return set()
+        else:
+            # Short query: union the postings of every n-gram containing it
+            candidates = set()
+            for g, nodes in self.grams.items():
+                if kw in g:
+                    candidates |= nodes
+
+        return {node for node in candidates if kw in self.texts[node]}
+
+    def prefix(self, prefix):
+        """Nodes with a word starting with `prefix`."""
+        p = prefix.lower().strip()
+        if not p:
+            return set(self.texts)
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self.tokens)
+
+        toks = self._sorted_tokens
+        found = set()
+        i = bisect_left(toks, p)
+        while i < len(toks) and toks[i].startswith(p):
+            found |= self.tokens[toks[i]]
+            i += 1
+        return found
+
+    def search_all(self, query):
+        """Multi-term query: nodes containing every whitespace-separated term."""
+        terms = query.split()
+        if not terms:
+            return set(self.texts)
+        result = None
+        for term in sorted(terms, key=len, reverse=True):
+            hits = self.search(term)
+            result = hits if result is None else result & hits
+            if not result:
+                break
+        return result
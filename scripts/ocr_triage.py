@@ -0,0 +1,189 @@
+import csv
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+
+from extraction_cache import ocr_image
+
+# Bump when the triage rules change, so cached whole-PDF texts are redone
+TRIAGE_VERSION = 1
+
+THUMB_RESOLUTION = 36        # cheap preview used to find ink
+INK_THRESHOLD = 48           # grey-level distance from the page background
+BLANK_INK_FRACTION = 0.0005  # below this the page is treated as blank
+MIN_IMAGE_FRACTION = 0.02    # smaller images (logos, icons) are decorative
+REGION_GAP = 0.4             # inches of empty rows that split two regions
+REGION_MARGIN = 6            # points of padding around each region
+MAX_REGIONS = 8
+
+DEFAULT_RESOLUTION = 220
+MIN_RESOLUTION = 150
+MAX_RESOLUTION = 300
+MAX_PIXELS = 12_000_000      # per OCR'd region
+
+OCR_FAILED = "ocr-failed"    # page decision when any region's OCR raised
+
+
+# -----------------------------------------------------------
+# ✅ Triage: decide whether (and where, and how sharp) to OCR
+# -----------------------------------------------------------
+def _image_area(im):
+    return max(im["x1"] - im["x0"], 0) * max(im["bottom"] - im["top"], 0)
+
+
+def native_resolution(images):
+    """Highest dpi the embedded images were scanned at (None if unknown)."""
+    dpis = []
+    for im in images:
+        width = im["x1"] - im["x0"]
+        src = im.get("srcsize")
+        if src and width > 0:
+            dpis.append(src[0] * 72 / width)
+    return max(dpis) if dpis else None
+
+
+def pick_resolution(images):
+    """Render no sharper than the scan itself, within [MIN, MAX] dpi."""
+    dpi = native_resolution(images) or DEFAULT_RESOLUTION
+    return int(min(max(dpi, MIN_RESOLUTION), MAX_RESOLUTION))
+
+
+def ink_regions(page):
+    """
+    Renders a low-res greyscale preview and returns the ink bounding boxes
+    (in PDF points), one per horizontal band separated by blank space, plus
+    the fraction of the page covered by ink.
+    """
+    thumb = np.asarray(page.to_image(resolution=THUMB_RESOLUTION).original.convert("L"), dtype=np.int16)
+    if not thumb.size:
+        return [], 0.0
+
+    background = int(np.median(thumb))
+    mask = np.abs(thumb - background) > INK_THRESHOLD
+    fraction = float(mask.mean())
+    if fraction < BLANK_INK_FRACTION:
+        return [], fraction
+
+    rows = np.flatnonzero(mask.any(axis=1))
+    gap = max(int(REGION_GAP * THUMB_RESOLUTION), 1)
+    bands = np.split(rows, np.flatnonzero(np.diff(rows) > gap) + 1)
+    if len(bands) > MAX_REGIONS:
+        bands = [rows]
+
+    scale = 72 / THUMB_RESOLUTION
+    x0, top0, x1, bottom1 = page.bbox
+    regions = []
+    for band in bands:
+        cols = np.flatnonzero(mask[band[0]:band[-1] + 1].any(axis=0))
+        regions.append((
+            max(x0, x0 + cols[0] * scale - REGION_MARGIN),
+            max(top0, top0 + band[0] * scale - REGION_MARGIN),
+            min(x1, x0 + (cols[-1] + 1) * scale + REGION_MARGIN),
+            min(bottom1, top0 + (band[-1] + 1) * scale + REGION_MARGIN),
+        ))
+    return regions, fraction
+
+
+def triage_page(page):
+    """
+    Returns (decision, regions, resolution):
+      "blank"      nothing drawn on the page (or no visible ink)
+      "decorative" only small images (logos, icons) and no vector drawing
+      "ocr"        OCR the returned regions at `resolution` dpi
+    """
+    page_area = float(page.width * page.height) or 1.0
+    images = [im for im in page.images if _image_area(im) / page_area >= MIN_IMAGE_FRACTION]
+    has_vectors = bool(page.curves or page.rects or page.lines)
+
+    if not images and not has_vectors:
+        return ("decorative" if page.images else "blank"), [], None
+
+    regions, _ = ink_regions(page)
+    if not regions:
+        return "blank", [], None
+    return "ocr", regions, pick_resolution(images)
+
+
+def _fit_resolution(bbox, resolution):
+    width = (bbox[2] - bbox[0]) / 72
+    height = (bbox[3] - bbox[1]) / 72
+    pixels = width * height * resolution * resolution
+    if pixels > MAX_PIXELS:
+        resolution = int(resolution * (MAX_PIXELS / pixels) ** 0.5)
+    return resolution
+
+
+# -----------------------------------------------------------
+# ✅ Page reader (text layer first, triaged OCR second)
+# -----------------------------------------------------------
+def read_page(page, ocr=ocr_image):
+    """
+    Text of one pdfplumber page plus a report row describing what was done.
+    OCR errors (e.g. no tesseract binary) leave the failed regions empty, as
+    before, and mark the page OCR_FAILED so its text is not cached. The
+    resolution reported is the highest dpi any region was rendered at.
+    """
+    start = time.perf_counter()
+    text = page.extract_text() or ""
+    info = {"page": page.page_number, "decision": "text", "resolution": None,
+            "regions": 0, "ocr_pixels": 0, "seconds": 0.0, "chars": 0}
+
+    if not text.strip():
+        decision, regions, resolution = triage_page(page)
+        info["decision"] = decision
+        parts, dpis = [], []
+        for bbox in regions:
+            dpi = _fit_resolution(bbox, resolution)
+            dpis.append(dpi)
+            try:
+                # greyscale: a third of the bytes to hash and OCR, same text
+                image = page.crop(bbox).to_image(resolution=dpi).original.convert("L")
+                info["ocr_pixels"] += image.size[0] * image.size[1]
+                parts.append(ocr(image, dpi) or "")
+            except Exception:
+                info["decision"] = OCR_FAILED
+        info["resolution"] = max(dpis, default=None)
+        info["regions"] = len(regions)
+        text = "\n".join(p for p in parts if p.strip())
+
+    info["seconds"] = round(time.perf_counter() - start, 4)
+    info["chars"] = len(text)
+    return text, info
+
+
+# -----------------------------------------------------------
+# ✅ Per-page report
+# -----------------------------------------------------------
+class OcrReport:
+    """Collects one row per page (or per cached file) and writes CSV / JSON."""
+
+    FIELDS = ["file", "page", "decision", "resolution", "regions", "ocr_pixels", "seconds", "chars"]
+
+    def __init__(self):
+        self.rows = []
+
+    def add(self, file, **info):
+        self.rows.append({"file": str(file), **{k: info.get(k) for k in self.FIELDS[1:]}})
+
+    def summary(self):
+        out = {}
+        for row in self.rows:
+            s = out.setdefault(row["decision"], {"rows": 0, "seconds": 0.0})
+            s["rows"] += 1
+            s["seconds"] += row["seconds"] or 0.0
+        return out
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix.lower() == ".json":
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"pages": self.rows, "summary": self.summary()}, f, indent=2)
+        else:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=self.FIELDS)
+                writer.writeheader()
+                writer.writerows(self.rows)
+        return path
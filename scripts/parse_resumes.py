@@ -1,17 +1,17 @@
 import pdfplumber
 import pandas as pd
 from pathlib import Path
+import csv
+import os
 import re
 
-# Extend/adjust as you like
-DEFAULT_SKILLS = [
-    "python","java","javascript","react","reactjs","node","nodejs","express",
-    "mongodb","sql","linux","cloud","aws","azure","docker","kubernetes",
-    "selenium","automation testing","manual testing","cyber security",
-    "penetration testing","wireshark","metasploit","nmap","burp suite",
-    "html","css","bootstrap","redux","git","github",
-    "data science","machine learning","deep learning","nlp"
-]
+from extraction_cache import cached_pdf_text
+from profiling import add_profile_args, cli_profiler, count, span
+from skill_taxonomy import DEFAULT_TAXONOMY, as_taxonomy
+
+# Skill vocabulary + aliases live in skill_taxonomy (DEFAULT_TAXONOMY, or a
+# file named by KG_SKILL_TAXONOMY)
+DEFAULT_SKILLS = [skill for skill, _ in DEFAULT_TAXONOMY]
 
 def clean_name_from_filename(stem: str) -> str:
     """
@@ -47,44 +47,50 @@ def clean_name_from_filename(stem: str) -> str:
     # (this is simple; you can customize for your names)
     return " ".join(w if w.isupper() and len(w) <= 3 else w.title() for w in s.split())
 
-def extract_text(pdf_path: Path) -> str:
-    """We still read text to mine skills; name comes from filename only."""
-    text = ""
+def iter_page_texts(pdf_path: Path):
+    """Yields the text layer one page at a time, releasing each page after use."""
     try:
         with pdfplumber.open(pdf_path) as pdf:
             for page in pdf.pages:
-                page_text = page.extract_text() or ""
-                text += "\n" + page_text
+                yield page.extract_text() or ""
+                page.close()
     except Exception:
-        # If text layer fails, just return empty; skills will be blank for this file
-        pass
-    return text
+        # Same policy as extract_text: an unreadable file just has no skills
+        return
+
+def _extract_text_uncached(pdf_path: Path) -> str:
+    # If the text layer fails partway, keep what was read; skills may be blank for this file
+    return "".join("\n" + page_text for page_text in iter_page_texts(pdf_path))
+
+def extract_text(pdf_path: Path) -> str:
+    """We still read text to mine skills; name comes from filename only (cached by file content)."""
+    return cached_pdf_text(pdf_path, _extract_text_uncached, "resume-text")
 
 def extract_skills(text: str, vocab=None):
-    """Simple keyword match over résumé text layer."""
-    if vocab is None:
-        vocab = DEFAULT_SKILLS
-    tl = text.lower()
-    found = []
-    for skill in vocab:
-        if skill in tl:
-            found.append(skill.title())
-    # dedupe & sort for consistency
-    return sorted(list(set(found)))
+    """
+    Canonical skills in the résumé text layer (one automaton scan).
+    `vocab` may be a SkillTaxonomy or a plain list; default is the shared taxonomy.
+    """
+    return [skill.title() for skill in as_taxonomy(vocab).extract(text)]
 
 def process_resumes(resume_folder: str, output_csv: str) -> pd.DataFrame:
-    folder = Path(r'D:\knowledge_graph_builder\profiles')
+    folder = Path(resume_folder)
     rows = []
 
-    for pdf in folder.glob("*.pdf"):
-        trainer_name = clean_name_from_filename(pdf.stem)
-        text = extract_text(pdf)
-        skills = extract_skills(text)
-
-        rows.append({
-            "trainer_name": trainer_name,
-            "skills": ", ".join(skills)
-        })
+    with span("process_resumes") as facts:
+        for pdf in sorted(folder.glob("*.pdf")):
+            trainer_name = clean_name_from_filename(pdf.stem)
+            with span("extract_text"):
+                text = extract_text(pdf)
+            with span("extract_skills"):
+                skills = extract_skills(text)
+
+            rows.append({
+                "trainer_name": trainer_name,
+                "skills": ", ".join(skills)
+            })
+        facts["resumes"] = len(rows)
+    count("resumes_parsed", len(rows))
 
     df = pd.DataFrame(rows, columns=["trainer_name", "skills"]).drop_duplicates()
     Path(output_csv).parent.mkdir(parents=True, exist_ok=True)
@@ -92,10 +98,97 @@ def process_resumes(resume_folder: str, output_csv: str) -> pd.DataFrame:
     print(f"✅ Parsed {len(df)} trainers → {output_csv}")
     return df
 
+# ---------------------------
+# Streaming mode (flat memory, resumable)
+# ---------------------------
+def _read_checkpoint(progress_path: Path):
+    """(last finished file, output size after its row), or None."""
+    try:
+        last, size = progress_path.read_text(encoding="utf-8").rsplit("\t", 1)
+        return last, int(size)
+    except (OSError, ValueError):
+        return None
+
+def _write_checkpoint(progress_path: Path, last: str, size: int, sync: bool = False):
+    tmp = progress_path.with_name(progress_path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(f"{last}\t{size}")
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, progress_path)
+
+def process_resumes_streaming(resume_folder: str, output_csv: str, vocab=None, sync_every: int = 100) -> int:
+    """
+    Parses resumes one at a time (text comes from the same cache as
+    extract_text, read page by page on a miss), appending each row to
+    `output_csv` as soon as it is known. Returns the rows written this run.
+
+    Files are taken in name order, and `<output_csv>.progress` holds one
+    checkpoint: the last finished file and the output size after its row.
+    An interrupted run is resumed from there, with the output cut back to
+    that size, so no row is lost or written twice; the checkpoint is
+    removed once the folder is done.
+
+    Unlike process_resumes, repeated rows are kept: deduplicating would mean
+    holding every row. The graph builders merge them anyway.
+    """
+    folder = Path(resume_folder)
+    out = Path(output_csv)
+    progress_path = out.with_name(out.name + ".progress")
+    out.parent.mkdir(parents=True, exist_ok=True)
+
+    checkpoint = _read_checkpoint(progress_path) if out.exists() else None
+    if checkpoint:
+        last, size = checkpoint
+        # drop a row written after the checkpoint, so it is not repeated
+        os.truncate(out, size)
+        print(f"↩️ Resuming after {last}")
+
+    taxonomy = as_taxonomy(vocab)
+    written = 0
+    with span("process_resumes_streaming") as facts, \
+            open(out, "a" if checkpoint else "w", newline="", encoding="utf-8") as f_out:
+        writer = csv.writer(f_out)
+        if not checkpoint:
+            writer.writerow(["trainer_name", "skills"])
+
+        for i, pdf in enumerate(sorted(folder.glob("*.pdf")), 1):
+            if checkpoint and pdf.name <= last:
+                count("resumes_skipped")
+                continue
+
+            with span("extract_text"):
+                text = extract_text(pdf)
+            writer.writerow((clean_name_from_filename(pdf.stem), ", ".join(extract_skills(text, taxonomy))))
+            written += 1
+            count("resumes_parsed")
+
+            # the row must be on disk before the checkpoint moves past it
+            f_out.flush()
+            sync = i % sync_every == 0
+            if sync:
+                os.fsync(f_out.fileno())
+            _write_checkpoint(progress_path, pdf.name, f_out.tell(), sync)
+            if sync:
+                print(f"   … {i} resumes")
+        facts["rows"] = written
+
+    progress_path.unlink(missing_ok=True)
+    print(f"✅ Parsed {written} resumes → {output_csv}")
+    return written
+
 if __name__ == "__main__":
     import argparse
     ap = argparse.ArgumentParser()
     ap.add_argument("--resumes", default="data/resumes")
     ap.add_argument("--out", default="data/output/trainer_skills.csv")
+    ap.add_argument("--stream", action="store_true",
+                    help="Page-by-page parsing with incremental, resumable output")
+    add_profile_args(ap)
     args = ap.parse_args()
-    process_resumes(args.resumes, args.out)
+    with cli_profiler(args):
+        if args.stream:
+            process_resumes_streaming(args.resumes, args.out)
+        else:
+            process_resumes(args.resumes, args.out)
@@ -0,0 +1,406 @@
+"""
+Shortest learning paths, reachability and k-shortest paths over typed edges.
+
+    python scripts/path_index.py --from-type Student --to "Certified Specialist in Data Science"
+    python scripts/path_index.py --from python --to-type Course --max-distance 3
+    python scripts/path_index.py --from python --to "Essential Skill Program Python" --k 3
+
+A PathIndex stores, for every target (by default every Course), the BFS
+level of each node: its hop distance to that target over the chosen
+relations, both edge directions. Distances and reachability are then one
+array lookup, and a shortest path is a walk down the levels, done for a
+whole cohort of sources at once. Nodes with a single neighbour (students,
+mostly) cannot lie inside a path, so they are not stored: their level is
+their neighbour's level + 1. Of two such nodes linked only to each other,
+one is kept.
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse import csgraph
+
+from csr_graph import CSRGraph
+from graph_builder import PIPELINE, build_graph_from_csv
+from graph_store import GraphStore
+from profiling import add_profile_args, cli_profiler, span
+
+UNREACHABLE = 255   # levels are uint8; targets farther than MAX_DEPTH count as unreachable
+MAX_DEPTH = 254
+BFS_CHUNK = 64      # targets per BFS batch (each batch is a float64 chunk × core matrix)
+
+
+def as_csr_graph(G):
+    """CSRGraph for any backend (the store is read as two tables)."""
+    if isinstance(G, CSRGraph):
+        return G
+    if isinstance(G, GraphStore):
+        return CSRGraph.from_frames(*G.to_frames())
+    return CSRGraph.from_networkx(G)
+
+
+# -----------------------------------------------------------
+# ✅ Path index
+# -----------------------------------------------------------
+class PathIndex:
+    """
+    Per-target BFS levels over one graph.
+
+    `targets` (names) or `target_types` choose the nodes paths may end at;
+    other targets are indexed on first use. `relations` restricts which
+    edges paths may follow. Distances are hop counts; -1 / None means
+    unreachable.
+    """
+
+    def __init__(self, G, targets=None, target_types=("Course",), relations=None):
+        C = as_csr_graph(G)
+        self.graph = C
+        self.relations = None if relations is None else set(relations)
+        n = len(C)
+
+        with span("path_index") as facts:
+            emask = np.ones(len(C.src), dtype=bool)
+            if self.relations is not None:
+                codes = [i for i, r in enumerate(C.relation_names) if r in self.relations]
+                emask = np.isin(C.rel, codes)
+            src, dst = C.src[emask].astype(np.int64), C.dst[emask].astype(np.int64)
+            A = sparse.csr_matrix((np.ones(2 * len(src), dtype=np.int8),
+                                   (np.concatenate([src, dst]), np.concatenate([dst, src]))), shape=(n, n))
+            A.sum_duplicates()
+            A.sort_indices()
+            degree = np.diff(A.indptr)
+
+            if targets is not None:
+                target_ids = C.ids_of(targets)
+            else:
+                target_ids = np.flatnonzero(np.isin(C.node_type, C.type_codes(target_types)))
+            is_target = np.zeros(n, dtype=bool)
+            is_target[target_ids] = True
+
+            # leaves hang off their only neighbour (the anchor); the rest is the core
+            leaf = (degree <= 1) & ~is_target
+            only = np.full(n, -1, dtype=np.int64)
+            only[degree == 1] = A.indices[A.indptr[:-1][degree == 1]]
+            # two leaves linked only to each other: the lower id stays in the
+            # core so the other one has an anchor to hang off
+            pair = np.flatnonzero(leaf & (only >= 0))
+            pair = pair[leaf[only[pair]] & (pair < only[pair])]
+            leaf[pair] = False
+            self.core = np.flatnonzero(~leaf)
+            self.pos = np.full(n, -1, dtype=np.int64)
+            self.pos[self.core] = np.arange(len(self.core))
+            self.anchor = np.full(n, -1, dtype=np.int64)
+            hanging = leaf & (only >= 0)
+            self.anchor[hanging] = only[hanging]
+
+            core_adj = A[self.core][:, self.core].tocsr()
+            core_adj.sort_indices()
+            self.adj = core_adj
+            self._edge_owner = np.repeat(np.arange(len(self.core)), np.diff(core_adj.indptr))
+            self.levels = np.empty((0, len(self.core)), dtype=np.uint8)
+            self.rows = {}
+            self.add_targets(target_ids)
+            facts.update(targets=len(self.rows), core=len(self.core), nodes=n)
+
+    def add_targets(self, ids):
+        """BFS from each new core target id (batched), appending its level row."""
+        ids = [i for i in dict.fromkeys(np.asarray(ids, dtype=np.int64).tolist())
+               if i not in self.rows and self.pos[i] >= 0]
+        if not ids:
+            return
+        new = np.empty((len(ids), len(self.core)), dtype=np.uint8)
+        for start in range(0, len(ids), BFS_CHUNK):
+            chunk = ids[start:start + BFS_CHUNK]
+            dist = csgraph.dijkstra(self.adj, directed=False, unweighted=True,
+                                    indices=self.pos[chunk], limit=MAX_DEPTH)
+            dist[np.isinf(dist)] = UNREACHABLE
+            new[start:start + len(chunk)] = dist.astype(np.uint8)
+
+        first = len(self.levels)
+        self.levels = np.vstack([self.levels, new])
+        self.rows.update((i, first + k) for k, i in enumerate(ids))
+
+    def _resolve(self, target):
+        """
+        (target id, core node the walk ends at, its level row). A leaf target
+        is reached through its anchor; an isolated one only from itself.
+        """
+        tid = self.graph.ids.get(target)
+        if tid is None:
+            raise KeyError(f"Unknown node {target!r}")
+        base = tid if self.pos[tid] >= 0 else int(self.anchor[tid])
+        if base < 0:
+            return tid, None, None
+        self.add_targets([base])
+        return tid, base, self.rows[base]
+
+    def _ids(self, names):
+        ids = self.graph.ids
+        return np.fromiter((ids.get(n, -1) for n in names), dtype=np.int64, count=len(names))
+
+    # -------------------------------------------------------
+    # Distances / reachability (vectorized over sources)
+    # -------------------------------------------------------
+    def _distances(self, targets, ids):
+        """(ids × targets) hop distances; -1 if unreachable or unknown."""
+        resolved = [self._resolve(t) for t in targets]
+        out = np.full((len(ids), len(resolved)), -1, dtype=np.int16)
+
+        # each source looks up its own level, or its anchor's (one hop more)
+        col = np.full(len(ids), -1, dtype=np.int64)
+        known = np.flatnonzero(ids >= 0)
+        p = self.pos[ids[known]]
+        a = self.anchor[ids[known]]
+        ap = np.where(a >= 0, self.pos[np.maximum(a, 0)], -1)
+        col[known] = np.where(p >= 0, p, ap)
+        extra = np.zeros(len(ids), dtype=np.int16)
+        extra[known] = p < 0
+        has = np.flatnonzero(col >= 0)
+
+        indexed = [k for k, (_, base, _) in enumerate(resolved) if base is not None]
+        if indexed and len(has):
+            rows = [resolved[k][2] for k in indexed]
+            level = self.levels[rows][:, col[has]].T.astype(np.int16)
+            # a leaf target is one hop past its anchor
+            hop = np.array([resolved[k][0] != resolved[k][1] for k in indexed], dtype=np.int16)
+            d = level + extra[has, None] + hop
+            d[level == UNREACHABLE] = -1
+            out[np.ix_(has, indexed)] = d
+
+        for k, (tid, _, _) in enumerate(resolved):
+            out[ids == tid, k] = 0
+        return out
+
+    def distances(self, sources, targets=None):
+        """sources × targets hop distances (-1: unreachable), in one lookup."""
+        sources = list(sources)
+        if targets is None:
+            targets = [self.graph.names[i] for i in self.rows]
+        targets = list(targets)
+        return pd.DataFrame(self._distances(targets, self._ids(sources)), index=sources, columns=targets)
+
+    def distance(self, source, target):
+        d = int(self._distances([target], self._ids([source]))[0, 0])
+        return None if d < 0 else d
+
+    def reachable(self, source, target):
+        return self.distance(source, target) is not None
+
+    # -------------------------------------------------------
+    # Shortest paths (one walk down the levels for a whole cohort)
+    # -------------------------------------------------------
+    def paths(self, sources, target):
+        """{source: shortest path as a list of names} for every source that reaches target."""
+        sources = list(sources)
+        ids = self._ids(sources)
+        ok = np.flatnonzero(self._distances([target], ids)[:, 0] >= 0)
+        tid, base, row = self._resolve(target)
+        names = self.graph.names
+        out = {sources[k]: [target] for k in ok if ids[k] == tid}
+        ok = np.array([k for k in ok if ids[k] != tid], dtype=np.int64)
+        if not len(ok):
+            return out
+
+        # first hop: leaves step onto their anchor
+        start = ids[ok]
+        lead = self.pos[start] < 0
+        first = np.where(lead, self.anchor[start], start)
+
+        goal = self.pos[base]
+        nxt = self._next_hops(row)
+        cur = self.pos[first]
+        steps = [cur]
+        while (cur != goal).any():
+            cur = np.where(cur != goal, nxt[cur], cur)
+            steps.append(cur)
+
+        walks = self.core[np.vstack(steps)].T      # one row per walker, padded with the goal
+        lengths = np.argmax(walks == base, axis=1) + 1
+        walks = names[walks]
+        heads = names[start]
+        tail = [names[tid]] if base != tid else []
+        for k in range(len(walks)):
+            path = walks[k, :lengths[k]].tolist() + tail
+            if lead[k]:
+                path.insert(0, heads[k])
+            out[sources[ok[k]]] = path
+        return out
+
+    def _next_hops(self, row):
+        """Per core node, its lowest-id neighbour one level closer to the row's target (-1: none)."""
+        level = self.levels[row].astype(np.int16)
+        owner = self._edge_owner
+        down = (level[self.adj.indices] == level[owner] - 1) & (level[owner] != UNREACHABLE)
+        nodes, first = np.unique(owner[down], return_index=True)
+        nxt = np.full(len(self.core), -1, dtype=np.int64)
+        nxt[nodes] = self.adj.indices[down][first]
+        return nxt
+
+    def path(self, source, target):
+        return self.paths([source], target).get(source)
+
+    def k_shortest_paths(self, source, target, k=3, max_extra=2):
+        """
+        Up to k simple paths, shortest first, at most `max_extra` hops longer
+        than the shortest. Depth-first, pruned by the target's levels, so
+        only branches that can still reach the target in time are walked.
+        """
+        d = self.distance(source, target)
+        if d is None or k < 1:
+            return []
+        if source == target:
+            return [[source]]
+        tid, base, row = self._resolve(target)
+        names = self.graph.names
+        sid = self.graph.ids[source]
+
+        # walk core to core; leaf endpoints are fixed first / last hops
+        prefix, suffix = [], []
+        if self.pos[sid] < 0:
+            prefix, sid, d = [sid], int(self.anchor[sid]), d - 1
+        if base != tid:
+            suffix, d = [tid], d - 1
+        level = self.levels[row]
+        ptr, idx = self.adj.indptr, self.adj.indices
+        goal = self.pos[base]
+        found = []
+
+        def walk(u, left, trail, seen):
+            if u == goal:
+                if left == 0:
+                    found.append(prefix + self.core[trail].tolist() + suffix)
+                return
+            for v in idx[ptr[u]:ptr[u + 1]]:
+                if len(found) >= k:
+                    return
+                if v not in seen and level[v] <= left - 1:
+                    seen.add(v)
+                    trail.append(v)
+                    walk(v, left - 1, trail, seen)
+                    trail.pop()
+                    seen.discard(v)
+
+        s = self.pos[sid]
+        for length in range(d, d + max_extra + 1):
+            walk(s, length, [s], {s})
+            if len(found) >= k:
+                break
+        return [[names[i] for i in p] for p in found[:k]]
+
+    def relations_of(self, path):
+        """Relation of each step of a path (in either edge direction)."""
+        C = self.graph
+        rels = []
+        for u, v in zip(path, path[1:]):
+            i, j = C.ids[u], C.ids[v]
+            rel = None
+            for ptr, idx, codes in ((C.succ_ptr, C.succ_idx, C.succ_rel),
+                                    (C.pred_ptr, C.pred_idx, C.pred_rel)):
+                hit = np.flatnonzero(idx[ptr[i]:ptr[i + 1]] == j)
+                if len(hit):
+                    rel = C.relation_names[codes[ptr[i] + hit[0]]]
+                    break
+            rels.append(rel)
+        return rels
+
+    # -------------------------------------------------------
+    # Batch table
+    # -------------------------------------------------------
+    def table(self, sources, targets=None, max_distance=None):
+        """Long source/target/distance/path table of every reachable pair."""
+        sources = list(sources)
+        targets = [self.graph.names[i] for i in self.rows] if targets is None else list(targets)
+        frames = []
+        for t in targets:
+            found = self.paths(sources, t)
+            if max_distance is not None:
+                found = {s: p for s, p in found.items() if len(p) - 1 <= max_distance}
+            if found:
+                frames.append(pd.DataFrame({
+                    "source": list(found),
+                    "target": t,
+                    "distance": [len(p) - 1 for p in found.values()],
+                    "path": [" → ".join(p) for p in found.values()],
+                }))
+        if not frames:
+            return pd.DataFrame(columns=["source", "target", "distance", "path"])
+        return pd.concat(frames, ignore_index=True)
+
+    def nbytes(self):
+        return self.levels.nbytes + self.pos.nbytes + self.anchor.nbytes + self.core.nbytes + \
+            self.adj.data.nbytes + self.adj.indices.nbytes + self.adj.indptr.nbytes
+
+
+# -----------------------------------------------------------
+# ✅ CLI
+# -----------------------------------------------------------
+def _names(G, names, node_type):
+    if names:
+        return names
+    if node_type:
+        return [n for n, d in G.nodes(data=True) if d["type"] == node_type]
+    return []
+
+
+def run(args):
+    G = CSRGraph.from_networkx(build_graph_from_csv(
+        {"courses": args.courses, "trainers": args.trainers,
+         "students": args.students, "trainer_skills": args.skills},
+        PIPELINE,
+    ))
+    sources = _names(G, args.sources, args.from_type)
+    targets = _names(G, args.targets, args.to_type)
+    missing = [n for n in sources + targets if n not in G]
+    if missing:
+        print(f"⚠️ Not in the graph: {', '.join(missing[:10])}")
+    sources = [n for n in sources if n in G]
+    targets = [n for n in targets if n in G]
+    if not sources or not targets:
+        print("⚠️ Nothing to query (give --from/--from-type and --to/--to-type)")
+        return None
+
+    index = PathIndex(G, targets=targets, relations=args.relations)
+    print(f"✅ Indexed {len(index.rows)} targets over {len(index.core)} of {len(G)} nodes "
+          f"({index.nbytes() / 1e6:.1f} MB)")
+
+    if args.k > 1:
+        for s in sources:
+            for t in targets:
+                for path in index.k_shortest_paths(s, t, args.k, args.max_extra):
+                    print(f"{len(path) - 1}: " + " → ".join(path))
+        return None
+
+    table = index.table(sources, targets, args.max_distance)
+    Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+    table.to_csv(args.out, index=False)
+    print(f"✅ Saved {len(table)} paths → {args.out}")
+    return table
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Shortest learning paths between graph nodes")
+    ap.add_argument("--courses", default="data/output/courses_and_modules.csv")
+    ap.add_argument("--trainers", default="data/trainers.csv")
+    ap.add_argument("--students", default="data/students.csv")
+    ap.add_argument("--skills", default="data/output/trainer_skills.csv")
+    ap.add_argument("--from", dest="sources", nargs="*", default=[], help="Source node names")
+    ap.add_argument("--from-type", default=None, help="Every node of this type is a source")
+    ap.add_argument("--to", dest="targets", nargs="*", default=[], help="Target node names")
+    ap.add_argument("--to-type", default=None, help="Every node of this type is a target")
+    ap.add_argument("--relations", nargs="*", default=None, help="Only follow these relations")
+    ap.add_argument("--max-distance", type=int, default=None)
+    ap.add_argument("--k", type=int, default=1, help="Print up to k shortest paths per pair")
+    ap.add_argument("--max-extra", type=int, default=2,
+                    help="With --k: how many hops longer than the shortest a path may be")
+    ap.add_argument("--out", default="data/output/learning_paths.csv")
+    add_profile_args(ap)
+    args = ap.parse_args()
+
+    with cli_profiler(args):
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+
+# KG_PROFILE=1 turns on cProfile capture for the process-wide profiler
+PROFILE_ENV = "KG_PROFILE"
+MAX_SPANS = 2000    # individual span records kept; stage totals are always exact
+PROFILE_TOP = 25    # functions listed per cProfile'd stage
+
+
+# -----------------------------------------------------------
+# ✅ Stage timer: spans, counters, optional cProfile
+# -----------------------------------------------------------
+class Profiler:
+    """
+    Wall-clock spans around pipeline stages plus named counters (pages
+    OCR'd, nodes built, cache hits, ...). Spans nest per thread; each
+    record keeps its parent stage and any facts set on it inside the block.
+
+    With cprofile=True the outermost active span is also run under
+    cProfile (only one profiler can run at a time), and its stats are
+    accumulated per stage name.
+    """
+
+    def __init__(self, cprofile=False, top=PROFILE_TOP):
+        self.cprofile = cprofile
+        self.top = top
+        self.spans = []
+        self.dropped = 0
+        self.stages = {}      # name -> {"calls", "seconds", "max"}
+        self.counters = {}
+        self._stats = {}      # name -> pstats.Stats
+        self._profiling = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def span(self, name, **facts):
+        stack = self._local.__dict__.setdefault("stack", [])
+        parent = stack[-1] if stack else None
+        stack.append(name)
+
+        prof = None
+        if self.cprofile:
+            with self._lock:
+                if not self._profiling:
+                    self._profiling = True
+                    prof = cProfile.Profile()
+
+        if prof is not None:
+            try:
+                prof.enable()
+            except ValueError:
+                # another profiler already owns the interpreter (python -m cProfile)
+                prof = None
+                self._profiling = False
+
+        start = time.perf_counter()
+        try:
+            yield facts
+        finally:
+            if prof is not None:
+                prof.disable()
+            seconds = time.perf_counter() - start
+            stack.pop()
+            self._record(name, parent, seconds, facts, prof)
+
+    def _record(self, name, parent, seconds, facts, prof):
+        with self._lock:
+            s = self.stages.setdefault(name, {"calls": 0, "seconds": 0.0, "max": 0.0})
+            s["calls"] += 1
+            s["seconds"] += seconds
+            s["max"] = max(s["max"], seconds)
+
+            if len(self.spans) < MAX_SPANS:
+                self.spans.append({"name": name, "parent": parent, "seconds": seconds, **facts})
+            else:
+                self.dropped += 1
+
+            if prof is not None:
+                self._profiling = False
+                if name in self._stats:
+                    self._stats[name].add(prof)
+                else:
+                    self._stats[name] = pstats.Stats(prof)
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def wrap(self, name, fn):
+        """fn run inside a span of (and counting into) this profiler, whichever thread calls it."""
+        @wraps(fn)
+        def run(*args, **kwargs):
+            token = _current.set(self)
+            try:
+                with self.span(name):
+                    return fn(*args, **kwargs)
+            finally:
+                _current.reset(token)
+        return run
+
+    def profile_text(self, name):
+        stats = self._stats.get(name)
+        if stats is None:
+            return ""
+        buf = io.StringIO()
+        stats.stream = buf
+        stats.sort_stats("cumulative").print_stats(self.top)
+        return buf.getvalue()
+
+    def report(self):
+        with self._lock:
+            return {
+                "stages": {k: dict(v) for k, v in self.stages.items()},
+                "counters": dict(self.counters),
+                "spans": list(self.spans),
+                "dropped_spans": self.dropped,
+                "profiles": {name: self.profile_text(name) for name in self._stats},
+            }
+
+    def save(self, path):
+        """JSON report at `path`; cProfile'd stages also get <stem>.<stage>.prof next to it."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+        for name, stats in self._stats.items():
+            slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+            stats.dump_stats(path.with_name(f"{path.stem}.{slug}.prof"))
+        return path
+
+    def summary_lines(self):
+        lines = [f"  {name:<28} {s['seconds']:8.3f}s  ×{s['calls']}"
+                 for name, s in sorted(self.stages.items(), key=lambda kv: -kv[1]["seconds"])]
+        lines += [f"  {name:<28} {n}" for name, n in sorted(self.counters.items())]
+        return lines
+
+
+# -----------------------------------------------------------
+# ✅ Current profiler (process-wide default, overridable per context)
+# -----------------------------------------------------------
+_default = Profiler(cprofile=os.environ.get(PROFILE_ENV) == "1")
+_current = ContextVar("kg_profiler", default=None)
+
+
+def current():
+    return _current.get() or _default
+
+
+def activate(profiler):
+    """Makes `profiler` current for this thread/context (e.g. one Streamlit rerun)."""
+    _current.set(profiler)
+    return profiler
+
+
+def span(name, **facts):
+    return current().span(name, **facts)
+
+
+def count(name, n=1):
+    current().count(name, n)
+
+
+def timed(name=None):
+    """Decorator: every call of the function is a span on the current profiler."""
+    def decorate(fn):
+        stage = name or fn.__name__
+
+        @wraps(fn)
+        def run(*args, **kwargs):
+            with current().span(stage):
+                return fn(*args, **kwargs)
+        return run
+    return decorate
+
+
+# -----------------------------------------------------------
+# ✅ CLI helpers (--profile-json / --cprofile)
+# -----------------------------------------------------------
+def add_profile_args(ap):
+    ap.add_argument("--profile-json", default=None,
+                    help="Write per-stage timings and counters to this JSON file")
+    ap.add_argument("--cprofile", action="store_true",
+                    help="Also capture cProfile stats per stage (saved next to --profile-json)")
+
+
+@contextmanager
+def cli_profiler(args):
+    """Runs the CLI body under a fresh profiler and dumps it if asked to."""
+    profiler = Profiler(cprofile=args.cprofile or _default.cprofile)
+    token = _current.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _current.reset(token)
+        if args.profile_json:
+            path = profiler.save(args.profile_json)
+            print("\n".join(profiler.summary_lines()))
+            print(f"⏱️ Profile → {path}")
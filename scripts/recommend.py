@@ -0,0 +1,257 @@
+"""
+Ranked trainer ↔ course recommendations from skill overlap.
+
+    python scripts/recommend.py --by course --top 5 --out data/output/recommendations.csv
+    python scripts/recommend.py --course "Certified Specialist in Data Science"
+    python scripts/recommend.py --trainer "Anu K" --weighting overlap
+
+Trainers are rows of a sparse trainer × skill matrix (from trainer_skills.csv)
+and courses rows of a course × skill matrix counting the modules that mention
+each skill (from courses_and_modules.csv, linked with the skill taxonomy).
+All trainer/course scores come from one sparse product T · Cᵀ.
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from ingest import clean_column, explode_list_column
+from profiling import add_profile_args, cli_profiler, span
+from skill_taxonomy import default_taxonomy
+
+WEIGHTINGS = ["tfidf", "overlap"]
+
+
+def _counts(rows, cols, shape):
+    """(row, col) pairs → CSR counts (repeated pairs are summed)."""
+    rows = np.asarray(rows, dtype=np.int64)
+    cols = np.asarray(cols, dtype=np.int64)
+    m = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=shape)
+    m.sum_duplicates()
+    return m
+
+
+def _normalize(m):
+    norms = np.sqrt(np.asarray(m.multiply(m).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms) @ m
+
+
+# -----------------------------------------------------------
+# ✅ Recommender
+# -----------------------------------------------------------
+class Recommender:
+    """
+    Scores every trainer against every course.
+
+    weighting="tfidf": cosine of tf-idf vectors. A course weights a skill by
+    1 + log(modules mentioning it) × idf, a trainer by idf alone, where idf
+    discounts skills most courses mention. Scores are in (0, 1].
+
+    weighting="overlap": number of skills the trainer and course share.
+
+    Trainers keep their input rows (a name listed twice is scored twice);
+    courses are merged by name. A zero score means no shared skill.
+    """
+
+    def __init__(self, trainers, courses, skills, trainer_skills, course_skills, weighting="tfidf"):
+        if weighting not in WEIGHTINGS:
+            raise ValueError(f"Unknown weighting {weighting!r} (use one of {WEIGHTINGS})")
+        self.trainers = list(trainers)
+        self.courses = list(courses)
+        self.skills = list(skills)
+        self.weighting = weighting
+        self.trainer_skills = sparse.csr_matrix(trainer_skills)    # trainer × skill, 0/1
+        self.course_skills = sparse.csr_matrix(course_skills)      # course × skill, module counts
+
+        self._trainer_index = {}
+        for i, name in enumerate(self.trainers):
+            self._trainer_index.setdefault(name, i)
+        self._course_index = {name: j for j, name in enumerate(self.courses)}
+
+        with span("recommend_score") as facts:
+            self.scores = self._score()
+            self._by_course = self.scores.T.tocsr()
+            facts.update(trainers=len(self.trainers), courses=len(self.courses), nnz=self.scores.nnz)
+
+    def _score(self):
+        T = self.trainer_skills.astype(np.float64)
+        C = self.course_skills.astype(np.float64)
+        if self.weighting == "overlap":
+            C.data[:] = 1.0
+        else:
+            df = np.bincount(C.indices, minlength=C.shape[1])
+            idf = sparse.diags(np.log((1 + C.shape[0]) / (1 + df)) + 1)
+            C.data = 1 + np.log(C.data)
+            T, C = _normalize(T @ idf), _normalize(C @ idf)
+        S = (T @ C.T).tocsr()
+        S.eliminate_zeros()
+        S.sort_indices()
+        return S
+
+    # -------------------------------------------------------
+    # Building
+    # -------------------------------------------------------
+    @classmethod
+    def from_frames(cls, courses_df, skills_df, taxonomy=None, weighting="tfidf"):
+        """courses_and_modules / trainer_skills frames → Recommender."""
+        taxonomy = taxonomy or default_taxonomy()
+        skills_df = skills_df.reset_index(drop=True)
+
+        with span("recommend_matrices") as facts:
+            # trainer × skill (skills canonicalized, so aliases share a column)
+            trainers = clean_column(skills_df["trainer_name"]).tolist() if len(skills_df) else []
+            skilled_in = explode_list_column(skills_df, "trainer_name", "skills", lower=True)
+            canonical = skilled_in["skills"].map(taxonomy.canonicalize)
+            skills = list(dict.fromkeys(canonical))
+            skill_index = {sk: k for k, sk in enumerate(skills)}
+            T = _counts(skilled_in.index, canonical.map(skill_index), (len(trainers), len(skills)))
+            T.data[:] = 1.0
+
+            # module × skill, summed into course × skill (modules mentioning each skill)
+            courses = [c for c in dict.fromkeys(clean_column(courses_df["course_name"])) if c] \
+                if len(courses_df) else []
+            course_index = {c: j for j, c in enumerate(courses)}
+            modules = explode_list_column(courses_df, "course_name", "modules")
+            matcher = taxonomy.linker(skills)
+            found, rows, cols = {}, [], []
+            for course, module in zip(modules["course_name"], modules["modules"]):
+                keys = found.get(module)
+                if keys is None:     # module titles repeat across courses
+                    keys = found[module] = [skill_index[k] for k in matcher.match_keys(module)]
+                rows.extend([course_index[course]] * len(keys))
+                cols.extend(keys)
+            C = _counts(rows, cols, (len(courses), len(skills)))
+            facts.update(trainers=len(trainers), courses=len(courses), skills=len(skills),
+                         modules=len(modules))
+
+        return cls(trainers, courses, skills, T, C, weighting=weighting)
+
+    @classmethod
+    def from_csv(cls, courses_file, trainer_skills_file, taxonomy=None, weighting="tfidf"):
+        return cls.from_frames(pd.read_csv(courses_file), pd.read_csv(trainer_skills_file),
+                               taxonomy=taxonomy, weighting=weighting)
+
+    # -------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------
+    def _shared(self, trainer_rows, course_rows):
+        """Shared skills of each (trainer row, course row) pair, joined."""
+        both = self.trainer_skills[trainer_rows].multiply(self.course_skills[course_rows]).tocsr()
+        both.sort_indices()
+        names = np.array(self.skills, dtype=object)[both.indices]
+        return [", ".join(names[start:end]) for start, end in zip(both.indptr[:-1], both.indptr[1:])]
+
+    @staticmethod
+    def _top(m, row, k):
+        start, end = m.indptr[row], m.indptr[row + 1]
+        cols, vals = m.indices[start:end], m.data[start:end]
+        order = np.argsort(-vals, kind="stable")     # ties keep input order
+        if k is not None:
+            order = order[:k]
+        return cols[order], vals[order]
+
+    def courses_for(self, trainer, k=None):
+        """Best courses for a trainer: course_name, score, shared skills."""
+        i = self._trainer_index.get(trainer)
+        if i is None:
+            return pd.DataFrame(columns=["course_name", "score", "skills"])
+        cols, vals = self._top(self.scores, i, k)
+        return pd.DataFrame({
+            "course_name": [self.courses[j] for j in cols],
+            "score": vals,
+            "skills": self._shared(np.full(len(cols), i), cols),
+        })
+
+    def trainers_for(self, course, k=None):
+        """Best trainers for a course: trainer_name, score, shared skills."""
+        j = self._course_index.get(course)
+        if j is None:
+            return pd.DataFrame(columns=["trainer_name", "score", "skills"])
+        rows, vals = self._top(self._by_course, j, k)
+        return pd.DataFrame({
+            "trainer_name": [self.trainers[i] for i in rows],
+            "score": vals,
+            "skills": self._shared(rows, np.full(len(rows), j)),
+        })
+
+    def teaches(self):
+        """Per trainer row, every course with a shared skill, best first."""
+        return [[self.courses[j] for j in self._top(self.scores, i, None)[0]]
+                for i in range(len(self.trainers))]
+
+    def table(self, top=None, by="trainer", skills=True):
+        """
+        Long (trainer, course, score, rank) table of every non-zero score,
+        ranked per trainer (by="trainer") or per course (by="course");
+        `top` keeps only the best `top` of each.
+        """
+        m = self.scores if by == "trainer" else self._by_course
+        keys, others, scores, ranks = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)], \
+            [np.empty(0)], [np.empty(0, dtype=np.int64)]
+        for row in range(m.shape[0]):
+            cols, vals = self._top(m, row, top)
+            keys.append(np.full(len(cols), row))
+            others.append(cols)
+            scores.append(vals)
+            ranks.append(np.arange(1, len(cols) + 1))
+
+        keys, others = np.concatenate(keys), np.concatenate(others)
+        t, c = (keys, others) if by == "trainer" else (others, keys)
+        out = pd.DataFrame({
+            "trainer_name": np.array(self.trainers, dtype=object)[t],
+            "course_name": np.array(self.courses, dtype=object)[c],
+            "score": np.concatenate(scores),
+            "rank": np.concatenate(ranks),
+        })
+        if skills:
+            out["skills"] = self._shared(t, c)
+        return out
+
+
+# -----------------------------------------------------------
+# ✅ CLI
+# -----------------------------------------------------------
+def run(args):
+    rec = Recommender.from_csv(args.courses, args.skills, weighting=args.weighting)
+    print(f"✅ Scored {len(rec.trainers)} trainers × {len(rec.courses)} courses "
+          f"over {len(rec.skills)} skills ({rec.scores.nnz} matches)")
+
+    if args.trainer or args.course:
+        ranked = rec.courses_for(args.trainer, args.top) if args.trainer \
+            else rec.trainers_for(args.course, args.top)
+        if ranked.empty:
+            print(f"⚠️ No matches for {args.trainer or args.course!r}")
+        else:
+            print(ranked.to_string(index=False))
+        return ranked
+
+    table = rec.table(args.top, by=args.by)
+    Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+    table.to_csv(args.out, index=False)
+    print(f"✅ Saved {len(table)} recommendations → {args.out}")
+    return table
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Rank trainers for courses and courses for trainers")
+    ap.add_argument("--courses", default="data/output/courses_and_modules.csv")
+    ap.add_argument("--skills", default="data/output/trainer_skills.csv")
+    ap.add_argument("--weighting", choices=WEIGHTINGS, default="tfidf")
+    ap.add_argument("--by", choices=["trainer", "course"], default="trainer",
+                    help="Keep the top matches per trainer or per course")
+    ap.add_argument("--top", type=int, default=5, help="Matches kept per trainer/course")
+    ap.add_argument("--trainer", default=None, help="Only print the best courses for this trainer")
+    ap.add_argument("--course", default=None, help="Only print the best trainers for this course")
+    ap.add_argument("--out", default="data/output/recommendations.csv")
+    add_profile_args(ap)
+    args = ap.parse_args()
+
+    with cli_profiler(args):
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+# -----------------------------------------------------------
+# ✅ Content hash of a (sub)graph as it will be drawn
+# -----------------------------------------------------------
+def graph_digest(G):
+    """
+    Stable sha256 over nodes and edges with their attributes, independent
+    of insertion order, so equal subgraphs map to the same rendered page.
+    """
+    h = hashlib.sha256()
+    for n, attrs in sorted((str(n), sorted(d.items())) for n, d in G.nodes(data=True)):
+        h.update(repr((n, attrs)).encode("utf-8"))
+    h.update(b"\0edges\0")
+    for e in sorted((str(u), str(v), sorted(d.items())) for u, v, d in G.edges(data=True)):
+        h.update(repr(e).encode("utf-8"))
+    return h.hexdigest()
+
+
+class RenderCache:
+    """
+    Small thread-safe LRU for rendered pages (or any other bytes/str),
+    shared by all sessions. `render` runs outside the lock, so one slow
+    render does not block cache hits for other sessions.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._items = OrderedDict()
+
+    def get(self, key, render):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return self._items[key]
+            self.misses += 1
+
+        value = render()
+
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._items)}
@@ -0,0 +1,131 @@
+from collections import deque
+
+
+# -----------------------------------------------------------
+# ✅ Aho-Corasick skill matcher
+# -----------------------------------------------------------
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+
+class SkillMatcher:
+    """
+    Compiles a whole skill vocabulary into one Aho-Corasick automaton so a
+    text is scanned once, whatever the size of the vocabulary.
+
+    Matching is case-insensitive. With `word_boundary=True` (the default) a
+    hit only counts when the characters around it are not letters/digits,
+    so "java" does not fire inside "javascript" while "c++" or "node.js"
+    still match as written.
+
+    `synonyms` maps a skill to extra spellings that should count as that
+    skill ("reactjs" -> "react"); spellings listed in `loose` match
+    anywhere, without the word-boundary check.
+    """
+
+    def __init__(self, skills, word_boundary=True, synonyms=None, loose=()):
+        self.word_boundary = word_boundary
+
+        # lowered skill -> original spellings (several may share a key)
+        self.skills = {}
+        for sk in skills:
+            s = str(sk).strip()
+            if not s:
+                continue
+            self.skills.setdefault(s.lower(), []).append(s)
+
+        # lowered surface form -> skill keys it stands for
+        self._keys = {key: {key} for key in self.skills}
+        for sk, forms in (synonyms or {}).items():
+            key = str(sk).strip().lower()
+            if key not in self.skills:
+                continue
+            for form in forms:
+                form = str(form).strip().lower()
+                if form:
+                    self._keys.setdefault(form, set()).add(key)
+
+        self._loose = {str(s).strip().lower() for s in loose}
+        self.patterns = list(self._keys)
+        self._build()
+
+    def _build(self):
+        goto = [{}]
+        fail = [0]
+        out = [[]]
+
+        for idx, pat in enumerate(self.patterns):
+            node = 0
+            for ch in pat:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    fail.append(0)
+                    out.append([])
+                    goto[node][ch] = nxt
+                node = nxt
+            out[node].append(idx)
+
+        # Breadth-first pass to wire failure links and merge outputs
+        queue = deque(goto[0].values())
+        while queue:
+            r = queue.popleft()
+            for ch, s in goto[r].items():
+                queue.append(s)
+                f = fail[r]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[s] = goto[f].get(ch, 0)
+                if out[fail[s]]:
+                    out[s] = out[s] + out[fail[s]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def __len__(self):
+        return len(self.skills)
+
+    def finditer(self, text):
+        """Yields (start, end, surface form) for every match, overlaps included."""
+        if not self.patterns or not text:
+            return
+
+        text = str(text).lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        patterns = self.patterns
+        n = len(text)
+        node = 0
+
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not out[node]:
+                continue
+
+            end = i + 1
+            for idx in out[node]:
+                pat = patterns[idx]
+                start = end - len(pat)
+                if self.word_boundary and pat not in self._loose:
+                    if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(pat[0]):
+                        continue
+                    if end < n and _is_word_char(text[end]) and _is_word_char(pat[-1]):
+                        continue
+                yield start, end, pat
+
+    def match_keys(self, text):
+        """Lower-cased vocabulary entries found in `text` (synonyms resolved)."""
+        found = set()
+        for _, _, pat in self.finditer(text):
+            found |= self._keys[pat]
+        return found
+
+    def matches(self, text):
+        """Original skill spellings found in `text`."""
+        found = set()
+        for key in self.match_keys(text):
+            found.update(self.skills[key])
+        return found
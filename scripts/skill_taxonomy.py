@@ -0,0 +1,179 @@
+import csv
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from skill_matcher import SkillMatcher
+
+# (canonical skill, aliases). Extend here, or point KG_SKILL_TAXONOMY at a
+# JSON / CSV file (see load_taxonomy) to replace the whole vocabulary.
+DEFAULT_TAXONOMY = [
+    ("python", []),
+    ("java", []),
+    ("javascript", ["js", "ecmascript"]),
+    ("react", ["reactjs", "react.js"]),
+    ("node", ["nodejs", "node.js"]),
+    ("express", ["expressjs", "express.js"]),
+    ("mongodb", ["mongo db"]),
+    ("sql", []),
+    ("linux", []),
+    ("cloud", ["cloud computing"]),
+    ("aws", ["amazon web services"]),
+    ("azure", ["microsoft azure"]),
+    ("docker", []),
+    ("kubernetes", ["k8s"]),
+    ("selenium", []),
+    ("automation testing", ["test automation"]),
+    ("manual testing", []),
+    ("cyber security", ["cybersecurity", "cyber-security"]),
+    ("penetration testing", ["pen testing", "pentesting"]),
+    ("wireshark", []),
+    ("metasploit", []),
+    ("nmap", []),
+    ("burp suite", ["burpsuite"]),
+    ("html", ["html5"]),
+    ("css", ["css3"]),
+    ("bootstrap", []),
+    ("redux", []),
+    ("git", []),
+    ("github", []),
+    ("data science", []),
+    ("machine learning", []),
+    ("deep learning", []),
+    ("nlp", ["natural language processing"]),
+]
+
+TAXONOMY_ENV = "KG_SKILL_TAXONOMY"
+
+
+# -----------------------------------------------------------
+# ✅ Skill taxonomy (canonical skills + aliases, one automaton)
+# -----------------------------------------------------------
+class SkillTaxonomy:
+    """
+    Canonical skills with their aliases and word-boundary rule, compiled
+    into a single SkillMatcher so a text is scanned once however large the
+    vocabulary is. Aliases resolve to their canonical skill, so "reactjs"
+    and "react" count as one skill.
+    """
+
+    def __init__(self, entries=()):
+        self.aliases = {}         # canonical -> aliases
+        self.loose = set()        # surface forms matched without word boundaries
+        self._canonical = {}      # lowered surface form -> canonical
+        self._matcher = None
+        for entry in entries:
+            self.add(*entry)
+
+    @classmethod
+    def from_skills(cls, skills):
+        """A taxonomy without aliases (e.g. a plain vocabulary list)."""
+        return cls((sk, []) for sk in skills)
+
+    def add(self, skill, aliases=(), word_boundary=True):
+        canonical = str(skill).strip().lower()
+        if not canonical:
+            return
+        forms = [a for a in (str(a).strip().lower() for a in aliases) if a and a != canonical]
+        self.aliases.setdefault(canonical, [])
+        for form in [canonical] + forms:
+            # an alias belongs to the first skill that claimed it
+            if self._canonical.setdefault(form, canonical) != canonical:
+                continue
+            if form != canonical and form not in self.aliases[canonical]:
+                self.aliases[canonical].append(form)
+            if not word_boundary:
+                self.loose.add(form)
+        self._matcher = None
+
+    def __len__(self):
+        return len(self.aliases)
+
+    def __contains__(self, skill):
+        return str(skill).strip().lower() in self._canonical
+
+    def canonicalize(self, skill):
+        """Canonical name for a skill or alias; unknown skills are just normalized."""
+        s = str(skill).strip().lower()
+        return self._canonical.get(s, s)
+
+    def digest(self):
+        """Hash of the vocabulary and its rules, e.g. to key caches built with it."""
+        entries = sorted((sk, sorted(forms)) for sk, forms in self.aliases.items())
+        payload = json.dumps([entries, sorted(self.loose)], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def surface_forms(self, skill):
+        canonical = self.canonicalize(skill)
+        return [canonical] + self.aliases.get(canonical, [])
+
+    @property
+    def matcher(self):
+        if self._matcher is None:
+            self._matcher = SkillMatcher(self.aliases, synonyms=self.aliases, loose=self.loose)
+        return self._matcher
+
+    def extract(self, text):
+        """Canonical skills mentioned in `text`, sorted."""
+        return sorted(self.matcher.match_keys(text))
+
+    def linker(self, skills):
+        """
+        Matcher over an arbitrary skill list (e.g. the Skill nodes of a graph)
+        that also fires on every alias of each skill, so skill → module/course
+        links use the same vocabulary rules as resume parsing.
+        """
+        skills = list(skills)
+        synonyms = {sk: self.surface_forms(sk) for sk in skills}
+        return SkillMatcher(skills, synonyms=synonyms, loose=self.loose)
+
+
+# -----------------------------------------------------------
+# ✅ Loading
+# -----------------------------------------------------------
+def load_taxonomy(path):
+    """
+    Reads a taxonomy file.
+
+    JSON: [{"skill": "react", "aliases": ["reactjs"], "word_boundary": true}, ...]
+    CSV:  columns skill, aliases ("|"-separated), optional word_boundary
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)
+        return SkillTaxonomy(
+            (e["skill"], e.get("aliases", []), e.get("word_boundary", True)) for e in entries
+        )
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    return SkillTaxonomy(
+        (
+            r["skill"],
+            [a for a in (r.get("aliases") or "").split("|") if a.strip()],
+            (r.get("word_boundary") or "true").strip().lower() not in ("false", "0", "no"),
+        )
+        for r in rows
+    )
+
+
+def as_taxonomy(vocab=None):
+    """None -> default taxonomy; a SkillTaxonomy as is; a list -> plain vocabulary."""
+    if vocab is None:
+        return default_taxonomy()
+    if isinstance(vocab, SkillTaxonomy):
+        return vocab
+    return SkillTaxonomy.from_skills(vocab)
+
+
+_default_taxonomy = None
+
+
+def default_taxonomy():
+    global _default_taxonomy
+    if _default_taxonomy is None:
+        path = os.environ.get(TAXONOMY_ENV)
+        _default_taxonomy = load_taxonomy(path) if path else SkillTaxonomy(DEFAULT_TAXONOMY)
+    return _default_taxonomy
@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# the scripts import each other as top-level modules
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
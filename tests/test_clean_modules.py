@@ -0,0 +1,73 @@
+import random
+import re
+
+import pandas as pd
+import pytest
+
+import clean_modules
+from clean_modules import clean_and_split_modules, clean_frame
+
+
+def _reference(mod_text):
+    """The per-row implementation clean_modules replaced (Python re, Unicode classes)."""
+    if not isinstance(mod_text, str):
+        return []
+    text = re.sub(r"[;•\-\n]+", "\n", mod_text.strip())
+    cleaned = []
+    for p in re.split(r"[,\n]+", text):
+        p = p.strip()
+        if not p or len(p) > 80:
+            continue
+        p = re.sub(r"^\d+[\)\.\- ]+", "", p)
+        p = re.sub(r"^Module\s*\d+[:\- ]*", "", p, flags=re.I)
+        p = p.replace("•", "").strip()
+        if len(p) > 1:
+            cleaned.append(p)
+    return cleaned
+
+
+INPUTS = [
+    "Module\xa01: Intro",
+    "１. Python basics",
+    "٣) Arabic-Indic numbering",
+    "MODULE 2 - Spark, module 3:Kafka",
+    "Module　4　Cloud",
+    "\xa0 Data Science\xa0,  SQL ",
+    "1. Python; 2) Django • 3 - REST",
+    "Module 1 - " + "x" * 90 + ", Module 2 - Short",
+    "ſ. long s, K. kelvin, modULE 7 Mixed case",
+    "",
+    " , ; ",
+    None,
+    42,
+]
+
+
+@pytest.fixture(params=["arrow", "python"])
+def backend(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(clean_modules, "pa", None)
+    elif clean_modules.pa is None:
+        pytest.skip("pyarrow is not installed")
+    return request.param
+
+
+@pytest.mark.parametrize("text", INPUTS)
+def test_matches_reference(backend, text):
+    assert clean_and_split_modules(text) == _reference(text)
+
+
+def test_unicode_numbering_is_removed(backend):
+    assert clean_and_split_modules("Module\xa01: Intro") == ["Intro"]
+    assert clean_and_split_modules("１. Python basics") == ["Python basics"]
+
+
+def test_random_text_matches_reference(backend):
+    rng = random.Random(0)
+    alphabet = list("ab Mmodule12:.)-,;•\n") + ["\xa0", "１", "٣", " ", "　", "\x85", "\t"]
+    texts = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40))) for _ in range(300)]
+    texts += ["Module" + t for t in texts[:100]]
+
+    wide, long = clean_frame(pd.DataFrame({"course_name": "C", "modules": texts}))
+    assert wide["modules"].tolist() == [", ".join(_reference(t)) for t in texts]
+    assert long["module"].tolist() == [m for t in texts for m in _reference(t)]
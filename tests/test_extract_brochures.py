@@ -0,0 +1,16 @@
+import pytest
+from pdfplumber.utils.exceptions import PdfminerException
+
+from extract_brochures import process_brochures
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_corrupt_pdf_fails_in_serial_and_parallel_mode(tmp_path, monkeypatch, workers):
+    monkeypatch.setenv("KG_EXTRACT_CACHE", "off")
+    folder = tmp_path / "brochures"
+    folder.mkdir()
+    (folder / "broken.pdf").write_bytes(b"not a pdf")
+
+    with pytest.raises(PdfminerException):
+        process_brochures(str(folder), str(tmp_path / "out.csv"), workers=workers)
+    assert not (tmp_path / "out.csv").exists()
@@ -0,0 +1,56 @@
+from PIL import Image
+
+import ocr_triage
+from extraction_cache import ExtractionCache, cached_pdf_text, pdf_key, tesseract_version
+
+
+class _Page:
+    """Just enough of a pdfplumber page for read_page's OCR branch."""
+    page_number = 1
+
+    def extract_text(self):
+        return ""
+
+    def crop(self, bbox):
+        return self
+
+    def to_image(self, resolution):
+        self.original = Image.new("RGB", (4, 4))
+        return self
+
+
+def test_pdf_key_includes_tesseract_version(tmp_path, monkeypatch):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF")
+    key = pdf_key(pdf, "tag")
+    monkeypatch.setattr("extraction_cache._tesseract_version", tesseract_version() + "-new")
+    assert pdf_key(pdf, "tag") != key
+
+
+def test_incomplete_text_is_not_cached(tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"%PDF")
+    cache = ExtractionCache(tmp_path / "cache")
+
+    assert cached_pdf_text(pdf, lambda p: ("partial", False), "t", cache) == "partial"
+    assert cached_pdf_text(pdf, lambda p: "full", "t", cache) == "full"
+    assert cached_pdf_text(pdf, lambda p: "other", "t", cache) == "full"
+
+
+def test_read_page_flags_failed_ocr_and_reports_max_dpi(monkeypatch):
+    regions = [(0, 0, 72, 72), (0, 100, 7200, 7300)]     # the second is scaled down
+    monkeypatch.setattr(ocr_triage, "triage_page", lambda page: ("ocr", regions, 300))
+
+    calls = []
+
+    def ocr(image, dpi):
+        calls.append(dpi)
+        if len(calls) == 2:
+            raise RuntimeError("tesseract is not installed")
+        return "text"
+
+    text, info = ocr_triage.read_page(_Page(), ocr=ocr)
+    assert text == "text"
+    assert info["decision"] == ocr_triage.OCR_FAILED
+    assert calls[0] == 300 and calls[1] < 300
+    assert info["resolution"] == 300
@@ -0,0 +1,109 @@
+import random
+
+import networkx as nx
+import pandas as pd
+import pytest
+
+from graph_analytics import TABLES, GraphAnalytics
+from graph_store import GraphStore
+from graph_updates import GraphUpdater
+
+TOPICS = ["Python", "JS", "React.js", "Data Science", "SQL", "Docker", "Terraform", "Cooking"]
+SKILLS = ["Python", "javascript", "React", "data science", "sql", "docker", "terraform", "excel"]
+
+
+def _sorted(df):
+    df = df.astype(object).where(df.notna(), None)
+    return df.sort_values(list(df.columns), key=lambda s: s.astype(str)).reset_index(drop=True)
+
+
+def _assert_same_tables(tables, expected):
+    assert set(tables) == set(TABLES)
+    for name in TABLES:
+        pd.testing.assert_frame_equal(_sorted(tables[name]), _sorted(expected[name]), check_dtype=False)
+
+
+def _graph():
+    G = nx.DiGraph()
+    G.add_nodes_from(["Course A", "Course B"], type="Course")
+    G.add_nodes_from(["Python basics", "Docker lab", "Cooking"], type="Module")
+    G.add_nodes_from(["python", "docker"], type="Skill")
+    G.add_nodes_from(["Ann", "Bob"], type="Trainer")
+    G.add_nodes_from(["S1", "S2"], type="Student")
+    G.add_edges_from([("Course A", "Python basics"), ("Course A", "Cooking"),
+                      ("Course B", "Docker lab")], relation="has_module")
+    G.add_edges_from([("Ann", "python"), ("Bob", "docker")], relation="skilled_in")
+    G.add_edge("Ann", "Course A", relation="teaches")
+    G.add_edges_from([("S1", "Course A"), ("S2", "Course A"), ("S2", "Course B")], relation="enrolled_in")
+    return G
+
+
+def test_compute_small_graph():
+    a = GraphAnalytics.compute(_graph())
+    assert a.course("Course A") == {
+        "course": "Course A", "modules": 2, "trainers": 1, "students": 2,
+        "covered_modules": 1, "gap_modules": 1, "coverage": 0.5,
+    }
+    assert a.gaps("Course A") == ["Cooking"]
+    assert [(r["trainer"], r["teaches"], r["modules"], r["students"]) for r in a.trainers_for("Course B")] \
+        == [("Bob", False, 1, 0)]
+    assert a.trainer("Ann") == {"trainer": "Ann", "skills": 1, "courses": 1, "students": 2, "modules": 1}
+    assert a.skills["docker"] == {"skill": "docker", "trainers": 1, "modules": 1, "courses": 1}
+
+
+def test_tables_round_trip(tmp_path):
+    a = GraphAnalytics.compute(_graph())
+    loaded = GraphAnalytics.from_tables(a.tables())
+    _assert_same_tables(loaded.tables(), a.tables())
+
+    # and through the SQLite store, where booleans come back as integers
+    store = GraphStore(tmp_path / "graph.sqlite").write(_graph(), "v1")
+    store.write_tables(a.tables())
+    loaded = GraphAnalytics.from_tables({name: store.read_table(name) for name in TABLES})
+    for c in ["Course A", "Course B"]:
+        assert loaded.trainers_for(c) == a.trainers_for(c)
+        assert loaded.gaps(c) == a.gaps(c)
+    assert loaded.course("Course A") == a.course("Course A")
+
+    with pytest.raises(ValueError):
+        loaded.refresh(_graph(), ["Course A"])
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_random_deltas_match_compute(seed):
+    rng = random.Random(seed)
+    course_names = [f"Course {i}" for i in range(6)]
+    trainer_names = [f"Trainer {i}" for i in range(5)]
+    student_names = [f"Student {i}" for i in range(8)]
+
+    def module_text():
+        return ", ".join(f"{rng.choice(TOPICS)} {rng.choice(['basics', 'lab'])}"
+                         for _ in range(rng.randint(0, 3)))
+
+    up = GraphUpdater(derive_relevant=bool(seed % 2))
+    a = GraphAnalytics.compute(up.G)
+    enrolled = set()
+
+    for _ in range(40):
+        op = rng.choice(["course", "course", "drop_course", "trainer", "drop_trainer", "enroll", "unenroll"])
+        if op == "course":
+            kind, rows = "courses", [{"course_name": rng.choice(course_names), "modules": module_text()}]
+        elif op == "drop_course":
+            kind, rows = "courses", [{"course_name": rng.choice(course_names), "deleted": True}]
+        elif op == "trainer":
+            kind, rows = "trainer_skills", [{"trainer_name": rng.choice(trainer_names),
+                                             "skills": ", ".join(rng.sample(SKILLS, rng.randint(0, 3)))}]
+        elif op == "drop_trainer":
+            kind, rows = "trainer_skills", [{"trainer_name": rng.choice(trainer_names), "deleted": True}]
+        elif op == "enroll":
+            pair = (rng.choice(student_names), rng.choice(course_names))
+            enrolled.add(pair)
+            kind, rows = "students", [{"student_name": pair[0], "enrolled": pair[1]}]
+        elif enrolled:
+            pair = rng.choice(sorted(enrolled))
+            enrolled.discard(pair)
+            kind, rows = "students", [{"student_name": pair[0], "enrolled": pair[1], "deleted": True}]
+        else:
+            continue
+        a.apply_rows(up, kind, rows)
+        _assert_same_tables(a.tables(), GraphAnalytics.compute(up.G).tables())
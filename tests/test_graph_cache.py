@@ -0,0 +1,70 @@
+import networkx as nx
+import pytest
+
+from graph_cache import GraphCache
+from graph_snapshot import SnapshotError, dump_snapshot, loads_snapshot
+from skill_taxonomy import SkillTaxonomy
+
+
+def _graph(text):
+    G = nx.DiGraph()
+    G.add_node(text, type="Course")
+    return G
+
+
+def test_failed_rebuild_keeps_previous_graph_and_version(tmp_path):
+    src = tmp_path / "courses.csv"
+    src.write_text("a")
+    fail = []
+
+    def builder(path):
+        if fail:
+            raise ValueError("bad input")
+        return _graph(open(path).read())
+
+    cache = GraphCache(builder)
+    G = cache.get(src)
+    version = cache.version
+
+    src.write_text("changed")
+    fail.append(True)
+    with pytest.raises(ValueError):
+        cache.get(src)
+    assert cache.version == version
+    assert cache.stats()["hits"] == 0
+
+    # still a miss (and a rebuild) once the builder works again
+    fail.clear()
+    G2 = cache.get(src)
+    assert cache.misses == 3 and cache.hits == 0
+    assert list(G2) == ["changed"] and list(G) == ["a"]
+    assert cache.version != version
+
+
+def test_snapshot_round_trip_keeps_meta(tmp_path):
+    G = loads_snapshot(dump_snapshot(_graph("x"), meta={"source": "v1"}))
+    assert G.meta == {"source": "v1"}
+
+
+@pytest.mark.parametrize("meta", [[1, 2], "text", 3])
+def test_snapshot_with_non_dict_meta_is_rejected(meta):
+    with pytest.raises(SnapshotError):
+        loads_snapshot(dump_snapshot(_graph("x"), meta=meta))
+
+
+def test_cache_ignores_snapshot_with_bad_meta(tmp_path):
+    path = tmp_path / "g.kgs"
+    path.write_bytes(dump_snapshot(_graph("stale"), meta=[1, 2]))
+    src = tmp_path / "in.csv"
+    src.write_text("fresh")
+    cache = GraphCache(lambda p: _graph(open(p).read()), snapshot_path=path)
+    assert [str(n) for n in cache.get(src)] == ["fresh"]
+
+
+def test_taxonomy_digest_tracks_the_vocabulary():
+    base = SkillTaxonomy([("react", ["reactjs"]), ("python", [])])
+    same = SkillTaxonomy([("python", []), ("react", ["reactjs"])])
+    alias = SkillTaxonomy([("react", ["reactjs", "react.js"]), ("python", [])])
+    loose = SkillTaxonomy([("react", ["reactjs"]), ("python", [], False)])
+    assert base.digest() == same.digest()
+    assert len({base.digest(), alias.digest(), loose.digest()}) == 3
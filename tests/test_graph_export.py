@@ -0,0 +1,48 @@
+import threading
+
+import networkx as nx
+
+from graph_export import ExportCache
+
+
+class _SlowGraph(nx.DiGraph):
+    """Blocks inside the export writer until `release` is set."""
+
+    def __init__(self, entered, release):
+        super().__init__()
+        self.add_edge("a", "b", relation="has_module")
+        self.entered, self.release = entered, release
+
+    def nodes(self, *args, **kwargs):
+        self.entered.set()
+        assert self.release.wait(10)
+        return super().nodes(*args, **kwargs)
+
+
+def test_hits_are_not_blocked_by_a_slow_write(tmp_path):
+    cache = ExportCache(tmp_path)
+    G = nx.DiGraph([("x", "y")])
+    first = cache.get(G, "k1", "JSON Lines")
+    assert b'"id": "x"' in first
+
+    entered, release = threading.Event(), threading.Event()
+    slow = threading.Thread(target=cache.get, args=(_SlowGraph(entered, release), "k2", "JSON Lines"))
+    slow.start()
+    assert entered.wait(10)
+    try:
+        assert cache.get(G, "k1", "JSON Lines") == first
+        assert not list(tmp_path.glob("k2-*"))
+    finally:
+        release.set()
+        slow.join()
+    assert (tmp_path / "k2-graph.jsonl").exists()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_old_files_are_pruned(tmp_path):
+    cache = ExportCache(tmp_path, max_files=2)
+    G = nx.DiGraph([("x", "y")])
+    for key in ["k1", "k2", "k3"]:
+        cache.get(G, key, "CSV", "nodes")
+    assert len(list(tmp_path.iterdir())) == 2
+    assert cache.get(G, "k1", "CSV", "nodes").startswith(b"node,type")
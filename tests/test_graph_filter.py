@@ -0,0 +1,96 @@
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from csr_graph import CSRGraph
+from dashboard import filter_graph
+from graph_store import GraphStore
+
+SCRIPTS = Path(__file__).resolve().parents[1] / "scripts"
+TYPES = ["Course", "Module", "Student"]
+
+
+def _graph():
+    G = nx.DiGraph()
+    for c in range(3):
+        G.add_node(f"Course {c}", type="Course")
+        for m in range(4):
+            G.add_node(f"Module {c}.{m}", type="Module")
+            G.add_edge(f"Course {c}", f"Module {c}.{m}", relation="has_module")
+    for s in range(5):
+        G.add_node(f"Student {s}", type="Student")
+        G.add_edge(f"Student {s}", f"Course {s % 3}", relation="enrolled_in")
+    return G
+
+
+@pytest.fixture(params=["networkx", "csr", "sqlite"])
+def graph(request, tmp_path):
+    G = _graph()
+    if request.param == "networkx":
+        return G
+    if request.param == "csr":
+        return CSRGraph.from_networkx(G)
+    return GraphStore(tmp_path / "graph.sqlite").write(G, "v1")
+
+
+def test_filter_reports_truncation(graph):
+    sub, truncated = filter_graph(graph, "course", TYPES, 1)
+    assert not truncated and sub.number_of_nodes() == 3 + 12 + 5
+
+    sub, truncated = filter_graph(graph, "course", TYPES, 1, max_nodes=8)
+    assert truncated and sub.number_of_nodes() == 8
+
+    sub, truncated = filter_graph(graph, "course", TYPES, 1, max_nodes=2)
+    assert truncated and sub.number_of_nodes() == 2
+
+    sub, truncated = filter_graph(graph, "nothing matches", TYPES, 1, max_nodes=2)
+    assert not truncated and sub.number_of_nodes() == 0
+
+
+def test_store_and_csr_truncate_alike(tmp_path):
+    rng = random.Random(3)
+    G = nx.DiGraph()
+    for i in range(200):
+        G.add_node(f"n{i}", type=rng.choice(TYPES))
+    for _ in range(400):
+        u, v = rng.sample(range(200), 2)
+        G.add_edge(f"n{u}", f"n{v}", relation=rng.choice(["has_module", "enrolled_in"]))
+    C = CSRGraph.from_networkx(G)
+    S = GraphStore(tmp_path / "graph.sqlite").write(G, "v1")
+
+    for max_nodes in [5, 30, 90, None]:
+        seeds = rng.sample(range(200), 10)
+        ids, truncated = S.expand(seeds, 3, ["has_module"], ["Module", "Student"], max_nodes)
+        exp = C.expand(seeds, 3, ["has_module"], ["Module", "Student"], max_nodes)
+        assert sorted(ids) == np.flatnonzero(exp.nodes).tolist()
+        assert truncated == exp.truncated
+
+
+def test_indexed_truncation_does_not_depend_on_hash_seed():
+    script = """
+import random, networkx as nx
+from dashboard import filter_graph
+from node_index import NodeIndex
+rng = random.Random(0)
+G = nx.DiGraph()
+for i in range(250):
+    G.add_node(f"node {i}", type=rng.choice(["Course", "Module", "Student"]))
+for _ in range(400):
+    u, v = rng.sample(range(250), 2)
+    G.add_edge(f"node {u}", f"node {v}", relation="has_module")
+sub, truncated = filter_graph(G, "node", ["Course", "Module", "Student"], 2, NodeIndex(G), max_nodes=20)
+print(truncated, sorted(sub))
+"""
+    outputs = set()
+    for seed in ["1", "2", "3"]:
+        env = {**os.environ, "PYTHONHASHSEED": seed, "PYTHONPATH": str(SCRIPTS)}
+        out = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True)
+        assert out.returncode == 0, out.stderr
+        outputs.add(out.stdout)
+    assert len(outputs) == 1 and outputs.pop().startswith("True")
@@ -0,0 +1,41 @@
+import random
+
+import networkx as nx
+import pytest
+
+from dashboard import filter_graph
+from graph_layout import LAYOUTS, LayoutCache, layout_tables, stored_positions
+from graph_store import GraphStore
+
+
+def test_layout_cache_keeps_recent_versions_only():
+    G = nx.DiGraph()
+    G.add_edge("Course", "Module", relation="has_module")
+    nx.set_node_attributes(G, {"Course": "Course", "Module": "Module"}, "type")
+
+    cache = LayoutCache(maxsize=2)
+    first = cache.get(G, "v1")
+    cache.get(G, "v2")
+    assert cache.get(G, "v1") is first          # hit, and now the most recent
+    cache.get(G, "v3")
+    assert list(cache._positions) == [("v1", "Force-Directed"), ("v3", "Force-Directed")]
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_store_serves_full_graph_positions_per_slice(tmp_path, layout):
+    rng = random.Random(1)
+    G = nx.DiGraph()
+    for i in range(120):
+        G.add_node(f"n{i}", type=rng.choice(["Course", "Module", "Student"]))
+    for _ in range(200):
+        u, v = rng.sample(range(120), 2)
+        G.add_edge(f"n{u}", f"n{v}", relation="has_module")
+    store = GraphStore(tmp_path / "graph.sqlite", derived=layout_tables).write(G, "v1")
+    full = LayoutCache().get(G, "v1", layout)
+
+    # the same node sits at the same place in every slice it appears in
+    for keyword in ["n1", "n2", "n"]:
+        sub, _ = filter_graph(store, keyword, ["Course", "Module", "Student"], 1)
+        pos = stored_positions(store, layout, list(sub) + ["missing"])
+        assert set(pos) == set(sub)
+        assert all(pos[n] == pytest.approx(full[n], abs=1e-3) for n in sub)
@@ -0,0 +1,153 @@
+import random
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from graph_builder import DASHBOARD, TABLES, build_graph, build_graph_from_csv
+from graph_updates import GraphUpdater
+
+ROOT = Path(__file__).resolve().parents[1]
+DATA = {
+    "courses": ROOT / "data/output/courses_and_modules.csv",
+    "trainer_skills": ROOT / "data/output/trainer_skills.csv",
+    "students": ROOT / "data/students.csv",
+}
+
+TOPICS = ["Python", "JS", "React.js", "Data Science", "SQL", "Docker", "Terraform", "Cooking"]
+SKILLS = ["Python", "javascript", "React", "data science", "sql", "docker", "terraform", "excel"]
+
+
+def _shape(G):
+    nodes = {n: d.get("type") for n, d in G.nodes(data=True)}
+    edges = {(u, v, d.get("relation")) for u, v, d in G.edges(data=True)}
+    return nodes, edges
+
+
+def _assert_same(G, expected):
+    nodes, edges = _shape(G)
+    want_nodes, want_edges = _shape(expected)
+    assert nodes == want_nodes
+    assert edges == want_edges
+
+
+def _replay(tables):
+    up = GraphUpdater()
+    for kind in ["courses", "trainer_skills", "students"]:
+        up.apply_rows(kind, tables[kind].to_dict("records"))
+    return up.G
+
+
+def test_replaying_repo_csvs_matches_dashboard_build():
+    tables = {k: pd.read_csv(p, dtype=str).fillna("") for k, p in DATA.items()}
+    assert tables["courses"]["course_name"].str.strip().duplicated().any()
+
+    expected = build_graph_from_csv(DATA, DASHBOARD, warn=lambda msg: None)
+    _assert_same(_replay(tables), expected)
+
+
+def test_repeated_course_rows_are_merged():
+    up = GraphUpdater()
+    up.apply_rows("trainer_skills", [{"trainer_name": "T", "skills": "docker"}])
+    up.apply_rows("courses", [
+        {"course_name": "C", "modules": "Python basics"},
+        {"course_name": "C", "modules": "Docker lab"},
+    ])
+    assert set(up.G.successors("C")) == {"Python basics", "Docker lab"}
+    assert up.G.has_edge("T", "C")
+
+    # a later call re-extracts the course
+    up.apply_rows("courses", [{"course_name": "C", "modules": "Python basics"}])
+    assert set(up.G.successors("C")) == {"Python basics"}
+    assert "Docker lab" not in up.G
+    assert not up.G.has_edge("T", "C")
+
+
+def test_deleting_last_enrollment_drops_student():
+    up = GraphUpdater()
+    up.apply_rows("students", [
+        {"student_name": "S", "enrolled": "A"},
+        {"student_name": "S", "enrolled": "B"},
+    ])
+    up.apply_rows("students", [{"student_name": "S", "enrolled": "A", "deleted": True}])
+    assert "S" in up.G
+    up.apply_rows("students", [{"student_name": "S", "enrolled": "B", "deleted": True}])
+    assert "S" not in up.G and "B" not in up.G
+
+
+def test_relevant_to_is_opt_in():
+    rows = [{"course_name": "C", "modules": "Python basics"}]
+    skills = [{"trainer_name": "T", "skills": "python"}]
+
+    up = GraphUpdater()
+    up.apply_rows("trainer_skills", skills)
+    up.apply_rows("courses", rows)
+    assert not up.G.has_edge("python", "Python basics")
+
+    up = GraphUpdater(derive_relevant=True)
+    up.apply_rows("trainer_skills", skills)
+    up.apply_rows("courses", rows)
+    assert up.G.edges["python", "Python basics"]["relation"] == "relevant_to"
+
+
+def _tables(courses, trainers, students):
+    frame = lambda name, rows: pd.DataFrame(rows, columns=TABLES[name])
+    return {
+        "courses": frame("courses", [(c, text) for c, texts in courses.items() for text in texts]),
+        "trainer_skills": frame("trainer_skills", list(trainers.items())),
+        "students": frame("students", sorted(students)),
+    }
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_random_deltas_match_rebuild(seed):
+    rng = random.Random(seed)
+    course_names = [f"Course {i}" for i in range(8)]
+    trainer_names = [f"Trainer {i}" for i in range(6)]
+    student_names = [f"Student {i}" for i in range(10)]
+
+    def module_text():
+        mods = [f"{rng.choice(TOPICS)} {rng.choice(['basics', 'lab', 'project'])}"
+                for _ in range(rng.randint(0, 3))]
+        return ", ".join(mods)
+
+    def course_rows():
+        return [module_text() for _ in range(rng.choice([1, 1, 2]))]
+
+    courses, trainers, students = {}, {}, set()
+    up = GraphUpdater()
+
+    for step in range(60):
+        op = rng.choice(["course", "course", "drop_course", "trainer", "drop_trainer",
+                         "enroll", "enroll", "unenroll"])
+        if op == "course":
+            c = rng.choice(course_names)
+            courses[c] = course_rows()
+            up.apply_rows("courses", [{"course_name": c, "modules": t} for t in courses[c]])
+        elif op == "drop_course" and courses:
+            c = rng.choice(sorted(courses))
+            del courses[c]
+            up.apply_rows("courses", [{"course_name": c, "deleted": True}])
+        elif op == "trainer":
+            t = rng.choice(trainer_names)
+            trainers[t] = ", ".join(rng.sample(SKILLS, rng.randint(0, 3)))
+            up.apply_rows("trainer_skills", [{"trainer_name": t, "skills": trainers[t]}])
+        elif op == "drop_trainer" and trainers:
+            t = rng.choice(sorted(trainers))
+            del trainers[t]
+            up.apply_rows("trainer_skills", [{"trainer_name": t, "deleted": True}])
+        elif op == "enroll":
+            pair = (rng.choice(student_names), rng.choice(course_names))
+            students.add(pair)
+            up.apply_rows("students", [{"student_name": pair[0], "enrolled": pair[1]}])
+        elif op == "unenroll" and students:
+            pair = rng.choice(sorted(students))
+            students.discard(pair)
+            up.apply_rows("students", [{"student_name": pair[0], "enrolled": pair[1], "deleted": True}])
+
+        _assert_same(up.G, build_graph(_tables(courses, trainers, students), DASHBOARD))
+
+    # one bulk replay of the final tables, rows shuffled
+    tables = _tables(courses, trainers, students)
+    tables = {k: df.sample(frac=1, random_state=seed) for k, df in tables.items()}
+    _assert_same(_replay(tables), build_graph(tables, DASHBOARD))
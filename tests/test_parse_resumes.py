@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+
+import extraction_cache
+import parse_resumes
+from extraction_cache import ExtractionCache
+from parse_resumes import process_resumes, process_resumes_streaming
+
+SKILLS = ["python", "docker", "sql", "react", "terraform", "excel"]
+
+
+@pytest.fixture
+def resumes(tmp_path, monkeypatch):
+    """Ten fake resumes; the text layer is faked and counted per file."""
+    folder = tmp_path / "resumes"
+    folder.mkdir()
+    for i in range(10):
+        (folder / f"Profile ({i}) - trainer_{chr(97 + i)}.pdf").write_bytes(f"%PDF {i}".encode())
+
+    calls = []
+
+    def fake_text(pdf):
+        calls.append(pdf.name)
+        i = int(pdf.read_bytes().split()[1])
+        return "\n".join(SKILLS[j % len(SKILLS)] for j in range(i, i + 3))
+
+    monkeypatch.setattr(extraction_cache, "_default_cache", ExtractionCache(tmp_path / "cache"))
+    monkeypatch.setattr(parse_resumes, "_extract_text_uncached", fake_text)
+    return folder, calls
+
+
+def _interrupt_on(monkeypatch, target, n):
+    """Makes the n-th call of parse_resumes.<target> raise KeyboardInterrupt."""
+    real = getattr(parse_resumes, target)
+    seen = []
+
+    def wrapper(*args, **kwargs):
+        seen.append(1)
+        if len(seen) == n:
+            raise KeyboardInterrupt
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(parse_resumes, target, wrapper)
+
+
+@pytest.mark.parametrize("target", ["extract_text", "_write_checkpoint"])
+def test_interrupted_run_resumes_without_lost_or_repeated_rows(resumes, tmp_path, monkeypatch, target):
+    folder, calls = resumes
+    names = sorted(p.name for p in folder.iterdir())
+    out = tmp_path / "stream.csv"
+    progress = tmp_path / "stream.csv.progress"
+
+    # "_write_checkpoint": the 6th row is on disk but the checkpoint never moved past it
+    with monkeypatch.context() as m:
+        _interrupt_on(m, target, 6)
+        with pytest.raises(KeyboardInterrupt):
+            process_resumes_streaming(str(folder), str(out))
+    assert progress.exists()
+
+    calls.clear()
+    assert process_resumes_streaming(str(folder), str(out)) == 5
+    assert not progress.exists()
+    # finished files are skipped; a file whose text was already read comes from the cache
+    assert calls == names[5 if target == "extract_text" else 6:]
+
+    expected = process_resumes(str(folder), str(tmp_path / "batch.csv"))
+    pd.testing.assert_frame_equal(pd.read_csv(out, dtype=str, keep_default_na=False),
+                                  expected.astype(str).reset_index(drop=True))
+
+
+def test_streaming_reuses_the_text_cache(resumes, tmp_path):
+    folder, calls = resumes
+    process_resumes(str(folder), str(tmp_path / "batch.csv"))
+    assert len(calls) == 10
+
+    calls.clear()
+    assert process_resumes_streaming(str(folder), str(tmp_path / "stream.csv")) == 10
+    assert calls == []
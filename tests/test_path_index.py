@@ -0,0 +1,90 @@
+import random
+
+import networkx as nx
+import pytest
+
+from path_index import PathIndex
+
+TYPES = ["Course", "Module", "Skill", "Trainer", "Student"]
+RELATIONS = ["has_module", "skilled_in", "enrolled_in"]
+
+
+def _graph(edges, types=None):
+    G = nx.DiGraph()
+    for u, v in edges:
+        G.add_edge(u, v, relation="skilled_in")
+    nx.set_node_attributes(G, "Skill", "type")
+    nx.set_node_attributes(G, types or {}, "type")
+    return G
+
+
+def test_two_leaves_linked_only_to_each_other():
+    G = _graph([("T", "rust"), ("A", "Course 1"), ("B", "Course 1")], {"Course 1": "Course"})
+    index = PathIndex(G)
+    assert index.distance("T", "rust") == 1
+    assert index.distance("rust", "T") == 1
+    assert index.path("T", "rust") == ["T", "rust"]
+    assert index.k_shortest_paths("rust", "T") == [["rust", "T"]]
+    assert index.distance("T", "Course 1") is None
+
+    D = index.distances(["T", "rust", "A", "nobody"], ["rust", "T", "Course 1"])
+    assert D.loc["T"].tolist() == [1, 0, -1]
+    assert D.loc["rust"].tolist() == [0, 1, -1]
+    assert D.loc["A"].tolist() == [-1, -1, 1]
+    assert D.loc["nobody"].tolist() == [-1, -1, -1]
+
+
+def test_isolated_node():
+    G = _graph([("A", "Course 1")], {"Course 1": "Course"})
+    G.add_node("alone", type="Skill")
+    index = PathIndex(G)
+    assert index.distance("alone", "alone") == 0
+    assert index.distance("A", "alone") is None
+    assert index.paths(["A", "alone"], "alone") == {"alone": ["alone"]}
+
+
+def _random_graph(rng, n):
+    G = nx.DiGraph()
+    for i in range(n):
+        G.add_node(f"n{i}", type=rng.choice(TYPES))
+    # sparse, so there are many leaves, leaf pairs and separate components
+    for _ in range(int(n * rng.uniform(0.6, 1.2))):
+        u, v = rng.sample(range(n), 2)
+        G.add_edge(f"n{u}", f"n{v}", relation=rng.choice(RELATIONS))
+    return G
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_networkx(seed):
+    rng = random.Random(seed)
+    G = _random_graph(rng, 60)
+    relations = None if seed % 2 else ["has_module", "enrolled_in"]
+    U = nx.Graph()
+    U.add_nodes_from(G)
+    U.add_edges_from((u, v) for u, v, d in G.edges(data=True)
+                     if relations is None or d["relation"] in relations)
+
+    index = PathIndex(G, relations=relations)
+    nodes = list(G)
+    targets = rng.sample(nodes, 15)
+    D = index.distances(nodes, targets)
+    for t in targets:
+        truth = nx.single_source_shortest_path_length(U, t)
+        assert D[t].tolist() == [truth.get(s, -1) for s in nodes]
+
+        found = index.paths(nodes, t)
+        assert set(found) == set(truth)
+        for s, path in found.items():
+            assert path[0] == s and path[-1] == t
+            assert len(path) - 1 == truth[s]
+            assert all(U.has_edge(a, b) for a, b in zip(path, path[1:]))
+
+        for s in rng.sample(sorted(truth), min(3, len(truth))):
+            paths = index.k_shortest_paths(s, t, k=3, max_extra=2)
+            expected = []
+            for p in nx.shortest_simple_paths(U, s, t):
+                if len(p) - 1 > truth[s] + 2 or len(expected) == 3:
+                    break
+                expected.append(p)
+            assert [len(p) for p in paths] == [len(p) for p in expected]
+            assert all(len(set(p)) == len(p) for p in paths)
@@ -0,0 +1,113 @@
+import math
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import recommend
+from ingest import explode_list_column
+from recommend import Recommender
+from skill_taxonomy import default_taxonomy
+
+ROOT = Path(__file__).resolve().parents[1]
+COURSES = ROOT / "data/output/courses_and_modules.csv"
+TRAINER_SKILLS = ROOT / "data/output/trainer_skills.csv"
+
+# python, sql, docker: A has python + sql, B python, C docker;
+# course X has two python modules and one sql module, Y one docker, Z one python
+COURSES_DF = pd.DataFrame({
+    "course_name": ["X", "Y", "Z"],
+    "modules": ["Python basics, Python advanced, SQL queries", "Docker lab", "Python intro"],
+})
+SKILLS_DF = pd.DataFrame({"trainer_name": ["A", "B", "C"], "skills": ["Python, SQL", "python", "Docker"]})
+
+
+def _scores(rec):
+    return {(rec.trainers[i], rec.courses[j]): rec.scores[i, j]
+            for i in range(len(rec.trainers)) for j in range(len(rec.courses)) if rec.scores[i, j]}
+
+
+def test_overlap_counts_shared_skills():
+    rec = Recommender.from_frames(COURSES_DF, SKILLS_DF, weighting="overlap")
+    assert rec.skills == ["python", "sql", "docker"]
+    assert _scores(rec) == {("A", "X"): 2, ("A", "Z"): 1, ("B", "X"): 1, ("B", "Z"): 1, ("C", "Y"): 1}
+    # ties keep course order
+    assert rec.teaches() == [["X", "Z"], ["X", "Z"], ["Y"]]
+
+
+def test_tfidf_scores_by_hand():
+    rec = Recommender.from_frames(COURSES_DF, SKILLS_DF)
+    idf_python = math.log(4 / 3) + 1          # in 2 of 3 courses
+    idf_other = math.log(4 / 2) + 1           # sql, docker: in 1 of 3
+    x = [(1 + math.log(2)) * idf_python, idf_other]      # X: two python modules, one sql
+    a = [idf_python, idf_other]
+    norm = lambda v: math.sqrt(sum(c * c for c in v))
+
+    assert _scores(rec) == pytest.approx({
+        ("A", "X"): (x[0] * a[0] + x[1] * a[1]) / (norm(x) * norm(a)),
+        ("A", "Z"): a[0] / norm(a),
+        ("B", "X"): x[0] / norm(x),
+        ("B", "Z"): 1.0,
+        ("C", "Y"): 1.0,
+    })
+    # B's one skill is all of Z but only part of X
+    assert rec.teaches() == [["X", "Z"], ["Z", "X"], ["Y"]]
+
+
+def test_table_ranks_per_trainer_and_per_course():
+    rec = Recommender.from_frames(COURSES_DF, SKILLS_DF)
+    by_trainer = rec.table()
+    assert by_trainer[["trainer_name", "course_name", "rank"]].values.tolist() == [
+        ["A", "X", 1], ["A", "Z", 2], ["B", "Z", 1], ["B", "X", 2], ["C", "Y", 1]]
+    assert by_trainer["skills"].tolist() == ["python, sql", "python", "python", "python", "docker"]
+
+    best = rec.table(top=1, by="course", skills=False)
+    assert best[["course_name", "trainer_name", "rank"]].values.tolist() == [
+        ["X", "A", 1], ["Y", "C", 1], ["Z", "B", 1]]
+    assert "skills" not in best
+
+    assert rec.trainers_for("X")["trainer_name"].tolist() == ["A", "B"]
+    assert rec.courses_for("nobody").empty and rec.trainers_for("nowhere").empty
+
+
+def _old_teaches(courses_df, skills_df):
+    """The any-skill-in-modules rule generate_trainers_csv used before the Recommender."""
+    skilled_in = explode_list_column(skills_df, "trainer_name", "skills", lower=True)
+    skills_by_row = skilled_in.groupby(level=0)["skills"].agg(set)
+    trainers = [skills_by_row.get(i, set()) for i in range(len(skills_df))]
+    matcher = default_taxonomy().linker({sk for sks in trainers for sk in sks})
+    course_skills = [(str(course).strip(), matcher.match_keys(modules))
+                     for course, modules in zip(courses_df["course_name"], courses_df["modules"])]
+    return [list(dict.fromkeys(c for c, found in course_skills if found & sks)) for sks in trainers]
+
+
+def test_teaches_matches_the_any_skill_rule_on_repo_data():
+    courses_df, skills_df = pd.read_csv(COURSES), pd.read_csv(TRAINER_SKILLS)
+    teaches = Recommender.from_frames(courses_df, skills_df).teaches()
+    old = _old_teaches(courses_df, skills_df)
+    assert any(old)
+    # the same courses per trainer; only the order (best first) is new
+    assert [sorted(t) for t in teaches] == [sorted(t) for t in old]
+
+
+def test_cli_writes_table_and_prints_lookups(tmp_path, monkeypatch, capsys):
+    courses, skills, out = tmp_path / "courses.csv", tmp_path / "skills.csv", tmp_path / "out/recs.csv"
+    COURSES_DF.to_csv(courses, index=False)
+    SKILLS_DF.to_csv(skills, index=False)
+    argv = ["recommend.py", "--courses", str(courses), "--skills", str(skills)]
+
+    monkeypatch.setattr(sys, "argv", argv + ["--top", "1", "--by", "course", "--out", str(out)])
+    recommend.main()
+    table = pd.read_csv(out)
+    assert table[["course_name", "trainer_name"]].values.tolist() == [["X", "A"], ["Y", "C"], ["Z", "B"]]
+
+    monkeypatch.setattr(sys, "argv", argv + ["--trainer", "B", "--weighting", "overlap"])
+    recommend.main()
+    printed = capsys.readouterr().out
+    assert "Scored 3 trainers × 3 courses over 3 skills (5 matches)" in printed
+    assert printed.index(" X ") < printed.index(" Z ")
+
+    monkeypatch.setattr(sys, "argv", argv + ["--course", "nowhere"])
+    recommend.main()
+    assert "No matches for 'nowhere'" in capsys.readouterr().out